@@ -0,0 +1,161 @@
+"""Procedural background music synthesized in short buffers on a worker thread"""
+import math
+import queue
+import threading
+import time
+import pygame
+import numpy as np
+
+# Length of each synthesized buffer; longer than the idle frame interval so the channel never runs dry
+BUFFER_SECONDS = 1.0
+# Buffers waiting to be handed to the channel; with the one playing and the one queued on
+# the channel, memory use stays at a few buffers whatever the session length
+QUEUED_BUFFERS = 2
+# A minor progression (Am, F, C, G) as frequencies of the chord tones
+CHORDS = [
+    (220.00, 261.63, 329.63),
+    (174.61, 220.00, 261.63),
+    (261.63, 329.63, 392.00),
+    (196.00, 246.94, 293.66)
+]
+# Tempo range from calm to tense, in beats per minute
+CALM_BPM = 60
+TENSE_BPM = 132
+BEATS_PER_CHORD = 8
+# How fast intensity follows the scene, per second
+INTENSITY_RATE = 0.5
+
+class MusicEngine:
+    """Streams generated music through one mixer channel.
+    
+    The worker thread synthesizes BUFFER_SECONDS of audio at a time with
+    numpy and puts it on a bounded queue, blocking while the queue is full.
+    update() runs on the main thread once a frame; it never waits, only
+    turning a finished buffer into a Sound and queueing it on the channel
+    when the channel has room. Intensity in [0, 1] goes from a slow pad to
+    a driving bass pulse and arpeggio; the worker glides towards it.
+    """
+    
+    def __init__(self, channel, volume=0.7):
+        self.channel = channel
+        self.volume = volume
+        # Set from the main thread, read by the worker
+        self.target_intensity = 0.3
+        self.intensity = 0.3
+        self.sample_rate = pygame.mixer.get_init()[0]
+        self.buffers = queue.Queue(maxsize=QUEUED_BUFFERS)
+        self.playing = []
+        self.beat = 0.0
+        self.sample = 0
+        self.stats = {'synthesized': 0, 'buffers': 0, 'synth_ms': 0.0, 'underruns': 0}
+        self.running = False
+        self.worker = None
+    
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.worker = threading.Thread(target=self.run, name='music', daemon=True)
+        self.worker.start()
+    
+    def stop(self):
+        """Stop the worker and the channel"""
+        if not self.running:
+            return
+        self.running = False
+        self.worker.join()
+        self.channel.stop()
+        self.playing = []
+    
+    def set_intensity(self, intensity):
+        self.target_intensity = max(0.0, min(1.0, intensity))
+    
+    def set_volume(self, volume):
+        self.volume = volume
+        self.channel.set_volume(volume)
+    
+    def run(self):
+        while self.running:
+            started = time.perf_counter()
+            samples = self.synthesize(int(BUFFER_SECONDS * self.sample_rate))
+            self.stats['synth_ms'] += (time.perf_counter() - started) * 1000
+            self.stats['synthesized'] += 1
+            # Time out now and then to notice stop()
+            while self.running:
+                try:
+                    self.buffers.put(samples, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+    
+    def update(self):
+        """Give the channel the next buffer once it has room for one"""
+        if not self.running or self.channel.get_queue() is not None:
+            return
+        try:
+            samples = self.buffers.get_nowait()
+        except queue.Empty:
+            if self.stats['buffers'] and not self.channel.get_busy():
+                self.stats['underruns'] += 1
+            return
+        sound = pygame.sndarray.make_sound(samples)
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+            self.channel.set_volume(self.volume)
+        # Keep the playing and queued Sounds alive; older ones can go
+        self.playing = self.playing[-1:] + [sound]
+        self.stats['buffers'] += 1
+    
+    def synthesize(self, frames):
+        """The next frames of music as an int16 stereo array"""
+        rate = self.sample_rate
+        # Glide towards the scene's intensity over the buffer
+        start = self.intensity
+        step = INTENSITY_RATE * frames / rate
+        end = start + max(-step, min(step, self.target_intensity - start))
+        intensity = np.linspace(start, end, frames, endpoint=False)
+        self.intensity = end
+        
+        t = (self.sample + np.arange(frames)) / rate
+        bpm = CALM_BPM + (TENSE_BPM - CALM_BPM) * intensity
+        beat = self.beat + np.cumsum(bpm / (60.0 * rate))
+        self.beat = float(beat[-1])
+        self.sample += frames
+        
+        chord_index = (beat // BEATS_PER_CHORD).astype(int) % len(CHORDS)
+        chords = np.array(CHORDS)[chord_index]
+        # Each chord swells and fades within its bar, so chord changes don't click
+        bar_position = (beat % BEATS_PER_CHORD) / BEATS_PER_CHORD
+        swell = np.sin(math.pi * bar_position) ** 0.5
+        
+        # Pad: chord tones slightly detuned between the ears
+        left = np.zeros(frames)
+        right = np.zeros(frames)
+        for note in range(chords.shape[1]):
+            frequency = chords[:, note]
+            left += np.sin(2 * math.pi * frequency * 0.998 * t)
+            right += np.sin(2 * math.pi * frequency * 1.002 * t)
+        pad = 0.25 * swell * (1.0 - 0.5 * intensity)
+        left *= pad
+        right *= pad
+        
+        # Bass pulse on every beat, fading in with intensity
+        beat_position = beat % 1.0
+        bass = np.sin(2 * math.pi * chords[:, 0] / 2 * t) * np.exp(-6 * beat_position)
+        bass *= 0.6 * intensity
+        
+        # Sixteenth-note arpeggio over the chord tones once things get tense
+        sixteenth = (beat * 4).astype(int) % chords.shape[1]
+        arpeggio_note = chords[np.arange(frames), sixteenth] * 2
+        arpeggio = np.sin(2 * math.pi * arpeggio_note * t) * np.exp(-12 * ((beat * 4) % 1.0))
+        arpeggio *= 0.3 * np.clip((intensity - 0.4) / 0.6, 0.0, 1.0)
+        
+        stereo = np.stack([left + bass + 0.7 * arpeggio, right + bass + 0.3 * arpeggio], axis=1)
+        return (np.tanh(stereo) * 32767 * 0.3).astype(np.int16)
+    
+    def report(self):
+        synthesized = max(1, self.stats['synthesized'])
+        return (f"Music: intensity {self.intensity:.2f}, {self.stats['synth_ms'] / synthesized:.1f} ms per "
+                f"{BUFFER_SECONDS:g}s buffer, {self.stats['underruns']} underruns")
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""Sound effect voices: a fixed channel pool with priorities, instance limits and panning"""
+import math
+import pygame
+import numpy as np
+from game.constants import *
+
+# Channels the effects may use between them
+VOICES = 8
+# name -> (priority, most copies playing at once); higher priority steals from lower
+SOUND_SPECS = {
+    'success': (3, 1),
+    'dock': (3, 1),
+    'launch': (3, 1),
+    'scan': (2, 2),
+    'beep': (1, 2),
+    'menu_select': (1, 1)
+}
+DEFAULT_SPEC = (1, 1)
+# Distance in pixels at which a positioned sound drops to half volume
+HALF_VOLUME_DISTANCE = SCREEN_WIDTH / 2
+# Quietest a positioned sound gets, so far-off events are still heard
+MIN_VOLUME = 0.25
+
+def spatialize(positions, listener):
+    """Left and right gains for an (n, 2) array of positions around the listener"""
+    offsets = positions - np.asarray(listener, dtype=float)
+    pan = np.clip(offsets[:, 0] / (SCREEN_WIDTH / 2), -1.0, 1.0)
+    distance = np.hypot(offsets[:, 0], offsets[:, 1])
+    volume = np.maximum(MIN_VOLUME, 1.0 / (1.0 + distance / HALF_VOLUME_DISTANCE))
+    # Constant power pan: a sound in the middle is as loud as one at the side
+    angle = (pan + 1.0) * (math.pi / 4)
+    return volume * np.cos(angle), volume * np.sin(angle)
+
+class SfxMixer:
+    """Plays effects through its own channels instead of letting Sound.play pick one.
+    
+    play() only queues a trigger; flush() runs once a frame, merges repeats
+    of a sound queued in the same frame into one voice, pans and attenuates
+    all positioned triggers in one numpy pass, then hands out channels by
+    priority. A sound already at its instance limit restarts its oldest
+    copy; with every channel busy a trigger takes the oldest voice of lower
+    priority, or is dropped if there is none.
+    """
+    
+    def __init__(self, voices=VOICES):
+        self.voice_count = voices
+        self.pending = []
+        self.stats = {'triggers': 0, 'coalesced': 0, 'stolen': 0, 'dropped': 0}
+        self.reset()
+    
+    def reset(self):
+        """Claim the first voice_count channels; call again after the mixer is reopened"""
+        if pygame.mixer.get_num_channels() < self.voice_count:
+            pygame.mixer.set_num_channels(self.voice_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.voice_count)]
+        # channel index -> (sound name, priority, start order) of what was last started on it
+        self.voices = {}
+        self.started = 0
+    
+    def play(self, name, sound, position=None):
+        """Queue a sound for this frame; position is where on screen it comes from"""
+        self.pending.append((name, sound, position))
+        self.stats['triggers'] += 1
+    
+    def flush(self, listener):
+        """Start this frame's queued sounds"""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        
+        gains = np.ones((len(pending), 2))
+        positioned = [i for i, (_, _, position) in enumerate(pending) if position is not None]
+        if positioned:
+            left, right = spatialize(np.array([pending[i][2] for i in positioned], dtype=float), listener)
+            gains[positioned, 0] = left
+            gains[positioned, 1] = right
+        
+        # One voice per sound per frame, at the loudest of its triggers
+        triggers = {}
+        for (name, sound, _), gain in zip(pending, gains):
+            if name in triggers:
+                self.stats['coalesced'] += 1
+                if gain.sum() <= triggers[name][1].sum():
+                    continue
+            triggers[name] = (sound, gain)
+        
+        for name in sorted(triggers, key=lambda name: -SOUND_SPECS.get(name, DEFAULT_SPEC)[0]):
+            sound, (left, right) = triggers[name]
+            index = self.choose_channel(name)
+            if index is None:
+                self.stats['dropped'] += 1
+                continue
+            channel = self.channels[index]
+            channel.play(sound)
+            # Playing resets the channel's volume, so pan afterwards
+            channel.set_volume(float(left), float(right))
+            self.started += 1
+            self.voices[index] = (name, SOUND_SPECS.get(name, DEFAULT_SPEC)[0], self.started)
+    
+    def choose_channel(self, name):
+        """Channel index for a new voice of a sound, or None to drop it"""
+        priority, max_instances = SOUND_SPECS.get(name, DEFAULT_SPEC)
+        busy = {index: voice for index, voice in self.voices.items() if self.channels[index].get_busy()}
+        
+        same = [index for index, voice in busy.items() if voice[0] == name]
+        if len(same) >= max_instances:
+            return min(same, key=lambda index: busy[index][2])
+        
+        for index in range(self.voice_count):
+            if index not in busy:
+                return index
+        
+        lower = [index for index, voice in busy.items() if voice[1] < priority]
+        if not lower:
+            return None
+        self.stats['stolen'] += 1
+        return min(lower, key=lambda index: (busy[index][1], busy[index][2]))
+    
+    def stop(self):
+        """Silence every voice and forget queued triggers"""
+        self.pending = []
+        for channel in self.channels:
+            channel.stop()
+    
+    def report(self):
+        playing = sum(1 for channel in self.channels if channel.get_busy())
+        return (f"SFX: {playing}/{self.voice_count} voices, {self.stats['triggers']} triggers, "
+                f"{self.stats['coalesced']} merged, {self.stats['stolen']} stolen, {self.stats['dropped']} dropped")
\ No newline at end of file
@@ -2,157 +2,175 @@
 import pygame
 import math
 import numpy as np
+from game.constants import *
+from game.audio.sfx_mixer import SfxMixer, VOICES
+from game.audio.music import MusicEngine
+from game.utils.asset_cache import get_asset_cache
+
+# Music gets the channel after the effect voices
+MUSIC_CHANNEL = VOICES
 
 class SoundManager:
-    def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+    def __init__(self, sample_rate=22050, buffer=512):
+        pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=buffer)
+        self.mixer_settings = (sample_rate, buffer)
         self.sounds = {}
         self.music_volume = 0.7
         self.sfx_volume = 0.8
+        pygame.mixer.set_num_channels(VOICES + 1)
+        self.mixer = SfxMixer()
+        self.music = MusicEngine(pygame.mixer.Channel(MUSIC_CHANNEL), self.music_volume)
+        # Where positioned sounds are heard from; the game scene keeps it on the player
+        self.listener = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.generate_sounds()
+    
+    def reinit(self, sample_rate, buffer):
+        """Restart the mixer with a new sample rate or buffer size"""
+        if (sample_rate, buffer) == self.mixer_settings:
+            return
+        music_on = self.music.running
+        self.music.stop()
+        pygame.mixer.quit()
+        pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=buffer)
+        self.mixer_settings = (sample_rate, buffer)
+        pygame.mixer.set_num_channels(VOICES + 1)
+        self.mixer.reset()
         self.generate_sounds()
+        # The music is synthesized for one sample rate, so start a new stream
+        intensity = self.music.target_intensity
+        self.music = MusicEngine(pygame.mixer.Channel(MUSIC_CHANNEL), self.music_volume)
+        self.music.set_intensity(intensity)
+        if music_on:
+            self.music.start()
     
     def generate_sounds(self):
         """Generate procedural sound effects"""
+        # Build at the rate the mixer actually opened with, or pitch and length come out wrong
+        self.sample_rate = pygame.mixer.get_init()[0]
         # Create basic sound effects using pygame
-        self.sounds['beep'] = self.generate_beep(440, 0.1)
-        self.sounds['launch'] = self.generate_rocket_sound()
-        self.sounds['scan'] = self.generate_scan_sound()
-        self.sounds['success'] = self.generate_success_sound()
-        self.sounds['menu_select'] = self.generate_beep(880, 0.05)
-        self.sounds['dock'] = self.generate_dock_sound()
+        self.sounds['beep'] = self.load_sound('beep', self.generate_beep, 440, 0.1)
+        self.sounds['launch'] = self.load_sound('launch', self.generate_rocket_sound)
+        self.sounds['scan'] = self.load_sound('scan', self.generate_scan_sound)
+        self.sounds['success'] = self.load_sound('success', self.generate_success_sound)
+        self.sounds['menu_select'] = self.load_sound('menu_select', self.generate_beep, 880, 0.05)
+        self.sounds['dock'] = self.load_sound('dock', self.generate_dock_sound)
+        for sound in self.sounds.values():
+            sound.set_volume(self.sfx_volume)
+    
+    def load_sound(self, name, generate, *args):
+        """A Sound from the baked asset cache, generating and storing its samples on a miss"""
+        assets = get_asset_cache()
+        if assets is None:
+            samples = generate(*args)
+        else:
+            samples = assets.sound(name, self.sample_rate, generate, *args)
+        return pygame.sndarray.make_sound(samples)
+    
+    def sample_times(self, duration):
+        """Sample indices and their times in seconds for a sound of the given length"""
+        frames = int(duration * self.sample_rate)
+        index = np.arange(frames)
+        return index, index / self.sample_rate
+    
+    @staticmethod
+    def to_stereo(wave):
+        """int16 stereo samples, truncated towards zero like int(), from a mono wave in [-32767, 32767]"""
+        samples = wave.astype(np.int16)
+        return np.column_stack((samples, samples))
     
     def generate_beep(self, frequency, duration):
-        """Generate a simple beep sound"""
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = []
-        
-        for i in range(frames):
-            time = float(i) / sample_rate
-            wave = math.sin(2 * math.pi * frequency * time)
-            # Apply envelope to avoid clicks
-            envelope = min(1.0, min(i / (frames * 0.1), (frames - i) / (frames * 0.1)))
-            arr.append([int(wave * envelope * 32767 * 0.3), int(wave * envelope * 32767 * 0.3)])
-        
-        sound = pygame.sndarray.make_sound(np.array(arr, dtype=np.int16))
-        return sound
+        """Samples for a simple beep"""
+        index, time = self.sample_times(duration)
+        frames = len(index)
+        wave = np.sin(2 * math.pi * frequency * time)
+        # Apply envelope to avoid clicks
+        envelope = np.minimum(1.0, np.minimum(index / (frames * 0.1), (frames - index) / (frames * 0.1)))
+        return self.to_stereo(wave * envelope * 32767 * 0.3)
     
     def generate_rocket_sound(self):
-        """Generate rocket launch sound effect"""
-        sample_rate = 22050
-        duration = 2.0
-        frames = int(duration * sample_rate)
-        arr = []
+        """Samples for the rocket launch sound effect"""
+        index, time = self.sample_times(2.0)
+        # Low frequency rumble with some noise
+        base_freq = 60 + time * 20
+        noise = (index % 1000 - 500) / 10000.0
+        wave = np.sin(2 * math.pi * base_freq * time) * 0.3 + noise * 0.2
         
-        for i in range(frames):
-            time = float(i) / sample_rate
-            # Low frequency rumble with some noise
-            base_freq = 60 + time * 20
-            noise = (hash(i) % 1000 - 500) / 10000.0
-            wave = math.sin(2 * math.pi * base_freq * time) * 0.3 + noise * 0.2
-            
-            # Fade in effect
-            envelope = min(1.0, time / 0.5)
-            arr.append([int(wave * envelope * 32767 * 0.4), int(wave * envelope * 32767 * 0.4)])
-        
-        sound = pygame.sndarray.make_sound(np.array(arr, dtype=np.int16))
-        return sound
+        # Fade in effect
+        envelope = np.minimum(1.0, time / 0.5)
+        return self.to_stereo(wave * envelope * 32767 * 0.4)
     
     def generate_scan_sound(self):
-        """Generate scanning sound effect"""
-        sample_rate = 22050
+        """Samples for the scanning sound effect"""
         duration = 0.8
-        frames = int(duration * sample_rate)
-        arr = []
-        
-        for i in range(frames):
-            time = float(i) / sample_rate
-            # Sweeping frequency
-            freq = 200 + math.sin(time * 8) * 100
-            wave = math.sin(2 * math.pi * freq * time)
-            
-            # Pulse envelope
-            pulse = (math.sin(time * 20) + 1) / 2
-            envelope = max(0, 1 - time / duration)
-            
-            arr.append([int(wave * pulse * envelope * 32767 * 0.2), 
-                       int(wave * pulse * envelope * 32767 * 0.2)])
+        _, time = self.sample_times(duration)
+        # Sweeping frequency
+        freq = 200 + np.sin(time * 8) * 100
+        wave = np.sin(2 * math.pi * freq * time)
         
-        sound = pygame.sndarray.make_sound(np.array(arr, dtype=np.int16))
-        return sound
+        # Pulse envelope
+        pulse = (np.sin(time * 20) + 1) / 2
+        envelope = np.maximum(0, 1 - time / duration)
+        return self.to_stereo(wave * pulse * envelope * 32767 * 0.2)
     
     def generate_success_sound(self):
-        """Generate success/achievement sound"""
-        sample_rate = 22050
-        duration = 1.0
-        frames = int(duration * sample_rate)
-        arr = []
+        """Samples for the success/achievement sound"""
+        index, time = self.sample_times(1.0)
+        wave = np.zeros(len(index))
         
         # Ascending chord progression
         frequencies = [261.63, 329.63, 392.00, 523.25]  # C, E, G, C
         
-        for i in range(frames):
-            time = float(i) / sample_rate
-            wave = 0
-            
-            for j, freq in enumerate(frequencies):
-                note_start = j * 0.2
-                if time >= note_start:
-                    note_time = time - note_start
-                    note_wave = math.sin(2 * math.pi * freq * note_time)
-                    note_envelope = max(0, 1 - note_time / 0.4)
-                    wave += note_wave * note_envelope * 0.25
-            
-            arr.append([int(wave * 32767 * 0.3), int(wave * 32767 * 0.3)])
+        for j, freq in enumerate(frequencies):
+            note_start = j * 0.2
+            note_time = time - note_start
+            note_wave = np.sin(2 * math.pi * freq * note_time)
+            note_envelope = np.maximum(0, 1 - note_time / 0.4)
+            wave += np.where(time >= note_start, note_wave * note_envelope * 0.25, 0.0)
         
-        sound = pygame.sndarray.make_sound(np.array(arr, dtype=np.int16))
-        return sound
+        return self.to_stereo(wave * 32767 * 0.3)
     
     def generate_dock_sound(self):
-        """Generate docking sound effect"""
-        sample_rate = 22050
-        duration = 1.5
-        frames = int(duration * sample_rate)
-        arr = []
+        """Samples for the docking sound effect"""
+        _, time = self.sample_times(1.5)
         
-        for i in range(frames):
-            time = float(i) / sample_rate
-            
-            # Mechanical docking sound
-            if time < 0.5:
-                # Approach phase
-                freq = 150 + time * 50
-                wave = math.sin(2 * math.pi * freq * time) * 0.3
-            elif time < 1.0:
-                # Contact phase
-                freq = 200
-                wave = math.sin(2 * math.pi * freq * time) * 0.4
-                # Add some mechanical noise
-                if int(time * 20) % 2:
-                    wave += 0.1
-            else:
-                # Lock phase
-                freq = 300
-                wave = math.sin(2 * math.pi * freq * time) * 0.2
-            
-            envelope = max(0, 1 - (time - 0.5) / 1.0) if time > 0.5 else 1
-            arr.append([int(wave * envelope * 32767 * 0.3), int(wave * envelope * 32767 * 0.3)])
+        # Mechanical docking sound: approach, contact with some mechanical noise, then lock
+        approach = np.sin(2 * math.pi * (150 + time * 50) * time) * 0.3
+        contact = np.sin(2 * math.pi * 200 * time) * 0.4 + np.where((time * 20).astype(int) % 2, 0.1, 0.0)
+        lock = np.sin(2 * math.pi * 300 * time) * 0.2
+        wave = np.select([time < 0.5, time < 1.0], [approach, contact], lock)
         
-        sound = pygame.sndarray.make_sound(np.array(arr, dtype=np.int16))
-        return sound
+        envelope = np.where(time > 0.5, np.maximum(0, 1 - (time - 0.5) / 1.0), 1.0)
+        return self.to_stereo(wave * envelope * 32767 * 0.3)
     
-    def play_sound(self, sound_name):
-        """Play a sound effect"""
+    def play_sound(self, sound_name, position=None):
+        """Play a sound effect, panned from position if given; it starts at the end of the frame"""
         if sound_name in self.sounds:
-            sound = self.sounds[sound_name]
-            sound.set_volume(self.sfx_volume)
-            sound.play()
+            self.mixer.play(sound_name, self.sounds[sound_name], position)
+    
+    def update(self):
+        """Start the sounds triggered this frame and keep the music fed"""
+        self.mixer.flush(self.listener)
+        self.music.update()
+    
+    def start_music(self):
+        """Start the background music stream"""
+        self.music.start()
+    
+    def set_music_intensity(self, intensity):
+        """How tense the music should be, from 0 (calm) to 1"""
+        self.music.set_intensity(intensity)
+    
+    def shutdown(self):
+        """Stop the music thread"""
+        self.music.stop()
     
     def set_sfx_volume(self, volume):
         """Set sound effects volume (0.0 to 1.0)"""
         self.sfx_volume = max(0.0, min(1.0, volume))
+        for sound in self.sounds.values():
+            sound.set_volume(self.sfx_volume)
     
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
\ No newline at end of file
+        self.music.set_volume(self.music_volume)
\ No newline at end of file
@@ -1,8 +1,10 @@
 """Game constants for Flokapp"""
+import os as _os
 
-# Screen dimensions
+# Size the game draws at; the window is scaled to the resolution in the settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
+# Default frame rate cap, also used to pace replays
 FPS = 60
 
 # Colors (retro space theme)
@@ -36,4 +38,10 @@ GAME_OVER = 'game_over'
 EXPLORATION = 'exploration'
 RESEARCH = 'research'
 COLLABORATION = 'collaboration'
-PROBLEM_SOLVING = 'problem_solving'
\ No newline at end of file
+PROBLEM_SOLVING = 'problem_solving'
+
+# Seconds between background autosaves
+AUTOSAVE_INTERVAL = 5.0
+
+# Player data directory (learning progress, saves, settings)
+DATA_DIR = _os.getenv('FLOKAPP_DATA_DIR', _os.path.join(_os.path.expanduser('~'), '.flokapp'))
@@ -0,0 +1,52 @@
+"""Achievement definitions
+
+Requirements are compiled by the achievement engine. A requirement is one or
+more clauses joined with 'and' / 'or' ('and' binds tighter). A clause compares
+a player stat with a number, e.g. 'planets_visited >= 4', or the amount a stat
+grew over the last N seconds of play, e.g. 'gain(knowledge_points, 60) >= 200'.
+"""
+
+ACHIEVEMENTS = [
+    {
+        'name': 'First Steps',
+        'description': 'Complete your first mission',
+        'icon': '🚀',
+        'requirement': 'missions_completed >= 1'
+    },
+    {
+        'name': 'Space Explorer',
+        'description': 'Visit all planets in the solar system',
+        'icon': '🌍',
+        'requirement': 'planets_visited >= 4'
+    },
+    {
+        'name': 'Knowledge Seeker',
+        'description': 'Earn 500 knowledge points',
+        'icon': '🧠',
+        'requirement': 'knowledge_points >= 500'
+    },
+    {
+        'name': 'Asteroid Miner',
+        'description': 'Scan 10 asteroids',
+        'icon': '⛏️',
+        'requirement': 'asteroids_scanned >= 10'
+    },
+    {
+        'name': 'International Collaborator',
+        'description': 'Dock with the International Space Station',
+        'icon': '🤝',
+        'requirement': 'iss_docked >= 1'
+    },
+    {
+        'name': 'Field Scientist',
+        'description': 'Visit 2 planets and scan 3 asteroids',
+        'icon': '🔭',
+        'requirement': 'planets_visited >= 2 and asteroids_scanned >= 3'
+    },
+    {
+        'name': 'Quick Learner',
+        'description': 'Earn 200 knowledge points within one minute',
+        'icon': '⚡',
+        'requirement': 'gain(knowledge_points, 60) >= 200'
+    }
+]
@@ -0,0 +1,190 @@
+"""Shared store for facts, planet data and question banks"""
+import glob
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+
+from game.data import nasa_facts
+
+# Extra content packs (JSON) dropped here are loaded on top of the built-in data
+CONTENT_DIR = os.getenv('FLOKAPP_CONTENT_DIR',
+                        os.path.join(os.path.dirname(__file__), 'content'))
+CHALLENGES = 'challenges'
+
+
+class ContentStore:
+    """Educational content loaded once and indexed for lookup, sampling and search.
+
+    Lookups and random sampling go through in-memory dicts and lists; full-text
+    search goes through an SQLite FTS5 table (or LIKE if FTS5 is unavailable).
+    """
+
+    def __init__(self, db_path=':memory:'):
+        self.facts = []
+        self.facts_by_category = {}
+        self.planet_summaries = {}
+        self.planet_info = {}
+        self.questions_by_mission = {}
+        self.questions_by_id = {}
+
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        try:
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS content "
+                "USING fts5(body, kind UNINDEXED, category UNINDEXED, ref UNINDEXED)"
+            )
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS content (body TEXT, kind TEXT, category TEXT, ref TEXT)"
+            )
+            self.has_fts = False
+        self.pending_rows = []
+
+    def load_builtin(self):
+        """Load the content that ships with the game"""
+        for category, facts in nasa_facts.PLANET_FACTS.items():
+            self.add_facts(category, facts)
+        for category, facts in nasa_facts.MISSION_FACTS.items():
+            self.add_facts(category, facts)
+        self.add_facts(CHALLENGES, nasa_facts.SPACE_CHALLENGES)
+
+        for name, summary in nasa_facts.PLANET_SUMMARIES.items():
+            self.add_planet(name, summary=summary)
+        for name, info in nasa_facts.PLANET_INFO.items():
+            self.add_planet(name, info=info)
+
+        for mission_type, questions in nasa_facts.MISSION_QUESTIONS.items():
+            for question in questions:
+                self.add_question(mission_type, question)
+        self.commit()
+
+    def load_json(self, path):
+        """Load a content pack with optional 'facts', 'planets' and 'questions' sections"""
+        with open(path, encoding='utf-8') as f:
+            pack = json.load(f)
+        for category, facts in pack.get('facts', {}).items():
+            self.add_facts(category, facts)
+        for name, planet in pack.get('planets', {}).items():
+            self.add_planet(name, summary=planet.get('summary'), info=planet.get('info'))
+        for mission_type, questions in pack.get('questions', {}).items():
+            for question in questions:
+                self.add_question(mission_type, question)
+        self.commit()
+
+    def load_content_dir(self, directory=CONTENT_DIR):
+        """Load every JSON content pack in a directory"""
+        for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+            self.load_json(path)
+
+    def add_facts(self, category, facts):
+        """Add facts under a category (a planet name, mission type or 'challenges')"""
+        bucket = self.facts_by_category.setdefault(category, [])
+        for fact in facts:
+            bucket.append(fact)
+            self.facts.append(fact)
+            self.pending_rows.append((fact, 'fact', category, ''))
+
+    def add_planet(self, name, summary=None, info=None):
+        """Add or extend planet data"""
+        if summary:
+            self.planet_summaries[name] = summary
+            self.pending_rows.append((summary, 'planet', name, ''))
+        if info:
+            self.planet_info[name] = info
+            self.pending_rows.append((' '.join(str(v) for v in info.values()), 'planet', name, ''))
+
+    def add_question(self, mission_type, question):
+        """Add a question to a mission type's bank; questions without an id get one
+
+        Generated ids hash the question text so they stay the same however packs
+        are ordered, since scheduler state saved with the player is keyed by them.
+        """
+        bank = self.questions_by_mission.setdefault(mission_type, [])
+        question = dict(question)
+        if 'id' not in question:
+            digest = hashlib.sha1(question['question'].encode('utf-8')).hexdigest()[:12]
+            question['id'] = f"{mission_type}-{digest}"
+        bank.append(question)
+        self.questions_by_id[question['id']] = question
+        body = question['question'] + ' ' + question.get('explanation', '')
+        self.pending_rows.append((body, 'question', mission_type, question['id']))
+
+    def commit(self):
+        """Write pending rows to the search index in one batch"""
+        if not self.pending_rows:
+            return
+        with self.lock:
+            self.connection.executemany(
+                "INSERT INTO content (body, kind, category, ref) VALUES (?, ?, ?, ?)",
+                self.pending_rows
+            )
+            self.connection.commit()
+        self.pending_rows = []
+
+    def random_fact(self, category=None, rng=None):
+        """Pick a random fact from a category, or from everything if it is unknown"""
+        rng = rng or random
+        facts = self.facts_by_category.get(category) if category else None
+        return rng.choice(facts or self.facts)
+
+    def get_planet_summary(self, name):
+        """Get the one-line summary for a planet"""
+        return self.planet_summaries.get(name)
+
+    def get_planet_info(self, name):
+        """Get detailed data for a planet"""
+        return self.planet_info.get(name, {})
+
+    def get_questions(self, mission_type):
+        """Get the question bank for a mission type"""
+        return self.questions_by_mission.get(mission_type, [])
+
+    def get_question(self, question_id):
+        """Get a question by id"""
+        return self.questions_by_id.get(question_id)
+
+    def search(self, text, kind=None, limit=10):
+        """Full-text search; returns dicts with body, kind, category and ref"""
+        terms = [t.replace('"', '') for t in text.split()]
+        terms = [t for t in terms if t]
+        if not terms:
+            return []
+
+        if self.has_fts:
+            query = "SELECT body, kind, category, ref FROM content WHERE content MATCH ?"
+            params = [' '.join(f'"{t}"' for t in terms)]
+        else:
+            query = "SELECT body, kind, category, ref FROM content WHERE " + \
+                    " AND ".join("body LIKE ?" for _ in terms)
+            params = [f"%{t}%" for t in terms]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY rank LIMIT ?" if self.has_fts else " LIMIT ?"
+        params.append(limit)
+
+        with self.lock:
+            rows = self.connection.execute(query, params).fetchall()
+        return [{'body': r[0], 'kind': r[1], 'category': r[2], 'ref': r[3]} for r in rows]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_content_store():
+    """Get the shared content store, loading it on first use"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = ContentStore()
+                store.load_builtin()
+                store.load_content_dir()
+                _store = store
+    return _store
@@ -44,15 +44,16 @@ class NASAAPI:
             return []
 
     @staticmethod
-    def get_space_weather():
-        """Get space weather data from DONKI"""
-        url = f"{BASE_URL}/DONKI/CME?startDate=2024-01-01&endDate=2024-01-31&api_key={API_KEY}"
+    def get_space_weather(start_date='2024-01-01', end_date='2024-01-31'):
+        """Get coronal mass ejection events from DONKI, or None if the request failed"""
+        url = f"{BASE_URL}/DONKI/CME?startDate={start_date}&endDate={end_date}&api_key={API_KEY}"
         try:
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException:
-            return []
+            # A window without CMEs can come back as an empty body
+            return response.json() if response.content.strip() else []
+        except (requests.RequestException, ValueError):
+            return None
 
     @staticmethod
     def get_near_earth_objects(start_date='2024-01-01', end_date='2024-01-07'):
@@ -69,19 +69,109 @@ SPACE_CHALLENGES = [
     "Spacecraft must be designed to work perfectly for years without maintenance."
 ]
 
-def get_random_fact(category=None):
+# One-line summaries shown when a planet is first explored
+PLANET_SUMMARIES = {
+    'Earth': 'Our home planet, 71% covered by water',
+    'Mars': 'The Red Planet, potential for human colonization',
+    'Moon': 'Earth\'s natural satellite, first human landing 1969',
+    'Jupiter': 'Largest planet, has over 80 moons'
+}
+
+# Detailed data shown in the solar system explorer
+PLANET_INFO = {
+    'Mercury': {
+        'distance_from_sun': '58 million km',
+        'day_length': '59 Earth days',
+        'temperature': '-173°C to 427°C',
+        'interesting_fact': 'Mercury has no atmosphere and extreme temperature variations.'
+    },
+    'Venus': {
+        'distance_from_sun': '108 million km', 
+        'day_length': '243 Earth days',
+        'temperature': '462°C (hottest planet)',
+        'interesting_fact': 'Venus rotates backwards and has a thick, toxic atmosphere.'
+    },
+    'Earth': {
+        'distance_from_sun': '150 million km',
+        'day_length': '24 hours',
+        'temperature': '-89°C to 58°C',
+        'interesting_fact': 'The only known planet with life, protected by a magnetic field.'
+    },
+    'Mars': {
+        'distance_from_sun': '228 million km',
+        'day_length': '24.6 hours', 
+        'temperature': '-87°C to -5°C',
+        'interesting_fact': 'Mars has the largest volcano and canyon in the solar system.'
+    },
+    'Jupiter': {
+        'distance_from_sun': '778 million km',
+        'day_length': '9.9 hours',
+        'temperature': '-108°C',
+        'interesting_fact': 'Jupiter is a gas giant with over 80 moons and protects inner planets.'
+    },
+    'Saturn': {
+        'distance_from_sun': '1.4 billion km',
+        'day_length': '10.7 hours',
+        'temperature': '-139°C', 
+        'interesting_fact': 'Saturn has spectacular rings made of ice and rock particles.'
+    }
+}
+
+# Mission question bank, keyed by mission type
+MISSION_QUESTIONS = {
+    'exploration': [
+        {
+            'id': 'exploration-mars-distance',
+            'question': 'What is the average distance from Earth to Mars?',
+            'options': ['225 million km', '54.6 million km', '401 million km', '150 million km'],
+            'correct': 0,
+            'explanation': 'Mars is on average 225 million km from Earth, but this varies greatly due to orbital mechanics.'
+        },
+        {
+            'id': 'exploration-first-rover',
+            'question': 'Which rover was the first to successfully land on Mars?',
+            'options': ['Curiosity', 'Sojourner', 'Opportunity', 'Perseverance'],
+            'correct': 1,
+            'explanation': 'Sojourner was part of the Mars Pathfinder mission in 1997, the first successful rover on Mars.'
+        }
+    ],
+    'research': [
+        {
+            'id': 'research-exoplanet-methods',
+            'question': 'What method do we use to detect exoplanets?',
+            'options': ['Direct imaging', 'Transit method', 'Radial velocity', 'All of the above'],
+            'correct': 3,
+            'explanation': 'Scientists use multiple methods including transit photometry, radial velocity, and direct imaging.'
+        },
+        {
+            'id': 'research-habitable-zone',
+            'question': 'What is the habitable zone around a star?',
+            'options': ['Where life exists', 'Where water can be liquid', 'The asteroid belt', 'The magnetic field'],
+            'correct': 1,
+            'explanation': 'The habitable zone is where temperatures allow liquid water to exist on a planet\'s surface.'
+        }
+    ],
+    'collaboration': [
+        {
+            'id': 'collaboration-iss-countries',
+            'question': 'How many countries participate in the ISS program?',
+            'options': ['5', '15', '25', '50'],
+            'correct': 1,
+            'explanation': 'The ISS is a collaboration between 15 countries including USA, Russia, Japan, Canada, and 11 European nations.'
+        }
+    ],
+    'problem_solving': [
+        {
+            'id': 'problem-solving-asteroid-threat',
+            'question': 'What is the main threat from near-Earth asteroids?',
+            'options': ['Radiation', 'Impact collision', 'Gravitational pull', 'Magnetic interference'],
+            'correct': 1,
+            'explanation': 'The primary concern is potential impact with Earth, which could cause significant damage.'
+        }
+    ]
+}
+
+def get_random_fact(category=None, rng=None):
     """Get a random educational fact"""
-    import random
-    
-    if category and category in PLANET_FACTS:
-        return random.choice(PLANET_FACTS[category])
-    elif category and category in MISSION_FACTS:
-        return random.choice(MISSION_FACTS[category])
-    else:
-        all_facts = []
-        for facts_list in PLANET_FACTS.values():
-            all_facts.extend(facts_list)
-        for facts_list in MISSION_FACTS.values():
-            all_facts.extend(facts_list)
-        all_facts.extend(SPACE_CHALLENGES)
-        return random.choice(all_facts)
\ No newline at end of file
+    from game.data.content_store import get_content_store
+    return get_content_store().random_fact(category, rng)
\ No newline at end of file
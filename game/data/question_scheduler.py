@@ -0,0 +1,143 @@
+"""Spaced-repetition scheduling of mission questions per player"""
+import heapq
+import itertools
+import json
+import os
+import re
+import time
+
+from game.constants import DATA_DIR
+
+# Review intervals in seconds; a session is minutes long, so the first steps are short
+FIRST_INTERVAL = 30
+SECOND_INTERVAL = 300
+LAPSE_INTERVAL = 10
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+MAX_EASE = 3.0
+
+# Indices into a question's recall state list
+EASE, INTERVAL, REPS, DUE, LAPSES = range(5)
+
+
+class QuestionScheduler:
+    """Tracks one player's recall state per question and serves the next due one.
+
+    Each deck (usually a mission type) keeps a heap of (due, seq, question_id).
+    Regrading pushes a fresh entry and leaves the old one behind; stale entries
+    are dropped when they reach the top, so picking and grading are O(log n).
+    """
+
+    def __init__(self, profile='Space Explorer', directory=None, clock=time.time, persistent=True):
+        self.profile = profile
+        self.directory = directory or os.path.join(DATA_DIR, 'learning')
+        self.clock = clock
+        self.persistent = persistent
+        self.states = {}
+        self.decks = {}
+        self.deck_membership = {}
+        self.counter = itertools.count()
+        self.dirty = False
+        self.load()
+
+    @property
+    def path(self):
+        slug = re.sub(r'[^A-Za-z0-9_-]+', '_', self.profile).strip('_') or 'player'
+        return os.path.join(self.directory, f"{slug}.json")
+
+    def load(self):
+        """Load this profile's recall state, if it has any"""
+        if not self.persistent:
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.states = {qid: list(state) for qid, state in data.get('states', {}).items()}
+
+    def save(self):
+        """Write recall state atomically; does nothing if unchanged"""
+        if not self.dirty or not self.persistent:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'profile': self.profile, 'states': self.states}, f,
+                      separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def switch_profile(self, profile):
+        """Save the current profile and load another one"""
+        if profile == self.profile:
+            return
+        self.save()
+        self.profile = profile
+        self.states = {}
+        self.load()
+        # Rebuild the deck heaps against the new profile's due times
+        decks = {name: [entry[2] for entry in heap] for name, heap in self.decks.items()}
+        self.decks = {}
+        self.deck_membership = {}
+        for name, question_ids in decks.items():
+            self.add_deck(name, set(question_ids))
+
+    def due_time(self, question_id):
+        """Get when a question is next due; unseen questions are due immediately"""
+        state = self.states.get(question_id)
+        return state[DUE] if state else 0.0
+
+    def add_deck(self, name, question_ids):
+        """Register a deck of question ids; re-adding a deck adds only new ids"""
+        heap = self.decks.setdefault(name, [])
+        for question_id in question_ids:
+            decks = self.deck_membership.setdefault(question_id, set())
+            if name in decks:
+                continue
+            decks.add(name)
+            heap.append((self.due_time(question_id), next(self.counter), question_id))
+        heapq.heapify(heap)
+        return name
+
+    def next_question(self, deck):
+        """Return the id of the question due soonest in a deck, or None.
+
+        If nothing is due yet the earliest upcoming question is returned, so the
+        player always has something to answer.
+        """
+        heap = self.decks.get(deck)
+        while heap:
+            due, _, question_id = heap[0]
+            if due == self.due_time(question_id):
+                return question_id
+            heapq.heappop(heap)  # superseded by a later grade
+        return None
+
+    def grade(self, question_id, correct, now=None):
+        """Update recall state after an answer and reschedule the question"""
+        now = self.clock() if now is None else now
+        state = self.states.get(question_id)
+        if state is None:
+            state = [DEFAULT_EASE, 0, 0, 0.0, 0]
+            self.states[question_id] = state
+
+        if correct:
+            state[REPS] += 1
+            if state[REPS] == 1:
+                state[INTERVAL] = FIRST_INTERVAL
+            elif state[REPS] == 2:
+                state[INTERVAL] = SECOND_INTERVAL
+            else:
+                state[INTERVAL] = int(state[INTERVAL] * state[EASE])
+            state[EASE] = min(MAX_EASE, state[EASE] + 0.1)
+        else:
+            state[REPS] = 0
+            state[LAPSES] += 1
+            state[INTERVAL] = LAPSE_INTERVAL
+            state[EASE] = max(MIN_EASE, state[EASE] - 0.2)
+        state[DUE] = now + state[INTERVAL]
+        self.dirty = True
+
+        for deck in self.deck_membership.get(question_id, ()):
+            heapq.heappush(self.decks[deck], (state[DUE], next(self.counter), question_id))
@@ -0,0 +1,147 @@
+"""Space weather timeline built from NASA DONKI coronal mass ejection data"""
+import bisect
+import calendar
+import heapq
+import threading
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+from game.data.nasa_api import NASAAPI
+
+# One astronomical unit in km, used to estimate arrival when DONKI has no model run
+AU_KM = 149597870.7
+DEFAULT_CME_SPEED = 500.0  # km/s, typical slow CME
+
+CMEEvent = namedtuple('CMEEvent', ['activity_id', 'start', 'arrival', 'speed', 'note'])
+
+
+def parse_donki_time(value):
+    """Convert a DONKI timestamp like '2024-01-03T14:09Z' to epoch seconds"""
+    if not value:
+        return None
+    value = value.rstrip('Z')
+    fmt = '%Y-%m-%dT%H:%M:%S' if value.count(':') == 2 else '%Y-%m-%dT%H:%M'
+    try:
+        return float(calendar.timegm(time.strptime(value, fmt)))
+    except ValueError:
+        return None
+
+
+def parse_cme(raw):
+    """Turn one DONKI CME record into a CMEEvent, or None if it has no start time"""
+    start = parse_donki_time(raw.get('startTime'))
+    if start is None:
+        return None
+
+    speed = None
+    arrival = None
+    analyses = raw.get('cmeAnalyses') or []
+    # Prefer the analysis DONKI flags as most accurate
+    analyses = sorted(analyses, key=lambda a: not a.get('isMostAccurate'))
+    for analysis in analyses:
+        if speed is None and analysis.get('speed'):
+            speed = float(analysis['speed'])
+        for run in analysis.get('enlilList') or []:
+            arrival = parse_donki_time(run.get('estimatedShockArrivalTime'))
+            if arrival is not None:
+                break
+        if arrival is not None and speed is not None:
+            break
+
+    speed = speed or DEFAULT_CME_SPEED
+    if arrival is None or arrival <= start:
+        # No model run reached Earth; estimate the 1 AU transit from speed
+        arrival = start + AU_KM / speed
+
+    return CMEEvent(raw.get('activityID', ''), start, arrival, speed, raw.get('note') or '')
+
+
+class CMETimeline:
+    """Interval index over CME start and arrival times.
+
+    Events are kept sorted by start time alongside the longest transit seen so
+    far. Any event active at time t must have started in [t - max_duration, t],
+    so both point and window queries are two bisections plus the matches.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.events = []
+        self.max_duration = 0.0
+        self.last_arrival = None
+        self.known_ids = set()
+        self.fetched_windows = []
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.events)
+
+    def ingest(self, raw_events):
+        """Append DONKI CME records, skipping ones already indexed"""
+        with self.lock:
+            batch = []
+            for raw in raw_events or []:
+                event = parse_cme(raw)
+                if event is None or event.activity_id in self.known_ids:
+                    continue
+                self.known_ids.add(event.activity_id)
+                self.max_duration = max(self.max_duration, event.arrival - event.start)
+                if self.last_arrival is None or event.arrival > self.last_arrival:
+                    self.last_arrival = event.arrival
+                batch.append(event)
+            if not batch:
+                return 0
+
+            # New windows usually arrive in chronological order, so this is an
+            # extend; an out-of-order batch is sorted once and merged in O(n)
+            batch.sort(key=lambda e: e.start)
+            if self.starts and batch[0].start < self.starts[-1]:
+                self.events = list(heapq.merge(self.events, batch, key=lambda e: e.start))
+                self.starts = [e.start for e in self.events]
+            else:
+                self.events.extend(batch)
+                self.starts.extend(e.start for e in batch)
+        return len(batch)
+
+    def fetch_window(self, start_date, end_date):
+        """Fetch a DONKI window and ingest it; windows already fetched are skipped.
+
+        Returns how many events were added, or None if the request failed.
+        A failed window is not marked fetched, so it can be asked for again.
+        """
+        window = (str(start_date), str(end_date))
+        if window in self.fetched_windows:
+            return 0
+        raw_events = NASAAPI.get_space_weather(*window)
+        if raw_events is None:
+            return None
+        added = self.ingest(raw_events)
+        self.fetched_windows.append(window)
+        return added
+
+    def fetch_recent(self, days=30):
+        """Fetch the last few weeks of CMEs"""
+        end = date.today()
+        return self.fetch_window((end - timedelta(days=days)).isoformat(), end.isoformat())
+
+    def active_at(self, t):
+        """Return events whose CME is between launch and arrival at time t"""
+        with self.lock:
+            lo = bisect.bisect_left(self.starts, t - self.max_duration)
+            hi = bisect.bisect_right(self.starts, t)
+            return [e for e in self.events[lo:hi] if e.arrival >= t]
+
+    def within(self, window_start, window_end):
+        """Return events whose interval overlaps [window_start, window_end]"""
+        with self.lock:
+            lo = bisect.bisect_left(self.starts, window_start - self.max_duration)
+            hi = bisect.bisect_right(self.starts, window_end)
+            return [e for e in self.events[lo:hi] if e.arrival >= window_start]
+
+    def time_span(self):
+        """Return (first start, last arrival) or None when empty"""
+        with self.lock:
+            if not self.events:
+                return None
+            return self.starts[0], self.last_arrival
@@ -2,67 +2,93 @@
 import pygame
 import random
 import math
+import numpy as np
 from game.constants import *
+from game.utils.ecs import (POSITION, RADIUS, ROTATION, SPIN, VELOCITY, VISIBLE, WRAPS,
+                            EntityView, Field, define_component, define_tag)
+from game.utils.sprite_cache import bucket_angle, get_font, quantize_angles
 
-class Asteroid:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.radius = random.randint(15, 35)
-        self.speed = random.randint(20, 60)
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.rotation = 0
-        self.rotation_speed = random.uniform(-2, 2)
+# Craters sit close to the middle, so coarser rotation steps look the same
+ASTEROID_ROTATION_STEPS = 32
+
+ASTEROID = define_tag('asteroid')
+MINERAL = define_component('mineral', object)
+SCANNED = define_component('scanned', np.bool_)
+
+def build_asteroid_sprite(key):
+    """Pre-render an asteroid body, craters and scan marker"""
+    _, radius, angle, scanned, mineral = key
+    rotation = bucket_angle(angle, ASTEROID_ROTATION_STEPS)
+    text = get_font(20).render(mineral, True, WHITE) if scanned else None
+    
+    # Room for the scan ring and the mineral label above it
+    half_width = radius + 7
+    top = radius + 7
+    if text:
+        half_width = max(half_width, text.get_width() // 2 + 1)
+        top = max(top, radius + 15 + text.get_height() // 2 + 1)
+    surface = pygame.Surface((half_width * 2 + 1, top + radius + 8), pygame.SRCALPHA)
+    cx, cy = half_width, top
+    
+    # Draw asteroid body
+    color = (100, 80, 60) if not scanned else (120, 100, 80)
+    pygame.draw.circle(surface, color, (cx, cy), radius)
+    
+    # Draw surface details
+    for i in range(3):
+        offset_x = math.cos(rotation + i * 2) * (radius * 0.3)
+        offset_y = math.sin(rotation + i * 2) * (radius * 0.3)
+        pygame.draw.circle(surface, (80, 60, 40), (int(cx + offset_x), int(cy + offset_y)), 3)
+    
+    # Draw scan indicator if scanned
+    if scanned:
+        pygame.draw.circle(surface, GREEN, (cx, cy), radius + 5, 2)
+        surface.blit(text, text.get_rect(center=(cx, cy - radius - 15)))
+    return surface, (cx, cy)
+
+class Asteroid(EntityView):
+    """A drifting, spinning rock that wraps around the screen and can be scanned for minerals"""
+    tag = ASTEROID
+    rotation = Field(ROTATION)
+    mineral_type = Field(MINERAL)
+    scanned = Field(SCANNED)
+    # False while a multiplayer server hasn't told us where it is
+    visible = Field(VISIBLE)
+    build_sprite = staticmethod(build_asteroid_sprite)
+    __slots__ = ()
+    
+    def __init__(self, x, y, rng=None, world=None):
+        rng = rng or random
+        radius = rng.randint(15, 35)
+        speed = rng.randint(20, 60)
+        angle = rng.uniform(0, 2 * math.pi)
+        rotation_speed = rng.uniform(-2, 2)
         
         # Asteroid properties
-        self.mineral_type = random.choice(['Iron', 'Nickel', 'Platinum', 'Water Ice'])
-        self.value = self.radius * 10
-        self.scanned = False
-        
-        # Movement
-        self.dx = math.cos(self.angle) * self.speed
-        self.dy = math.sin(self.angle) * self.speed
+        mineral_type = rng.choice(['Iron', 'Nickel', 'Platinum', 'Water Ice'])
+        super().__init__({
+            POSITION: (x, y),
+            VELOCITY: (math.cos(angle) * speed, math.sin(angle) * speed),
+            RADIUS: radius,
+            ROTATION: 0.0,
+            SPIN: rotation_speed,
+            MINERAL: mineral_type,
+            SCANNED: False,
+            VISIBLE: True,
+            WRAPS: None
+        }, world)
     
-    def update(self, dt):
-        """Update asteroid position and rotation"""
-        self.x += self.dx * dt
-        self.y += self.dy * dt
-        self.rotation += self.rotation_speed * dt
-        
-        # Wrap around screen
-        if self.x < -self.radius:
-            self.x = SCREEN_WIDTH + self.radius
-        elif self.x > SCREEN_WIDTH + self.radius:
-            self.x = -self.radius
-            
-        if self.y < -self.radius:
-            self.y = SCREEN_HEIGHT + self.radius
-        elif self.y > SCREEN_HEIGHT + self.radius:
-            self.y = -self.radius
+    @property
+    def value(self):
+        return self.radius * 10
     
-    def render(self, screen):
-        """Render the asteroid"""
-        # Draw asteroid body
-        color = (100, 80, 60) if not self.scanned else (120, 100, 80)
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.radius)
-        
-        # Draw surface details
-        for i in range(3):
-            offset_x = math.cos(self.rotation + i * 2) * (self.radius * 0.3)
-            offset_y = math.sin(self.rotation + i * 2) * (self.radius * 0.3)
-            detail_x = self.x + offset_x
-            detail_y = self.y + offset_y
-            pygame.draw.circle(screen, (80, 60, 40), (int(detail_x), int(detail_y)), 3)
-        
-        # Draw scan indicator if scanned
-        if self.scanned:
-            pygame.draw.circle(screen, GREEN, (int(self.x), int(self.y)), self.radius + 5, 2)
-            
-            # Show mineral type
-            font = pygame.font.Font(None, 20)
-            text = font.render(self.mineral_type, True, WHITE)
-            text_rect = text.get_rect(center=(self.x, self.y - self.radius - 15))
-            screen.blit(text, text_rect)
+    @staticmethod
+    def sprite_keys(archetype):
+        """Sprite keys for the current rotation of each asteroid"""
+        angles = quantize_angles(archetype[ROTATION], ASTEROID_ROTATION_STEPS)
+        return [('asteroid', radius, angle, scanned, mineral if scanned else None)
+                for radius, angle, scanned, mineral in zip(archetype[RADIUS].tolist(), angles,
+                                                           archetype[SCANNED].tolist(), archetype[MINERAL])]
     
     def scan(self):
         """Scan asteroid for resources"""
@@ -73,4 +99,19 @@ class Asteroid:
                 'value': self.value,
                 'size': 'Large' if self.radius > 25 else 'Small'
             }
-        return None
\ No newline at end of file
+        return None
+
+def spawn_asteroids(rng, planets, attempts=8, world=None):
+    """Scatter asteroids, skipping spots too close to a planet"""
+    asteroids = []
+    for _ in range(attempts):
+        x = rng.randint(100, SCREEN_WIDTH - 100)
+        y = rng.randint(100, SCREEN_HEIGHT - 100)
+        # Avoid spawning too close to planets
+        too_close = any(
+            ((x - p.x)**2 + (y - p.y)**2)**0.5 < 100 
+            for p in planets
+        )
+        if not too_close:
+            asteroids.append(Asteroid(x, y, rng, world))
+    return asteroids
\ No newline at end of file
@@ -2,9 +2,10 @@
 import pygame
 import random
 from game.constants import *
+from game.data.content_store import get_content_store
 
 class MissionObjective:
-    def __init__(self, objective_type, target_planet=None):
+    def __init__(self, objective_type, target_planet=None, scheduler=None):
         self.type = objective_type
         self.target_planet = target_planet
         self.completed = False
@@ -13,63 +14,35 @@ class MissionObjective:
         
         # Educational questions based on mission type
         self.questions = self.generate_questions()
-        self.current_question = 0
+        self.current_question = None
+        self.answered_correctly = set()
         
-    def generate_questions(self):
-        """Generate educational questions based on mission type"""
-        question_bank = {
-            EXPLORATION: [
-                {
-                    'question': 'What is the average distance from Earth to Mars?',
-                    'options': ['225 million km', '54.6 million km', '401 million km', '150 million km'],
-                    'correct': 0,
-                    'explanation': 'Mars is on average 225 million km from Earth, but this varies greatly due to orbital mechanics.'
-                },
-                {
-                    'question': 'Which rover was the first to successfully land on Mars?',
-                    'options': ['Curiosity', 'Sojourner', 'Opportunity', 'Perseverance'],
-                    'correct': 1,
-                    'explanation': 'Sojourner was part of the Mars Pathfinder mission in 1997, the first successful rover on Mars.'
-                }
-            ],
-            RESEARCH: [
-                {
-                    'question': 'What method do we use to detect exoplanets?',
-                    'options': ['Direct imaging', 'Transit method', 'Radial velocity', 'All of the above'],
-                    'correct': 3,
-                    'explanation': 'Scientists use multiple methods including transit photometry, radial velocity, and direct imaging.'
-                },
-                {
-                    'question': 'What is the habitable zone around a star?',
-                    'options': ['Where life exists', 'Where water can be liquid', 'The asteroid belt', 'The magnetic field'],
-                    'correct': 1,
-                    'explanation': 'The habitable zone is where temperatures allow liquid water to exist on a planet\'s surface.'
-                }
-            ],
-            COLLABORATION: [
-                {
-                    'question': 'How many countries participate in the ISS program?',
-                    'options': ['5', '15', '25', '50'],
-                    'correct': 1,
-                    'explanation': 'The ISS is a collaboration between 15 countries including USA, Russia, Japan, Canada, and 11 European nations.'
-                }
-            ],
-            PROBLEM_SOLVING: [
-                {
-                    'question': 'What is the main threat from near-Earth asteroids?',
-                    'options': ['Radiation', 'Impact collision', 'Gravitational pull', 'Magnetic interference'],
-                    'correct': 1,
-                    'explanation': 'The primary concern is potential impact with Earth, which could cause significant damage.'
-                }
-            ]
-        }
+        # Spaced-repetition scheduler picks which question comes next
+        self.scheduler = scheduler
+        if self.scheduler:
+            self.scheduler.add_deck(self.type, [q['id'] for q in self.questions])
         
-        return question_bank.get(self.type, question_bank[EXPLORATION])
+    def generate_questions(self):
+        """Get educational questions based on mission type"""
+        store = get_content_store()
+        return store.get_questions(self.type) or store.get_questions(EXPLORATION)
     
     def get_current_question(self):
-        """Get the current question data"""
-        if self.current_question < len(self.questions):
-            return self.questions[self.current_question]
+        """Get the question being asked, picking the next due one if needed"""
+        if self.current_question is None and not self.is_complete():
+            self.current_question = self.pick_next_question()
+        return self.current_question
+    
+    def pick_next_question(self):
+        """Choose the next question from the scheduler, or in order without one"""
+        if self.scheduler:
+            question_id = self.scheduler.next_question(self.type)
+            question = get_content_store().get_question(question_id)
+            if question:
+                return question
+        for question in self.questions:
+            if question['id'] not in self.answered_correctly:
+                return question
         return None
     
     def answer_question(self, answer_index):
@@ -77,12 +50,16 @@ class MissionObjective:
         question = self.get_current_question()
         if question:
             is_correct = answer_index == question['correct']
-            if is_correct:
+            if self.scheduler:
+                self.scheduler.grade(question['id'], is_correct)
+            if is_correct and question['id'] not in self.answered_correctly:
                 self.progress += 25
-                self.current_question += 1
+                self.answered_correctly.add(question['id'])
+            # A wrong answer reschedules the question instead of repeating it
+            self.current_question = None
             return is_correct, question['explanation']
         return False, ""
     
     def is_complete(self):
         """Check if objective is complete"""
-        return self.progress >= self.max_progress or self.current_question >= len(self.questions)
\ No newline at end of file
+        return self.progress >= self.max_progress or len(self.answered_correctly) >= len(self.questions)
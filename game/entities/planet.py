@@ -1,56 +1,91 @@
 """Planet entity for exploration"""
 import pygame
 import math
+import numpy as np
 from game.constants import *
+from game.data.content_store import get_content_store
+from game.utils.ecs import (AGE, COLOR, NAME, ORBIT_ANGLE, ORBIT_CENTER, ORBIT_RADIUS, ORBIT_SPEED, POSITION, RADIUS,
+                            EntityView, Field, define_component, define_tag)
+from game.utils.sprite_cache import PULSE_STEPS, bucket_angle, get_font, quantize_angles
 
-class Planet:
-    def __init__(self, x, y, name, color):
-        self.x = x
-        self.y = y
-        self.name = name
-        self.color = color
-        self.radius = 40
-        self.visited = False
-        self.animation_time = 0
-        
-        # Educational data (could be loaded from NASA APIs)
-        self.facts = {
-            'Earth': 'Our home planet, 71% covered by water',
-            'Mars': 'The Red Planet, potential for human colonization',
-            'Moon': 'Earth\'s natural satellite, first human landing 1969',
-            'Jupiter': 'Largest planet, has over 80 moons'
-        }
+PLANET = define_tag('planet')
+VISITED = define_component('visited', np.bool_)
+# The atmosphere ring is dropped at low quality
+GLOW_RING = define_component('glow_ring', np.bool_)
+
+def build_planet_sprite(key):
+    """Pre-render a planet with its glow, name and visited marker"""
+    _, name, color, radius, phase, visited, glow_ring = key
+    pulse = 1.0 if visited else 1.0 + 0.1 * math.sin(bucket_angle(phase, PULSE_STEPS))
+    current_radius = int(radius * pulse)
+    name_text = get_font(24).render(name, True, WHITE)
+    
+    # Room for the glow ring and for the name above the planet
+    half_width = max(current_radius + 6, name_text.get_width() // 2 + 1)
+    top = max(current_radius + 6, radius + 20 + name_text.get_height() // 2 + 1)
+    surface = pygame.Surface((half_width * 2 + 1, top + current_radius + 7), pygame.SRCALPHA)
+    center = (half_width, top)
+    
+    # Draw planet
+    pygame.draw.circle(surface, color, center, current_radius)
+    
+    # Draw atmosphere glow
+    if glow_ring:
+        glow_color = tuple(min(255, c + 50) for c in color)
+        pygame.draw.circle(surface, glow_color, center, current_radius + 5, 2)
     
-    def update(self, dt):
-        """Update planet animation"""
-        self.animation_time += dt
+    # Draw name
+    surface.blit(name_text, name_text.get_rect(center=(center[0], center[1] - radius - 20)))
     
-    def render(self, screen):
-        """Render the planet"""
+    # Draw visited indicator
+    if visited:
+        pygame.draw.circle(surface, GREEN, (center[0] + radius - 10, center[1] - radius + 10), 5)
+    return surface, center
+
+class Planet(EntityView):
+    """A planet: a fixed or orbiting body that is marked visited when the player reaches it"""
+    tag = PLANET
+    name = Field(NAME)
+    color = Field(COLOR)
+    visited = Field(VISITED)
+    glow_ring = Field(GLOW_RING)
+    animation_time = Field(AGE)
+    orbit_radius = Field(ORBIT_RADIUS)
+    orbit_angle = Field(ORBIT_ANGLE)
+    build_sprite = staticmethod(build_planet_sprite)
+    __slots__ = ()
+    
+    def __init__(self, x, y, name, color, radius=40, orbit=None, world=None):
+        """orbit is (center, radius, start angle, angular speed) for a planet circling a point"""
+        components = {
+            POSITION: (x, y),
+            RADIUS: radius,
+            NAME: name,
+            COLOR: color,
+            VISITED: False,
+            GLOW_RING: True,
+            AGE: 0.0
+        }
+        if orbit:
+            center, orbit_radius, angle, speed = orbit
+            components.update({ORBIT_CENTER: center, ORBIT_RADIUS: orbit_radius, ORBIT_ANGLE: angle, ORBIT_SPEED: speed})
+        super().__init__(components, world)
+    
+    @staticmethod
+    def sprite_keys(archetype):
+        """Sprite keys for the current pulse phase of each planet"""
+        visited = archetype[VISITED].tolist()
         # Pulsing effect for unvisited planets
-        pulse = 1.0
-        if not self.visited:
-            pulse = 1.0 + 0.1 * math.sin(self.animation_time * 3)
-        
-        current_radius = int(self.radius * pulse)
-        
-        # Draw planet
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), current_radius)
-        
-        # Draw atmosphere glow
-        glow_color = tuple(min(255, c + 50) for c in self.color)
-        pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), current_radius + 5, 2)
-        
-        # Draw name
-        font = pygame.font.Font(None, 24)
-        name_text = font.render(self.name, True, WHITE)
-        name_rect = name_text.get_rect(center=(self.x, self.y - self.radius - 20))
-        screen.blit(name_text, name_rect)
-        
-        # Draw visited indicator
-        if self.visited:
-            pygame.draw.circle(screen, GREEN, (int(self.x + self.radius - 10), int(self.y - self.radius + 10)), 5)
+        phases = quantize_angles(archetype[AGE] * 3, PULSE_STEPS)
+        return [('planet', name, color, radius, 0 if seen else phase, seen, glow)
+                for name, color, radius, phase, seen, glow in zip(archetype[NAME], archetype[COLOR], archetype[RADIUS].tolist(),
+                                                                  phases, visited, archetype[GLOW_RING].tolist())]
     
     def get_fact(self):
         """Get educational fact about this planet"""
-        return self.facts.get(self.name, "An interesting celestial body to explore!")
\ No newline at end of file
+        return planet_fact(self.name)
+
+def planet_fact(name):
+    """Educational summary of a planet by name"""
+    summary = get_content_store().get_planet_summary(name)
+    return summary or "An interesting celestial body to explore!"
\ No newline at end of file
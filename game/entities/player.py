@@ -2,6 +2,7 @@
 import pygame
 import math
 from game.constants import *
+from game.utils.sprite_cache import bucket_angle, get_sprite_cache, quantize_angle
 
 class Player:
     def __init__(self, x, y):
@@ -19,10 +20,17 @@ class Player:
             'left': False,
             'right': False
         }
+        
+        # Set by the scene; drives the movement keys while engaged
+        self.autopilot = None
     
     def handle_event(self, event):
         """Handle input events"""
         if event.type == pygame.KEYDOWN:
+            # Steering by hand takes over from the autopilot
+            if event.key in (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d):
+                if self.autopilot and self.autopilot.active:
+                    self.autopilot.cancel(self)
             if event.key == pygame.K_w:
                 self.keys['up'] = True
             elif event.key == pygame.K_s:
@@ -73,19 +81,36 @@ class Player:
         distance = math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
         return distance < (self.radius + other.radius)
     
+    def get_sprite(self):
+        """Cached sprite for the current heading and thrust, and its screen rect"""
+        key = ('player', self.radius, quantize_angle(self.angle), self.thrust)
+        return get_sprite_cache().place(key, build_player_sprite, self.x, self.y)
+    
     def render(self, screen):
         """Render the player spacecraft"""
-        # Draw spacecraft body
-        pygame.draw.circle(screen, CYAN, (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius, 2)
-        
-        # Draw direction indicator
-        end_x = self.x + math.cos(self.angle) * (self.radius + 10)
-        end_y = self.y + math.sin(self.angle) * (self.radius + 10)
-        pygame.draw.line(screen, YELLOW, (self.x, self.y), (end_x, end_y), 3)
-        
-        # Draw thrust effect
-        if self.thrust:
-            thrust_x = self.x - math.cos(self.angle) * (self.radius + 5)
-            thrust_y = self.y - math.sin(self.angle) * (self.radius + 5)
-            pygame.draw.circle(screen, RED, (int(thrust_x), int(thrust_y)), 5)
\ No newline at end of file
+        surface, rect = self.get_sprite()
+        return screen.blit(surface, rect)
+
+def build_player_sprite(key):
+    """Pre-render the spacecraft body, heading line and thrust flame"""
+    _, radius, angle, thrust = key
+    angle = bucket_angle(angle)
+    half = radius + 12
+    surface = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+    center = (half, half)
+    
+    # Draw spacecraft body
+    pygame.draw.circle(surface, CYAN, center, radius)
+    pygame.draw.circle(surface, WHITE, center, radius, 2)
+    
+    # Draw direction indicator
+    end_x = half + math.cos(angle) * (radius + 10)
+    end_y = half + math.sin(angle) * (radius + 10)
+    pygame.draw.line(surface, YELLOW, center, (end_x, end_y), 3)
+    
+    # Draw thrust effect
+    if thrust:
+        thrust_x = half - math.cos(angle) * (radius + 5)
+        thrust_y = half - math.sin(angle) * (radius + 5)
+        pygame.draw.circle(surface, RED, (int(thrust_x), int(thrust_y)), 5)
+    return surface, center
\ No newline at end of file
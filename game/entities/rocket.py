@@ -1,10 +1,23 @@
 """Rocket launch simulation for mission deployment"""
 import pygame
 import math
+import random
+from types import MappingProxyType
 from game.constants import *
 
+# Where each mission type flies, shared by every rocket
+DESTINATIONS = MappingProxyType({
+    'exploration': MappingProxyType({'name': 'Mars', 'distance': 225000000, 'color': PLANET_COLORS['mars']}),
+    'research': MappingProxyType({'name': 'Deep Space', 'distance': 1000000000, 'color': PURPLE}),
+    'collaboration': MappingProxyType({'name': 'ISS', 'distance': 400, 'color': CYAN}),
+    'problem_solving': MappingProxyType({'name': 'Asteroid Belt', 'distance': 550000000, 'color': (150, 150, 150)})
+})
+
 class Rocket:
-    def __init__(self, x, y, mission_type="exploration"):
+    destinations = DESTINATIONS
+    
+    def __init__(self, x, y, mission_type="exploration", rng=None):
+        self.rng = rng or random
         self.x = x
         self.y = y
         self.start_y = y
@@ -19,15 +32,8 @@ class Rocket:
         self.stage = 1  # Rocket stages (1, 2, 3)
         self.max_stages = 3
         
-        # Mission destinations
-        self.destinations = {
-            'exploration': {'name': 'Mars', 'distance': 225000000, 'color': PLANET_COLORS['mars']},
-            'research': {'name': 'Deep Space', 'distance': 1000000000, 'color': PURPLE},
-            'collaboration': {'name': 'ISS', 'distance': 400, 'color': CYAN},
-            'problem_solving': {'name': 'Asteroid Belt', 'distance': 550000000, 'color': (150, 150, 150)}
-        }
-        
-        self.destination = self.destinations.get(mission_type, self.destinations['exploration'])
+        # Mission destination
+        self.destination = DESTINATIONS.get(mission_type, DESTINATIONS['exploration'])
         self.distance_traveled = 0
         
         # Visual effects
@@ -69,11 +75,11 @@ class Rocket:
             # Create thrust particles
             if len(self.thrust_particles) < 20:
                 particle = {
-                    'x': self.x + random.randint(-5, 5),
+                    'x': self.x + self.rng.randint(-5, 5),
                     'y': self.y + self.height // 2,
-                    'velocity_y': random.randint(50, 150),
-                    'life': random.uniform(0.5, 1.5),
-                    'color': random.choice([RED, YELLOW, (255, 100, 0)])
+                    'velocity_y': self.rng.randint(50, 150),
+                    'life': self.rng.uniform(0.5, 1.5),
+                    'color': self.rng.choice([RED, YELLOW, (255, 100, 0)])
                 }
                 self.thrust_particles.append(particle)
             
@@ -91,8 +97,6 @@ class Rocket:
     
     def render(self, screen):
         """Render the rocket and effects"""
-        import random
-        
         # Draw thrust particles
         for particle in self.thrust_particles:
             alpha = int(255 * (particle['life'] / 1.5))
@@ -133,8 +137,8 @@ class Rocket:
         # Stage separation effect
         if self.stage_separation_time > 0:
             for i in range(10):
-                spark_x = self.x + random.randint(-15, 15)
-                spark_y = self.y + random.randint(-10, 10)
+                spark_x = self.x + self.rng.randint(-15, 15)
+                spark_y = self.y + self.rng.randint(-10, 10)
                 pygame.draw.circle(screen, YELLOW, (spark_x, spark_y), 2)
         
         # Fuel indicator
@@ -1,91 +1,113 @@
 """Satellite entities for communication and observation missions"""
 import pygame
 import math
+import numpy as np
+from types import MappingProxyType
 from game.constants import *
+from game.utils.ecs import (ACTIVE, COLOR, ORBIT_ANGLE, ORBIT_CENTER, ORBIT_RADIUS, ORBIT_SPEED, PARENT, POSITION, RADIUS,
+                            EntityView, Field, define_component, define_tag)
 
-class Satellite:
-    def __init__(self, x, y, satellite_type="communication"):
-        self.x = x
-        self.y = y
-        self.type = satellite_type
-        self.radius = 20
-        self.orbit_radius = 60
-        self.orbit_angle = 0
-        self.orbit_speed = 1.5
-        self.active = True
-        self.data_collected = 0
-        
-        # Satellite types and their functions
-        self.satellite_data = {
-            'communication': {
-                'name': 'CommSat-1',
-                'function': 'Enables communication between Earth and spacecraft',
-                'color': CYAN,
-                'data_type': 'Communication Signals'
-            },
-            'weather': {
-                'name': 'WeatherSat-2',
-                'function': 'Monitors Earth\'s weather patterns and climate',
-                'color': BLUE,
-                'data_type': 'Weather Data'
-            },
-            'navigation': {
-                'name': 'NavSat-GPS',
-                'function': 'Provides precise positioning for spacecraft navigation',
-                'color': GREEN,
-                'data_type': 'Navigation Data'
-            },
-            'scientific': {
-                'name': 'SciSat-Hubble',
-                'function': 'Observes distant galaxies and cosmic phenomena',
-                'color': PURPLE,
-                'data_type': 'Astronomical Data'
-            }
-        }
-        
-        self.info = self.satellite_data.get(satellite_type, self.satellite_data['communication'])
+SATELLITE = define_tag('satellite')
+KIND = define_component('kind', object)
+DATA = define_component('data', np.float64)
+
+# Satellite types and their functions, shared by every satellite of a type
+SATELLITE_TYPES = MappingProxyType({
+    'communication': MappingProxyType({
+        'name': 'CommSat-1',
+        'function': 'Enables communication between Earth and spacecraft',
+        'color': CYAN,
+        'data_type': 'Communication Signals'
+    }),
+    'weather': MappingProxyType({
+        'name': 'WeatherSat-2',
+        'function': 'Monitors Earth\'s weather patterns and climate',
+        'color': BLUE,
+        'data_type': 'Weather Data'
+    }),
+    'navigation': MappingProxyType({
+        'name': 'NavSat-GPS',
+        'function': 'Provides precise positioning for spacecraft navigation',
+        'color': GREEN,
+        'data_type': 'Navigation Data'
+    }),
+    'scientific': MappingProxyType({
+        'name': 'SciSat-Hubble',
+        'function': 'Observes distant galaxies and cosmic phenomena',
+        'color': PURPLE,
+        'data_type': 'Astronomical Data'
+    })
+})
+
+def satellite_info(satellite_type):
+    """Shared table entry for a satellite type; unknown types behave like communication satellites"""
+    return SATELLITE_TYPES.get(satellite_type, SATELLITE_TYPES['communication'])
+
+def build_satellite_sprite(key):
+    """Pre-render the body, solar panels, instrument and status light"""
+    _, satellite_type, active, color = key
+    surface = pygame.Surface((29, 22), pygame.SRCALPHA)
+    cx, cy = 14, 16
+    
+    # Draw satellite body
+    pygame.draw.rect(surface, color, (cx - 8, cy - 6, 16, 12))
+    pygame.draw.rect(surface, WHITE, (cx - 8, cy - 6, 16, 12), 2)
     
-    def update(self, dt):
-        """Update satellite orbital position"""
-        if self.active:
-            self.orbit_angle += self.orbit_speed * dt
-            # Collect data over time
-            self.data_collected += dt * 10
+    # Draw solar panels
+    pygame.draw.rect(surface, BLUE, (cx - 12, cy - 3, 6, 6))
+    pygame.draw.rect(surface, BLUE, (cx + 6, cy - 3, 6, 6))
     
-    def get_orbital_position(self, center_x, center_y):
-        """Calculate current orbital position around a center point"""
-        orbit_x = center_x + math.cos(self.orbit_angle) * self.orbit_radius
-        orbit_y = center_y + math.sin(self.orbit_angle) * self.orbit_radius
-        return orbit_x, orbit_y
+    # Draw communication dish/antenna
+    if satellite_type == 'communication':
+        pygame.draw.circle(surface, WHITE, (cx, cy - 10), 4, 1)
+    elif satellite_type == 'scientific':
+        # Telescope
+        pygame.draw.line(surface, WHITE, (cx, cy - 8), (cx, cy - 15), 2)
     
-    def render(self, screen, center_x=None, center_y=None):
-        """Render the satellite"""
-        if center_x is not None and center_y is not None:
-            # Orbiting satellite
-            self.x, self.y = self.get_orbital_position(center_x, center_y)
-            
-            # Draw orbit path
-            pygame.draw.circle(screen, (100, 100, 100), (int(center_x), int(center_y)), self.orbit_radius, 1)
-        
-        # Draw satellite body
-        color = self.info['color'] if self.active else (100, 100, 100)
-        pygame.draw.rect(screen, color, (int(self.x - 8), int(self.y - 6), 16, 12))
-        pygame.draw.rect(screen, WHITE, (int(self.x - 8), int(self.y - 6), 16, 12), 2)
-        
-        # Draw solar panels
-        pygame.draw.rect(screen, BLUE, (int(self.x - 12), int(self.y - 3), 6, 6))
-        pygame.draw.rect(screen, BLUE, (int(self.x + 6), int(self.y - 3), 6, 6))
-        
-        # Draw communication dish/antenna
-        if self.type == 'communication':
-            pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y - 10)), 4, 1)
-        elif self.type == 'scientific':
-            # Telescope
-            pygame.draw.line(screen, WHITE, (self.x, self.y - 8), (self.x, self.y - 15), 2)
-        
-        # Status indicator
-        status_color = GREEN if self.active else RED
-        pygame.draw.circle(screen, status_color, (int(self.x + 10), int(self.y - 8)), 3)
+    # Status indicator
+    status_color = GREEN if active else RED
+    pygame.draw.circle(surface, status_color, (cx + 10, cy - 8), 3)
+    return surface, (cx, cy)
+
+class Satellite(EntityView):
+    """A satellite circling a point or a parent entity, gathering data while active"""
+    tag = SATELLITE
+    type = Field(KIND)
+    active = Field(ACTIVE)
+    data_collected = Field(DATA)
+    orbit_radius = Field(ORBIT_RADIUS)
+    orbit_angle = Field(ORBIT_ANGLE)
+    build_sprite = staticmethod(build_satellite_sprite)
+    __slots__ = ()
+    
+    def __init__(self, x, y, satellite_type="communication", orbit_radius=60, orbit_angle=0, parent=None, world=None):
+        """Orbits (x, y), or the parent entity's position when one is given"""
+        components = {
+            POSITION: (x + math.cos(orbit_angle) * orbit_radius, y + math.sin(orbit_angle) * orbit_radius),
+            RADIUS: 20,
+            KIND: satellite_type,
+            ORBIT_RADIUS: orbit_radius,
+            ORBIT_ANGLE: orbit_angle,
+            ORBIT_SPEED: 1.5,
+            ACTIVE: True,
+            DATA: 0.0,
+            COLOR: satellite_info(satellite_type)['color']
+        }
+        if parent is None:
+            components[ORBIT_CENTER] = (x, y)
+        else:
+            components[PARENT] = parent.entity
+        super().__init__(components, world)
+    
+    @property
+    def info(self):
+        return satellite_info(self.type)
+    
+    @staticmethod
+    def sprite_keys(archetype):
+        """Sprite keys for each satellite's type and status"""
+        return [('satellite', satellite_type, active, color if active else (100, 100, 100))
+                for satellite_type, active, color in zip(archetype[KIND], archetype[ACTIVE].tolist(), archetype[COLOR])]
     
     def interact(self):
         """Interact with satellite to collect data"""
@@ -98,4 +120,9 @@ class Satellite:
                 'amount': collected,
                 'function': self.info['function']
             }
-        return None
\ No newline at end of file
+        return None
+
+def collect(world, dt):
+    """Active satellites gather data over time"""
+    for archetype in world.query(SATELLITE, ACTIVE, DATA):
+        archetype[DATA] += archetype[ACTIVE] * (dt * 10)
\ No newline at end of file
@@ -2,8 +2,10 @@
 import pygame
 import math
 from game.constants import *
-from game.entities.planet import Planet
-from game.entities.satellite import Satellite
+from game.entities.planet import PLANET, Planet
+from game.entities.satellite import SATELLITE, Satellite, collect
+from game.utils import ecs
+from game.utils.ecs import ORBIT_RADIUS, World
 
 class SolarSystem:
     def __init__(self):
@@ -39,6 +41,8 @@ class SolarSystem:
             }
         ]
         
+        # Planets and satellites live here; the lists hold their views
+        self.world = World()
         self.planets = []
         self.satellites = []
         self.time_scale = 1.0
@@ -53,12 +57,9 @@ class SolarSystem:
             x = self.sun_x + math.cos(data['angle']) * data['orbit_radius']
             y = self.sun_y + math.sin(data['angle']) * data['orbit_radius']
             
-            planet = Planet(x, y, data['name'], data['color'])
-            planet.radius = data['radius']
-            planet.orbit_radius = data['orbit_radius']
-            planet.orbit_speed = data['orbit_speed']
-            planet.orbit_angle = data['angle']
-            
+            # Orbits are shown at a tenth of their listed speed
+            orbit = ((self.sun_x, self.sun_y), data['orbit_radius'], data['angle'], data['orbit_speed'] * 0.1)
+            planet = Planet(x, y, data['name'], data['color'], data['radius'], orbit, self.world)
             self.planets.append(planet)
     
     def create_satellites(self):
@@ -68,62 +69,61 @@ class SolarSystem:
             # Create different types of satellites
             satellite_types = ['communication', 'weather', 'navigation', 'scientific']
             for i, sat_type in enumerate(satellite_types):
-                satellite = Satellite(earth.x, earth.y, sat_type)
-                satellite.orbit_angle = i * (math.pi / 2)  # Spread them out
-                satellite.orbit_radius = 40 + i * 10  # Different orbital distances
+                satellite = Satellite(earth.x, earth.y, sat_type,
+                                      orbit_radius=40 + i * 10,  # Different orbital distances
+                                      orbit_angle=i * (math.pi / 2),  # Spread them out
+                                      parent=earth, world=self.world)
                 self.satellites.append(satellite)
     
     def update(self, dt):
         """Update solar system simulation"""
         dt *= self.time_scale
         
-        # Update planetary orbits
-        for planet in self.planets:
-            planet.orbit_angle += planet.orbit_speed * dt * 0.1
-            
-            # Calculate new position
-            planet.x = self.sun_x + math.cos(planet.orbit_angle) * planet.orbit_radius
-            planet.y = self.sun_y + math.sin(planet.orbit_angle) * planet.orbit_radius
-            
-            planet.update(dt)
-        
-        # Update satellites (they orbit Earth)
-        earth = next((p for p in self.planets if p.name == 'Earth'), None)
-        if earth:
-            for satellite in self.satellites:
-                satellite.update(dt)
+        # Planets circle the Sun and satellites follow Earth, all in one pass
+        ecs.orbit(self.world, dt)
+        ecs.age(self.world, dt)
+        collect(self.world, dt)
     
     def render(self, screen):
         """Render the solar system"""
         # Draw orbit paths
-        for planet in self.planets:
-            pygame.draw.circle(screen, (50, 50, 50), 
-                             (int(self.sun_x), int(self.sun_y)), 
-                             planet.orbit_radius, 1)
+        sun = (int(self.sun_x), int(self.sun_y))
+        for archetype in self.world.query(PLANET, ORBIT_RADIUS):
+            for orbit_radius in archetype[ORBIT_RADIUS].tolist():
+                pygame.draw.circle(screen, (50, 50, 50), sun, orbit_radius, 1)
         
         # Draw the Sun
-        pygame.draw.circle(screen, YELLOW, 
-                         (int(self.sun_x), int(self.sun_y)), 
-                         self.sun_radius)
-        pygame.draw.circle(screen, (255, 255, 150), 
-                         (int(self.sun_x), int(self.sun_y)), 
-                         self.sun_radius - 5)
+        pygame.draw.circle(screen, YELLOW, sun, self.sun_radius)
+        pygame.draw.circle(screen, (255, 255, 150), sun, self.sun_radius - 5)
         
         # Draw planets
-        for planet in self.planets:
-            planet.render(screen)
+        screen.blits([(surface, rect) for _, surface, rect in ecs.drawables(self.world, Planet)], doreturn=False)
         
         # Draw satellites around Earth
-        earth = next((p for p in self.planets if p.name == 'Earth'), None)
+        earth = self.get_planet_by_name('Earth')
         if earth:
             for satellite in self.satellites:
-                satellite.render(screen, earth.x, earth.y)
+                pygame.draw.circle(screen, (100, 100, 100), (int(earth.x), int(earth.y)), int(satellite.orbit_radius), 1)
+            screen.blits([(surface, rect) for _, surface, rect in ecs.drawables(self.world, Satellite)], doreturn=False)
         
         # Draw time scale indicator
         font = pygame.font.Font(None, 24)
         time_text = font.render(f"Time Scale: {self.time_scale:.1f}x", True, WHITE)
         screen.blit(time_text, (10, SCREEN_HEIGHT - 30))
     
+    def render_cmes(self, screen, events, t):
+        """Draw coronal mass ejection fronts expanding from the Sun toward Earth's orbit"""
+        earth = self.get_planet_by_name('Earth')
+        if not earth or not events:
+            return
+        for event in events:
+            progress = (t - event.start) / (event.arrival - event.start)
+            radius = int(self.sun_radius + (earth.orbit_radius - self.sun_radius) * progress)
+            # Faster CMEs draw as thicker, hotter fronts
+            width = 2 if event.speed < 800 else 4
+            color = (255, 140, 0) if event.speed < 800 else (255, 60, 60)
+            pygame.draw.circle(screen, color, (int(self.sun_x), int(self.sun_y)), radius, width)
+    
     def get_planet_by_name(self, name):
         """Get a planet by its name"""
         return next((p for p in self.planets if p.name == name), None)
@@ -134,19 +134,5 @@ class SolarSystem:
     
     def get_nearest_satellite(self, x, y, max_distance=50):
         """Get the nearest satellite to a position"""
-        earth = next((p for p in self.planets if p.name == 'Earth'), None)
-        if not earth:
-            return None
-        
-        nearest_satellite = None
-        min_distance = max_distance
-        
-        for satellite in self.satellites:
-            sat_x, sat_y = satellite.get_orbital_position(earth.x, earth.y)
-            distance = math.sqrt((x - sat_x)**2 + (y - sat_y)**2)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_satellite = satellite
-        
-        return nearest_satellite
\ No newline at end of file
+        entity = ecs.nearest(self.world, SATELLITE, x, y, max_distance)
+        return self.world.view(entity) if entity is not None else None
\ No newline at end of file
@@ -1,61 +1,91 @@
 """Space station for collaboration missions"""
 import pygame
 import math
+import numpy as np
 from game.constants import *
+from game.utils.ecs import NAME, POSITION, RADIUS, ROTATION, SPIN, EntityView, Field, define_component, define_tag
+from game.utils.sprite_cache import ROTATION_STEPS, bucket_angle, get_font, quantize_angles
 
-class SpaceStation:
-    def __init__(self, x, y, name="ISS"):
-        self.x = x
-        self.y = y
-        self.name = name
-        self.radius = 50
-        self.rotation = 0
-        self.docked = False
-        self.crew_members = [
-            "Commander Sarah Chen (USA)",
-            "Flight Engineer Yuki Tanaka (Japan)", 
-            "Mission Specialist Alex Petrov (Russia)",
-            "Research Scientist Maria Santos (ESA)"
-        ]
-        self.experiments = [
-            "Protein Crystal Growth",
-            "Plant Growth in Microgravity",
-            "Materials Science Research",
-            "Earth Observation Study"
-        ]
-        
-    def update(self, dt):
-        """Update station rotation"""
-        self.rotation += dt * 0.5  # Slow rotation
+# The four panels look the same every quarter turn
+PANEL_PERIOD = math.pi / 2
+
+STATION = define_tag('station')
+DOCKED = define_component('docked', np.bool_)
+
+# Every station shows the same crew and experiments
+CREW_MEMBERS = (
+    "Commander Sarah Chen (USA)",
+    "Flight Engineer Yuki Tanaka (Japan)", 
+    "Mission Specialist Alex Petrov (Russia)",
+    "Research Scientist Maria Santos (ESA)"
+)
+EXPERIMENTS = (
+    "Protein Crystal Growth",
+    "Plant Growth in Microgravity",
+    "Materials Science Research",
+    "Earth Observation Study"
+)
+
+def build_station_sprite(key):
+    """Pre-render the hub, rotated solar panels, name and docking marker"""
+    _, name, angle, docked = key
+    rotation = bucket_angle(angle, ROTATION_STEPS, PANEL_PERIOD)
+    name_text = get_font(24).render(name, True, WHITE)
+    
+    # Panels reach 70 px out; the name sits above them
+    half_width = max(75, name_text.get_width() // 2 + 1)
+    top = max(75, 70 + name_text.get_height() // 2 + 1)
+    surface = pygame.Surface((half_width * 2 + 1, top + 76), pygame.SRCALPHA)
+    cx, cy = half_width, top
+    
+    # Main hub
+    pygame.draw.circle(surface, (150, 150, 150), (cx, cy), 25)
+    pygame.draw.circle(surface, WHITE, (cx, cy), 25, 2)
+    
+    # Solar panels
+    panel_length = 40
+    for angle_offset in [0, math.pi/2, math.pi, 3*math.pi/2]:
+        panel_angle = rotation + angle_offset
+        start = (cx + math.cos(panel_angle) * 30, cy + math.sin(panel_angle) * 30)
+        end = (cx + math.cos(panel_angle) * (30 + panel_length), cy + math.sin(panel_angle) * (30 + panel_length))
+        pygame.draw.line(surface, BLUE, start, end, 8)
+        pygame.draw.line(surface, CYAN, start, end, 4)
+    
+    # Station name
+    surface.blit(name_text, name_text.get_rect(center=(cx, cy - 70)))
+    
+    # Docking indicator
+    if docked:
+        pygame.draw.circle(surface, GREEN, (cx, cy - 35), 5)
+    return surface, (cx, cy)
+
+class SpaceStation(EntityView):
+    """A slowly turning station the player can dock with"""
+    tag = STATION
+    name = Field(NAME)
+    rotation = Field(ROTATION)
+    docked = Field(DOCKED)
+    crew_members = CREW_MEMBERS
+    experiments = EXPERIMENTS
+    build_sprite = staticmethod(build_station_sprite)
+    __slots__ = ()
+    
+    def __init__(self, x, y, name="ISS", world=None):
+        super().__init__({
+            POSITION: (x, y),
+            RADIUS: 50,
+            NAME: name,
+            ROTATION: 0.0,
+            SPIN: 0.5,  # Slow rotation
+            DOCKED: False
+        }, world)
     
-    def render(self, screen):
-        """Render the space station"""
-        # Main hub
-        pygame.draw.circle(screen, (150, 150, 150), (int(self.x), int(self.y)), 25)
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), 25, 2)
-        
-        # Solar panels (rotating)
-        panel_length = 40
-        for angle_offset in [0, math.pi/2, math.pi, 3*math.pi/2]:
-            angle = self.rotation + angle_offset
-            start_x = self.x + math.cos(angle) * 30
-            start_y = self.y + math.sin(angle) * 30
-            end_x = self.x + math.cos(angle) * (30 + panel_length)
-            end_y = self.y + math.sin(angle) * (30 + panel_length)
-            
-            # Solar panel
-            pygame.draw.line(screen, BLUE, (start_x, start_y), (end_x, end_y), 8)
-            pygame.draw.line(screen, CYAN, (start_x, start_y), (end_x, end_y), 4)
-        
-        # Station name
-        font = pygame.font.Font(None, 24)
-        name_text = font.render(self.name, True, WHITE)
-        name_rect = name_text.get_rect(center=(self.x, self.y - 70))
-        screen.blit(name_text, name_rect)
-        
-        # Docking indicator
-        if self.docked:
-            pygame.draw.circle(screen, GREEN, (int(self.x), int(self.y - 35)), 5)
+    @staticmethod
+    def sprite_keys(archetype):
+        """Sprite keys for the current panel angle of each station"""
+        angles = quantize_angles(archetype[ROTATION], ROTATION_STEPS, PANEL_PERIOD)
+        return [('station', name, angle, docked)
+                for name, angle, docked in zip(archetype[NAME], angles, archetype[DOCKED].tolist())]
     
     def dock(self):
         """Dock with the space station"""
@@ -5,14 +5,56 @@ from game.scenes.menu_scene import MenuScene
 from game.scenes.game_scene import GameScene
 from game.scenes.mission_scene import MissionScene
 from game.audio.sound_manager import SoundManager
+from game.data.question_scheduler import QuestionScheduler
+from game.data.achievements import ACHIEVEMENTS
+from game.utils.achievement_engine import AchievementEngine
+from game.utils.stats_store import StatsStore
+from game.utils.save_system import SaveSystem
+from game.utils.rng import RNGStreams
+from game.utils.dirty_rects import DirtyRenderer
+from game.utils.event_bus import EventBus
+from game.utils.frame_scheduler import FrameScheduler
+from game.utils.quality import QualityGovernor
+from game.utils.settings import Settings
+from game.utils.asset_cache import get_asset_cache
+from game.utils.sprite_cache import get_sprite_cache
+from game.ui.widgets import set_text_antialias
+from game.ui.debug_overlay import DebugOverlay
+
+def is_native_resolution(key):
+    """Whether a drawable starts the HUD layer that stays at window resolution"""
+    return getattr(key, 'native_resolution', False)
 
 class GameManager:
-    def __init__(self, screen):
+    def __init__(self, screen, seed=None, persist=True, network_client=None, leaderboard_client=None,
+                 settings=None, display=None, sound_manager=None, defer_scenes=False):
         self.screen = screen
+        # The window, when main opened one through Display; screen is then its canvas
+        self.display = display
+        self.settings = settings or Settings()
+        # Connected classroom server, if playing multiplayer
+        self.network_client = network_client
+        self.leaderboard_client = leaderboard_client
+        # Every subsystem draws from its own stream of this seed
+        self.rng = RNGStreams(seed)
+        # Recorded and replayed sessions start fresh and never touch saves
+        self.persist = persist
         self.current_state = MENU
         self.scenes = {}
-        self.sound_manager = SoundManager()
-        self.player_data = {
+        # Only the parts of the screen that changed are repainted and pushed
+        self.renderer = DirtyRenderer(screen.get_size())
+        if display:
+            self.renderer.set_output(display.output)
+        self.frame_rects = None
+        self.frame_on_output = False
+        # Drops the frame rate while nothing on screen moves
+        self.frame_scheduler = FrameScheduler(self.settings['fps'])
+        # Trades visual detail for frame time on slow machines
+        self.quality = QualityGovernor(budget_ms=1000.0 / self.settings['fps'])
+        self.debug_overlay = DebugOverlay(self)
+        # The loader may have built the sound manager already on its own step
+        self.sound_manager = sound_manager or SoundManager(self.settings['sample_rate'], self.settings['audio_buffer'])
+        self.player_data = StatsStore(initial={
             'name': 'Space Explorer',
             'missions_completed': 0,
             'knowledge_points': 0,
@@ -20,39 +62,250 @@ class GameManager:
             'planets_visited': 0,
             'asteroids_scanned': 0,
             'iss_docked': 0
-        }
+        })
+        self.play_time = 0.0
+        # Gameplay events; scenes emit them and their effects run together at the end of the frame
+        self.events = EventBus()
+        if persist:
+            self.question_scheduler = QuestionScheduler(self.player_data['name'])
+        else:
+            self.question_scheduler = QuestionScheduler(
+                self.player_data['name'], clock=lambda: self.play_time, persistent=False
+            )
+        
+        # Restore saved progress before anything subscribes to stat changes
+        self.save_system = SaveSystem()
+        self.autosave_timer = 0.0
+        saved_counters, saved_extras = self.save_system.load() if persist else (None, None)
+        saved_extras = saved_extras or {}
+        for key, value in (saved_counters or {}).items():
+            if key in self.player_data.counter_slots:
+                self.player_data[key] = value
+        self.player_data.flush()
+        # The world is laid out from a seed kept with the save, so saved progress finds the same asteroids
+        self.world_seed = saved_extras.get('world_seed', self.rng.seed)
+        self.world_rng = RNGStreams(self.world_seed)
+        
+        # Achievements are re-checked only when a stat they depend on changes
+        self.achievement_engine = AchievementEngine(ACHIEVEMENTS)
+        unlocked = set(saved_extras.get('achievements', []))
+        for achievement in self.achievement_engine.achievements:
+            achievement['unlocked'] = achievement['name'] in unlocked
+        self.achievement_engine.load_stats(self.player_data)
+        self.achievement_engine.subscribe(self.on_achievement_unlocked)
+        for stat in self.achievement_engine.index:
+            self.player_data.subscribe(stat, self.on_achievement_stat_changed)
+        
+        self.saved_extras = saved_extras
+        # The loading screen builds the scenes itself, one per frame
+        if not defer_scenes:
+            for _ in self.build_scenes():
+                pass
         
-        # Initialize scenes
-        self.scenes[MENU] = MenuScene(self)
-        self.scenes[PLAYING] = GameScene(self)
-        self.scenes[MISSION_SELECT] = MissionScene(self)
+    def build_scenes(self):
+        """Create every scene and finish setting up around them; yields the share done after each scene.
         
+        Scenes make fonts and render text, so this runs on the main thread.
+        """
         # Import here to avoid circular imports
         from game.scenes.achievement_scene import AchievementScene
         from game.scenes.solar_system_scene import SolarSystemScene
         from game.scenes.launch_scene import LaunchScene
-        self.scenes['achievements'] = AchievementScene(self)
-        self.scenes['solar_system'] = SolarSystemScene(self)
-        self.scenes['launch'] = LaunchScene(self)
+        from game.scenes.leaderboard_scene import LeaderboardScene
+        from game.scenes.settings_scene import SettingsScene
+        scene_classes = [
+            (MENU, MenuScene),
+            (PLAYING, GameScene),
+            (MISSION_SELECT, MissionScene),
+            ('achievements', AchievementScene),
+            ('leaderboard', LeaderboardScene),
+            ('solar_system', SolarSystemScene),
+            ('launch', LaunchScene),
+            ('settings', SettingsScene)
+        ]
+        for i, (name, scene_class) in enumerate(scene_classes):
+            self.scenes[name] = scene_class(self)
+            yield (i + 1) / len(scene_classes)
+        
+        # Knobs the quality governor turns when frames run over budget
+        self.quality.register('text_antialias', lambda settings: set_text_antialias(settings['text_antialias']))
+        for name, scene in self.scenes.items():
+            self.quality.register(name, scene.apply_quality)
+        self.quality.register('render_scale', lambda settings: self.apply_render_scale())
+        self.quality.register('repaint', lambda settings: self.renderer.invalidate())
+        
+        for name, state in self.saved_extras.get('scenes', {}).items():
+            if name in self.scenes:
+                self.scenes[name].load_save_state(state)
+        self.saved_extras = None
+        
+        # Start a fresh snapshot, then journal counter deltas on top of it
+        if self.persist:
+            self.save_system.snapshot(self.get_counter_values(), self.get_save_extras())
+            self.player_data.subscribe_all(self.on_stat_saved)
         
+        # Keep the class leaderboard in step with knowledge points
+        if self.leaderboard_client:
+            self.leaderboard_client.submit(self.player_data['knowledge_points'])
+            self.player_data.subscribe('knowledge_points', self.on_points_for_leaderboard)
+    
+    def convert_surfaces(self):
+        """Convert surfaces that were made off the main thread; call on the main thread"""
+        get_sprite_cache().convert_pending()
+        self.renderer.convert()
+    
     def change_state(self, new_state):
         """Change the current game state"""
         if new_state in self.scenes:
             self.current_state = new_state
+            self.renderer.invalidate()
             self.scenes[new_state].on_enter()
     
+    def apply_settings(self):
+        """Bring every subsystem in line with self.settings without a restart"""
+        settings = self.settings
+        if self.display and self.display.open(settings['resolution'], settings['vsync']):
+            self.screen = self.display.canvas
+            self.renderer.set_output(self.display.output)
+        self.frame_scheduler.fps = settings['fps']
+        self.quality.budget_ms = 1000.0 / settings['fps']
+        self.sound_manager.reinit(settings['sample_rate'], settings['audio_buffer'])
+        # Star counts, the particle cap and render scale are the top of each quality tier's range
+        for scene in self.scenes.values():
+            scene.apply_quality(self.quality.settings)
+        self.apply_render_scale()
+        self.renderer.invalidate()
+    
+    def apply_render_scale(self):
+        """World render scale from the settings, lowered further by the quality tier"""
+        scale = min(self.settings['render_scale'], self.quality.settings['render_scale'])
+        native = is_native_resolution if self.settings['native_text'] else None
+        self.renderer.set_scale(scale, native)
+    
+    def add_stat(self, key, amount=1):
+        """Increase a player stat; subscribers hear about it at the end of the frame"""
+        self.player_data.add(key, amount)
+    
+    def on_achievement_stat_changed(self, key, old, new):
+        """Feed a changed stat to the achievement engine"""
+        self.achievement_engine.on_stat_changed(key, new, self.play_time)
+    
+    def on_stat_saved(self, key, old, new):
+        """Journal counter changes for the next autosave"""
+        if key in self.player_data.counter_slots:
+            self.save_system.record_delta(key, new - old)
+    
+    def get_counter_values(self):
+        """Current value of every counter stat"""
+        return {key: self.player_data[key] for key in self.player_data.counter_slots}
+    
+    def get_save_extras(self):
+        """Progress that isn't a counter: scene state, unlocked achievements and the world seed"""
+        scenes = {}
+        for name, scene in self.scenes.items():
+            state = scene.get_save_state()
+            if state is not None:
+                scenes[name] = state
+        achievements = [a['name'] for a in self.achievement_engine.achievements if a['unlocked']]
+        return {'scenes': scenes, 'achievements': achievements, 'world_seed': self.world_seed}
+    
+    def save_progress(self, force_snapshot=False):
+        """Queue an incremental save; serialization happens on the writer thread"""
+        if not self.persist:
+            return
+        self.save_system.commit()
+        extras = self.get_save_extras()
+        if force_snapshot or self.save_system.needs_snapshot(extras):
+            self.save_system.snapshot(self.get_counter_values(), extras)
+    
+    def on_points_for_leaderboard(self, key, old, new):
+        """Report the new score; the client sends only the latest one"""
+        self.leaderboard_client.submit(new)
+    
+    def on_achievement_unlocked(self, achievement):
+        """Celebrate a newly unlocked achievement"""
+        self.sound_manager.play_sound('success')
+    
     def handle_event(self, event):
         """Handle pygame events"""
+        if self.display:
+            event = self.display.map_event(event)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.debug_overlay.toggle()
+            return
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # The window system may have lost what was on screen
+            self.renderer.invalidate()
         if self.current_state in self.scenes:
             self.scenes[self.current_state].handle_event(event)
     
     def update(self, dt):
         """Update current scene"""
+        self.play_time += dt
         if self.current_state in self.scenes:
-            self.scenes[self.current_state].update(dt)
+            scene = self.scenes[self.current_state]
+            scene.update(dt)
+            self.sound_manager.set_music_intensity(scene.music_intensity)
+        
+        # Deliver this frame's events, then the stat changes they made, in one batch each
+        self.events.flush()
+        self.player_data.flush()
+        # Sounds triggered by the scene or by stat changes start together
+        self.sound_manager.update()
+        self.debug_overlay.update(dt)
+        
+        self.autosave_timer += dt
+        if self.autosave_timer >= AUTOSAVE_INTERVAL:
+            self.autosave_timer = 0.0
+            self.save_progress()
     
     def render(self):
-        """Render current scene"""
-        self.screen.fill(SPACE_BLUE)
-        if self.current_state in self.scenes:
-            self.scenes[self.current_state].render(self.screen)
\ No newline at end of file
+        """Render current scene; returns the changed rects, or None if the whole screen changed"""
+        scene = self.scenes.get(self.current_state)
+        drawables = scene.get_drawables() if scene else None
+        if drawables is None:
+            self.screen.fill(SPACE_BLUE)
+            if scene:
+                scene.render(self.screen)
+            self.debug_overlay.render(self.screen)
+            self.renderer.painted_directly()
+            self.frame_rects = None
+            self.frame_on_output = False
+        else:
+            drawables += self.debug_overlay.get_drawables()
+            self.frame_rects = self.renderer.render(self.screen, scene.get_background(), drawables)
+            self.frame_on_output = self.renderer.draws_to_output
+        return self.frame_rects
+    
+    def present(self):
+        """Push the last rendered frame to the display"""
+        if self.display:
+            self.display.present(self.frame_rects, self.frame_on_output)
+        elif self.frame_rects is None:
+            pygame.display.flip()
+        elif self.frame_rects:
+            pygame.display.update(self.frame_rects)
+    
+    def finish_frame(self, had_input, work_ms=None, dt_ms=None):
+        """Feed the frame's cost and the time since the last one to the quality governor and pace the next frame"""
+        if work_ms is not None:
+            self.quality.record(work_ms, dt_ms)
+        scene = self.scenes.get(self.current_state)
+        animating = had_input or scene is None or scene.animating
+        self.frame_scheduler.end_frame(self.current_state, animating, self.frame_rects != [])
+    
+    def shutdown(self):
+        """Persist player progress before the game exits"""
+        self.player_data.flush()
+        self.save_progress(force_snapshot=True)
+        self.save_system.close()
+        self.sound_manager.shutdown()
+        self.question_scheduler.save()
+        # Keep the sprites built this session for the next start
+        assets = get_asset_cache()
+        if assets is not None:
+            assets.flush()
+        if self.network_client:
+            self.network_client.close()
+        if self.leaderboard_client:
+            self.leaderboard_client.close()
\ No newline at end of file
@@ -0,0 +1 @@
+# Networking package
\ No newline at end of file
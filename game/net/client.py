@@ -0,0 +1,155 @@
+"""Game client for the classroom server, with snapshot interpolation"""
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.net.protocol import DEFAULT_PORT, MAX_MESSAGE_BYTES, apply_delta, decode, encode
+from game.utils.geometry import wrapped_delta
+
+# Render this far behind the newest snapshot so there is always a pair to blend
+INTERPOLATION_DELAY = 0.1
+SNAPSHOT_HISTORY = 32
+
+
+def parse_address(address, default_port=DEFAULT_PORT):
+    """Split 'host[:port]'"""
+    host, _, port = address.partition(':')
+    return host or 'localhost', int(port) if port else default_port
+
+
+class NetworkClient:
+    """Connects on a background thread; the game thread only touches queues and locked state"""
+
+    def __init__(self, host='localhost', port=DEFAULT_PORT, name='Space Explorer',
+                 interpolation_delay=INTERPOLATION_DELAY):
+        self.host = host
+        self.port = port
+        self.name = name
+        self.interpolation_delay = interpolation_delay
+
+        self.player_entity = None
+        self.connected = False
+        self.error = None
+        self.events = queue.Queue()
+
+        self.lock = threading.Lock()
+        self.world = {}
+        self.history = deque(maxlen=SNAPSHOT_HISTORY)
+        self.clock_offset = None
+
+        self.loop = None
+        self.writer = None
+        self.last_keys = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        try:
+            self.loop.run_until_complete(self.session())
+        except (OSError, ConnectionError, ValueError, asyncio.LimitOverrunError) as e:
+            # readline() raises ValueError for a line over the limit; report it like a dropped connection
+            self.error = str(e) or type(e).__name__
+        finally:
+            self.connected = False
+            self.loop.close()
+
+    async def session(self):
+        reader, self.writer = await asyncio.open_connection(self.host, self.port,
+                                                            limit=MAX_MESSAGE_BYTES)
+        self.writer.write(encode({'type': 'join', 'name': self.name}))
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = decode(line)
+            if message:
+                self.handle_message(message)
+
+    def handle_message(self, message):
+        kind = message.get('type')
+        if kind == 'welcome':
+            self.player_entity = message['entity']
+            self.connected = True
+        elif kind == 'snapshot':
+            received = time.monotonic()
+            with self.lock:
+                # Keep the largest server-minus-local offset; network delay only ever lowers it
+                offset = message['t'] - received
+                if self.clock_offset is None or offset > self.clock_offset:
+                    self.clock_offset = offset
+                self.world = apply_delta(self.world, message.get('set', {}), message.get('del', []))
+                self.history.append((message['t'], self.world))
+        elif kind == 'event':
+            self.events.put(message['event'])
+
+    def send(self, message):
+        """Send from the game thread without blocking it"""
+        if self.loop and self.writer and self.connected:
+            self.loop.call_soon_threadsafe(self.writer.write, encode(message))
+
+    def send_input(self, keys):
+        """Send movement keys when they change"""
+        if keys != self.last_keys:
+            self.last_keys = dict(keys)
+            self.send({'type': 'input', 'keys': self.last_keys})
+
+    def send_action(self, action):
+        self.send({'type': 'action', 'action': action})
+
+    def poll_events(self):
+        """Gameplay events from the server since the last call"""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def latest_state(self, entity_id):
+        with self.lock:
+            return self.world.get(entity_id)
+
+    def interpolated_entities(self):
+        """Entity states blended between the two snapshots around the render time"""
+        with self.lock:
+            if not self.history or self.clock_offset is None:
+                return {}
+            render_time = time.monotonic() + self.clock_offset - self.interpolation_delay
+            older = newer = None
+            for snapshot in reversed(self.history):
+                if snapshot[0] <= render_time:
+                    older = snapshot
+                    break
+                newer = snapshot
+            if older is None:
+                return dict(self.history[0][1])
+            if newer is None:
+                return dict(older[1])
+
+        span = newer[0] - older[0]
+        blend = (render_time - older[0]) / span if span > 0 else 1.0
+        entities = {}
+        for entity_id, state in newer[1].items():
+            previous = older[1].get(entity_id)
+            if previous is None:
+                entities[entity_id] = state
+                continue
+            # Blend along the shortest path so wrapping at the screen edge doesn't streak
+            dx = wrapped_delta(previous['x'], state['x'], SCREEN_WIDTH)
+            dy = wrapped_delta(previous['y'], state['y'], SCREEN_HEIGHT)
+            blended = dict(state)
+            blended['x'] = previous['x'] + dx * blend
+            blended['y'] = previous['y'] + dy * blend
+            entities[entity_id] = blended
+        return entities
+
+    def close(self):
+        if self.loop and self.writer:
+            self.loop.call_soon_threadsafe(self.writer.close)
@@ -0,0 +1,249 @@
+"""Class-wide leaderboard service ranking players by knowledge points"""
+import argparse
+import asyncio
+import json
+import os
+from array import array
+
+from game.constants import DATA_DIR
+from game.net.protocol import MAX_MESSAGE_BYTES, decode, encode
+
+DEFAULT_LEADERBOARD_PORT = 7778
+# Scores are counted in buckets of this many points; higher scores share the top bucket
+BUCKET_WIDTH = 10
+BUCKET_COUNT = 1 << 16
+SNAPSHOT_INTERVAL = 10.0
+MAX_TOP = 100
+MAX_NAME_LENGTH = 24
+MAX_ID_LENGTH = 64
+
+
+def int_field(message, key, default):
+    """Read an integer field from a client message, or None if it isn't one"""
+    try:
+        return int(message.get(key, default))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class ScoreIndex:
+    """Order statistics over player scores.
+
+    A Fenwick tree counts players per score bucket, so the number of players
+    above any score and the bucket holding the n-th best player are both
+    O(log buckets). Each bucket keeps its own few players for exact ordering.
+    """
+
+    def __init__(self, bucket_width=BUCKET_WIDTH, bucket_count=BUCKET_COUNT):
+        self.bucket_width = bucket_width
+        self.bucket_count = bucket_count
+        self.tree = array('q', bytes(8 * (bucket_count + 1)))
+        self.buckets = {}
+        self.scores = {}
+
+    def __len__(self):
+        return len(self.scores)
+
+    def bucket_of(self, score):
+        return min(max(score, 0) // self.bucket_width, self.bucket_count - 1)
+
+    def add_count(self, bucket, amount):
+        i = bucket + 1
+        tree = self.tree
+        while i <= self.bucket_count:
+            tree[i] += amount
+            i += i & -i
+
+    def count_through(self, bucket):
+        """Players in buckets 0..bucket"""
+        i = bucket + 1
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def find_bucket(self, count):
+        """Lowest bucket whose running count reaches count"""
+        position = 0
+        step = 1 << (self.bucket_count.bit_length() - 1)
+        tree = self.tree
+        while step:
+            nxt = position + step
+            if nxt <= self.bucket_count and tree[nxt] < count:
+                position = nxt
+                count -= tree[nxt]
+            step >>= 1
+        return position
+
+    def set_score(self, player, score):
+        """Insert or move a player; O(log buckets)"""
+        old = self.scores.get(player)
+        if old == score:
+            return
+        if old is not None:
+            bucket = self.bucket_of(old)
+            members = self.buckets[bucket]
+            del members[player]
+            if not members:
+                del self.buckets[bucket]
+            self.add_count(bucket, -1)
+        bucket = self.bucket_of(score)
+        self.buckets.setdefault(bucket, {})[player] = score
+        self.add_count(bucket, 1)
+        self.scores[player] = score
+
+    def remove(self, player):
+        score = self.scores.pop(player, None)
+        if score is None:
+            return
+        bucket = self.bucket_of(score)
+        members = self.buckets[bucket]
+        del members[player]
+        if not members:
+            del self.buckets[bucket]
+        self.add_count(bucket, -1)
+
+    def rank(self, player):
+        """1-based rank of a player, or None; ties share the best rank"""
+        score = self.scores.get(player)
+        if score is None:
+            return None
+        bucket = self.bucket_of(score)
+        above = len(self.scores) - self.count_through(bucket)
+        above += sum(1 for other in self.buckets[bucket].values() if other > score)
+        return above + 1
+
+    def top(self, k):
+        """The k best [player, score] pairs, best first"""
+        result = []
+        total = len(self.scores)
+        while len(result) < k and len(result) < total:
+            bucket = self.find_bucket(total - len(result))
+            members = sorted(self.buckets[bucket].items(), key=lambda item: (-item[1], item[0]))
+            result.extend([player, score] for player, score in members)
+        return result[:k]
+
+
+class LeaderboardService:
+    """Takes score updates over TCP and answers rank queries from memory.
+
+    Players are keyed by the id each install generates once, so classmates
+    who keep the default name still get a row each; the name is only shown.
+    """
+
+    def __init__(self, host='0.0.0.0', port=DEFAULT_LEADERBOARD_PORT, path=None):
+        self.host = host
+        self.port = port
+        self.path = path or os.path.join(DATA_DIR, 'leaderboard.json')
+        self.index = ScoreIndex()
+        self.names = {}
+        self.dirty = False
+        self.updates = 0
+        self.server = None
+
+    def load(self):
+        """Restore the last snapshot, if any"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        scores = snapshot.get('scores', {})
+        # Version 1 snapshots were keyed by name, which then doubles as the id
+        names = snapshot.get('names', {player: player for player in scores})
+        for player, score in scores.items():
+            self.index.set_score(player, int(score))
+            self.names[player] = names.get(player, player)
+
+    def write_snapshot(self, scores, names):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 2, 'scores': scores, 'names': names}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    async def snapshot_loop(self):
+        """Write the board to disk every few seconds while it is changing"""
+        while True:
+            await asyncio.sleep(SNAPSHOT_INTERVAL)
+            await self.snapshot()
+
+    async def snapshot(self):
+        if self.dirty:
+            self.dirty = False
+            await asyncio.to_thread(self.write_snapshot, dict(self.index.scores), dict(self.names))
+
+    async def start(self):
+        self.load()
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                 limit=MAX_MESSAGE_BYTES)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Flokapp leaderboard on {self.host}:{self.port} with {len(self.index)} players")
+        try:
+            await self.snapshot_loop()
+        finally:
+            await self.snapshot()
+
+    def handle_message(self, message):
+        """Apply one message; returns a reply or None. Malformed messages are ignored"""
+        kind = message.get('type')
+        player = str(message.get('id', ''))[:MAX_ID_LENGTH]
+        if kind == 'score' and player:
+            score = int_field(message, 'score', 0)
+            if score is None:
+                return None
+            name = str(message.get('name', ''))[:MAX_NAME_LENGTH]
+            self.index.set_score(player, score)
+            self.names[player] = name or player[:MAX_NAME_LENGTH]
+            self.dirty = True
+            self.updates += 1
+        elif kind == 'query':
+            k = int_field(message, 'k', 10)
+            if k is None:
+                return None
+            k = min(max(k, 0), MAX_TOP)
+            top = [[player_id, self.names[player_id], score] for player_id, score in self.index.top(k)]
+            return {'type': 'board', 'top': top, 'rank': self.index.rank(player),
+                    'score': self.index.scores.get(player), 'total': len(self.index)}
+        return None
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = decode(line)
+                if not message:
+                    continue
+                reply = self.handle_message(message)
+                if reply:
+                    writer.write(encode(reply))
+                    await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flokapp classroom leaderboard")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=DEFAULT_LEADERBOARD_PORT)
+    parser.add_argument('--path', help="Snapshot file (default: in the Flokapp data directory)")
+    args = parser.parse_args(argv)
+    service = LeaderboardService(args.host, args.port, args.path)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Background connection from the game to the leaderboard service"""
+import os
+import socket
+import threading
+import uuid
+
+from game.constants import DATA_DIR
+from game.net.protocol import decode, encode
+
+POLL_INTERVAL = 1.0
+RECONNECT_DELAY = 5.0
+PLAYER_ID_PATH = os.path.join(DATA_DIR, 'player_id')
+
+
+def load_player_id(path=PLAYER_ID_PATH):
+    """This install's leaderboard id, created on first use"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            player_id = f.read().strip()
+        if player_id:
+            return player_id
+    except OSError:
+        pass
+    player_id = uuid.uuid4().hex
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(player_id)
+    except OSError:
+        pass
+    return player_id
+
+
+class LeaderboardClient:
+    """Pushes this player's score and keeps the latest board for the UI.
+
+    Only the newest score is sent, so a burst of point changes costs one
+    update. All socket work happens on a daemon thread.
+    """
+
+    def __init__(self, host, port, name, player_id=None, top=10):
+        self.host = host
+        self.port = port
+        self.name = name
+        self.player_id = player_id or load_player_id()
+        self.top = top
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.score = None
+        self.score_changed = False
+        self.board = None
+        self.connected = False
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def submit(self, score):
+        """Queue a score update; sent on the next wake-up"""
+        with self.lock:
+            self.score = score
+            self.score_changed = True
+        self.wake.set()
+
+    def get_board(self):
+        """Latest {'top', 'rank', 'score', 'total'} reply, or None; top rows are [id, name, score]"""
+        with self.lock:
+            return self.board
+
+    def run(self):
+        while self.running:
+            try:
+                with socket.create_connection((self.host, self.port), timeout=RECONNECT_DELAY) as sock:
+                    self.connected = True
+                    self.session(sock)
+            except OSError:
+                pass
+            self.connected = False
+            if self.running:
+                self.wake.wait(RECONNECT_DELAY)
+                self.wake.clear()
+
+    def session(self, sock):
+        stream = sock.makefile('rb')
+        # A restarted service may have lost our score, so always resend it first
+        self.score_changed = True
+        while self.running:
+            with self.lock:
+                score = self.score if self.score_changed else None
+                self.score_changed = False
+            if score is not None:
+                sock.sendall(encode({'type': 'score', 'id': self.player_id, 'name': self.name,
+                                     'score': score}))
+            sock.sendall(encode({'type': 'query', 'id': self.player_id, 'k': self.top}))
+            line = stream.readline()
+            if not line:
+                return
+            reply = decode(line)
+            if reply and reply.get('type') == 'board':
+                with self.lock:
+                    self.board = reply
+            self.wake.wait(POLL_INTERVAL)
+            self.wake.clear()
+
+    def close(self):
+        self.running = False
+        self.wake.set()
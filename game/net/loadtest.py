@@ -0,0 +1,67 @@
+"""Connect many headless bots to a classroom server and report bandwidth"""
+import argparse
+import asyncio
+import random
+import time
+
+from game.net.protocol import DEFAULT_PORT, MAX_MESSAGE_BYTES, apply_delta, decode, encode
+
+KEYS = ('up', 'down', 'left', 'right')
+
+
+async def run_bot(host, port, index, duration, totals):
+    """Wander randomly, scanning now and then, while counting snapshot traffic"""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE_BYTES)
+    writer.write(encode({'type': 'join', 'name': f"Bot {index}"}))
+    rng = random.Random(index)
+    world = {}
+    deadline = time.monotonic() + duration
+    next_input = 0.0
+    while time.monotonic() < deadline:
+        now = time.monotonic()
+        if now >= next_input:
+            keys = {key: rng.random() < 0.3 for key in KEYS}
+            writer.write(encode({'type': 'input', 'keys': keys}))
+            if rng.random() < 0.2:
+                writer.write(encode({'type': 'action', 'action': 'scan'}))
+            next_input = now + rng.uniform(0.2, 1.0)
+        try:
+            line = await asyncio.wait_for(reader.readline(), 0.1)
+        except asyncio.TimeoutError:
+            continue
+        if not line:
+            break
+        totals['bytes'] += len(line)
+        message = decode(line)
+        if message and message.get('type') == 'snapshot':
+            totals['snapshots'] += 1
+            world = apply_delta(world, message['set'], message['del'])
+            totals['entities'] += len(world)
+    writer.close()
+
+
+async def run(host, port, clients, duration):
+    totals = {'bytes': 0, 'snapshots': 0, 'entities': 0}
+    await asyncio.gather(*(run_bot(host, port, i, duration, totals) for i in range(clients)))
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flokapp server load test")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--clients', type=int, default=30)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    totals = asyncio.run(run(args.host, args.port, args.clients, args.duration))
+    snapshots = max(1, totals['snapshots'])
+    per_client = totals['bytes'] / args.clients / args.duration
+    print(f"{args.clients} clients for {args.duration:.0f}s: {totals['snapshots']} snapshots, "
+          f"{per_client / 1024:.1f} KiB/s per client, "
+          f"{totals['bytes'] / snapshots:.0f} bytes and {totals['entities'] / snapshots:.1f} "
+          f"entities per snapshot")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Wire format and snapshot delta compression for classroom multiplayer"""
+import json
+
+DEFAULT_PORT = 7777
+DEFAULT_TICK_RATE = 20
+# Entities further than this (in pixels, with screen wrap) are not sent to a client
+INTEREST_RADIUS = 450
+# Reading or writing more than this in one line means something is wrong
+MAX_MESSAGE_BYTES = 1 << 20
+
+
+def encode(message):
+    """Encode a message as one line of compact JSON"""
+    return (json.dumps(message, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def decode(line):
+    """Decode one line; returns None for garbage"""
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def diff_snapshot(baseline, current):
+    """Delta between two {entity_id: {field: value}} snapshots.
+
+    New entities are sent whole, existing ones only with changed fields, and
+    entities that left the client's view are listed in 'del'.
+    """
+    changed = {}
+    for entity_id, state in current.items():
+        old = baseline.get(entity_id)
+        if old is None:
+            changed[entity_id] = state
+            continue
+        fields = {key: value for key, value in state.items() if old.get(key) != value}
+        if fields:
+            changed[entity_id] = fields
+    removed = [entity_id for entity_id in baseline if entity_id not in current]
+    return changed, removed
+
+
+def apply_delta(baseline, changed, removed):
+    """Apply a delta from diff_snapshot to a snapshot, returning a new snapshot"""
+    snapshot = dict(baseline)
+    for entity_id in removed:
+        snapshot.pop(entity_id, None)
+    for entity_id, fields in changed.items():
+        state = dict(snapshot.get(entity_id, {}))
+        state.update(fields)
+        snapshot[entity_id] = state
+    return snapshot
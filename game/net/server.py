@@ -0,0 +1,254 @@
+"""Authoritative asyncio server hosting a shared GameScene world for a classroom"""
+import argparse
+import asyncio
+import math
+import time
+
+from game.constants import *
+from game.entities.asteroid import ASTEROID, spawn_asteroids
+from game.entities.planet import Planet
+from game.entities.space_station import SpaceStation
+from game.net.protocol import (DEFAULT_PORT, DEFAULT_TICK_RATE, INTEREST_RADIUS,
+                               MAX_MESSAGE_BYTES, decode, diff_snapshot, encode)
+from game.scenes.game_scene import PLANET_LAYOUT, STATION_LAYOUT
+from game.utils import ecs
+from game.utils.ecs import World
+from game.utils.geometry import wrapped_delta
+from game.utils.rng import RNGStreams
+
+PLAYER_SPEED = 200
+PLAYER_RADIUS = 15
+SCAN_RANGE = 80
+# Skip snapshots to clients whose socket buffer is backing up
+MAX_PENDING_BYTES = 64 * 1024
+
+
+class SharedWorld:
+    """The same planets, asteroids and station as GameScene, shared by all players"""
+
+    def __init__(self, seed=None):
+        self.rng = RNGStreams(seed)
+        self.world = World()
+        self.planets = [Planet(d['pos'][0], d['pos'][1], d['name'], d['color'], world=self.world)
+                        for d in PLANET_LAYOUT]
+        self.asteroids = spawn_asteroids(self.rng.stream('asteroids'), self.planets, world=self.world)
+        x, y = STATION_LAYOUT['pos']
+        self.station = SpaceStation(x, y, STATION_LAYOUT['name'], self.world)
+        self.players = {}
+        self.next_player_id = 1
+
+    def add_player(self, name):
+        player_id = self.next_player_id
+        self.next_player_id += 1
+        spawn = self.rng.stream('spawns')
+        self.players[player_id] = {
+            'name': name[:24] or f"Explorer {player_id}",
+            'x': float(spawn.randint(0, SCREEN_WIDTH - 1)),
+            'y': float(spawn.randint(0, SCREEN_HEIGHT - 1)),
+            'keys': {'up': False, 'down': False, 'left': False, 'right': False},
+            'points': 0,
+            'docked': False
+        }
+        return player_id
+
+    def remove_player(self, player_id):
+        self.players.pop(player_id, None)
+
+    def set_input(self, player_id, keys):
+        player = self.players.get(player_id)
+        if player:
+            for key in player['keys']:
+                player['keys'][key] = bool(keys.get(key, False))
+
+    def step(self, dt):
+        """Advance the world; returns [(player_id, event)] for things that happened"""
+        events = []
+        ecs.move(self.world, dt)
+        ecs.spin(self.world, dt)
+        ecs.wrap(self.world)
+
+        for player_id, player in self.players.items():
+            keys = player['keys']
+            dx = (keys['right'] - keys['left']) * PLAYER_SPEED * dt
+            dy = (keys['down'] - keys['up']) * PLAYER_SPEED * dt
+            player['x'] = (player['x'] + dx) % SCREEN_WIDTH
+            player['y'] = (player['y'] + dy) % SCREEN_HEIGHT
+
+            if not player['docked']:
+                distance = math.hypot(player['x'] - self.station.x, player['y'] - self.station.y)
+                if distance < self.station.radius + PLAYER_RADIUS + 20:
+                    player['docked'] = True
+                    player['points'] += 100
+                    result = self.station.dock()
+                    events.append((player_id, {'kind': 'dock', 'crew': result['crew'][:2],
+                                               'message': result['message']}))
+        return events
+
+    def scan(self, player_id):
+        """Scan the first unscanned asteroid in range of a player"""
+        player = self.players.get(player_id)
+        if not player:
+            return None
+        for entity in ecs.within(self.world, ASTEROID, player['x'], player['y'], SCAN_RANGE, add_radius=False):
+            asteroid = self.world.view(entity)
+            result = asteroid.scan()
+            if result:
+                player['points'] += 25
+                return dict(result, kind='scan', x=asteroid.x, y=asteroid.y)
+        return None
+
+    def entity_states(self):
+        """Quantized state of every entity, keyed by entity id"""
+        states = {}
+        for player_id, player in self.players.items():
+            states[f"p{player_id}"] = {'k': 'p', 'x': int(player['x']), 'y': int(player['y']),
+                                       'n': player['name'], 'kp': player['points']}
+        for index, asteroid in enumerate(self.asteroids):
+            states[f"a{index}"] = {'k': 'a', 'x': int(asteroid.x), 'y': int(asteroid.y),
+                                   'r': asteroid.radius, 'rot': round(asteroid.rotation, 1),
+                                   'm': asteroid.mineral_type, 'sc': asteroid.scanned}
+        states['s0'] = {'k': 's', 'x': int(self.station.x), 'y': int(self.station.y),
+                        'rot': round(self.station.rotation, 2), 'n': self.station.name,
+                        'd': self.station.docked}
+        return states
+
+    def visible_to(self, player_id, states):
+        """Interest management: only entities near this player"""
+        player = self.players.get(player_id)
+        if not player:
+            return {}
+        visible = {}
+        limit = INTEREST_RADIUS * INTEREST_RADIUS
+        for entity_id, state in states.items():
+            dx = wrapped_delta(player['x'], state['x'], SCREEN_WIDTH)
+            dy = wrapped_delta(player['y'], state['y'], SCREEN_HEIGHT)
+            if dx * dx + dy * dy <= limit or entity_id == f"p{player_id}":
+                visible[entity_id] = state
+        return visible
+
+
+class ClientConnection:
+    def __init__(self, player_id, writer):
+        self.player_id = player_id
+        self.writer = writer
+        self.baseline = {}
+
+    def send(self, message):
+        self.writer.write(encode(message))
+
+    @property
+    def backed_up(self):
+        transport = self.writer.transport
+        return transport.get_write_buffer_size() > MAX_PENDING_BYTES
+
+
+class GameServer:
+    """Runs the world at a fixed tick rate and streams delta snapshots to clients"""
+
+    def __init__(self, host='0.0.0.0', port=DEFAULT_PORT, tick_rate=DEFAULT_TICK_RATE, seed=None):
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.world = SharedWorld(seed)
+        self.clients = {}
+        self.tick = 0
+        self.stats = {'bytes_sent': 0, 'snapshots_sent': 0, 'snapshots_skipped': 0, 'tick_ms': 0.0}
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                 limit=MAX_MESSAGE_BYTES)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Flokapp server on {self.host}:{self.port} at {self.tick_rate} Hz")
+        await self.run_ticks()
+
+    async def run_ticks(self):
+        """Fixed-rate simulation loop that catches up rather than drifting"""
+        interval = 1.0 / self.tick_rate
+        next_tick = time.perf_counter()
+        while True:
+            started = time.perf_counter()
+            self.step(interval)
+            self.stats['tick_ms'] = (time.perf_counter() - started) * 1000
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    def step(self, dt):
+        self.tick += 1
+        for player_id, event in self.world.step(dt):
+            client = self.clients.get(player_id)
+            if client:
+                client.send({'type': 'event', 'event': event})
+        self.broadcast_snapshots()
+
+    def broadcast_snapshots(self):
+        states = self.world.entity_states()
+        now = time.monotonic()
+        for client in list(self.clients.values()):
+            if client.backed_up:
+                # Keep the old baseline; the next delta will include these changes
+                self.stats['snapshots_skipped'] += 1
+                continue
+            visible = self.world.visible_to(client.player_id, states)
+            changed, removed = diff_snapshot(client.baseline, visible)
+            client.baseline = visible
+            data = encode({'type': 'snapshot', 'tick': self.tick, 't': now,
+                           'set': changed, 'del': removed})
+            client.writer.write(data)
+            self.stats['bytes_sent'] += len(data)
+            self.stats['snapshots_sent'] += 1
+
+    async def handle_client(self, reader, writer):
+        player_id = None
+        try:
+            first = decode(await reader.readline())
+            if not first or first.get('type') != 'join':
+                return
+            player_id = self.world.add_player(str(first.get('name', '')))
+            client = ClientConnection(player_id, writer)
+            client.send({'type': 'welcome', 'id': player_id, 'entity': f"p{player_id}",
+                         'tick_rate': self.tick_rate})
+            self.clients[player_id] = client
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = decode(line)
+                if not message:
+                    continue
+                if message.get('type') == 'input':
+                    self.world.set_input(player_id, message.get('keys', {}))
+                elif message.get('type') == 'action' and message.get('action') == 'scan':
+                    result = self.world.scan(player_id)
+                    if result:
+                        client.send({'type': 'event', 'event': result})
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            if player_id is not None:
+                self.clients.pop(player_id, None)
+                self.world.remove_player(player_id)
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flokapp classroom server")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--tick-rate', type=int, default=DEFAULT_TICK_RATE)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+    server = GameServer(args.host, args.port, args.tick_rate, args.seed)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
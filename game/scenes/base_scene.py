@@ -3,11 +3,20 @@ import pygame
 from game.constants import *
 
 class BaseScene:
+    # Whether the scene needs the full frame rate even when there is no input;
+    # scenes that only change in response to input can let the frame rate drop
+    animating = True
+    # How tense the background music is here, from 0 (calm) to 1
+    music_intensity = 0.3
+    
     def __init__(self, game_manager):
         self.game_manager = game_manager
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
+        self.star_rng = game_manager.rng.stream(f"stars.{type(self).__name__}")
+        self.background = None
+        self.star_count = game_manager.settings['star_count']
     
     def on_enter(self):
         """Called when entering this scene"""
@@ -25,12 +34,44 @@ class BaseScene:
         """Render scene to screen"""
         pass
     
+    def get_drawables(self):
+        """(key, surface, rect) for everything on screen, back to front.
+        
+        Scenes that return a list are composited over get_background() with
+        only changed regions repainted; None means render() paints the whole
+        screen every frame.
+        """
+        return None
+    
+    def apply_quality(self, settings):
+        """Follow the quality governor's current tier; the player's settings set the top of each range"""
+        star_count = int(self.game_manager.settings['star_count'] * settings['stars'])
+        if star_count != self.star_count:
+            self.star_count = star_count
+            self.background = None
+    
+    def get_background(self):
+        """Space backdrop with a fixed starfield, built once"""
+        if self.background is None:
+            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.background.fill(SPACE_BLUE)
+            self.draw_stars(self.background)
+        return self.background
+    
+    def get_save_state(self):
+        """Return JSON-serializable progress to persist, or None"""
+        return None
+    
+    def load_save_state(self, state):
+        """Restore progress returned by get_save_state"""
+        pass
+    
     def draw_stars(self, screen):
         """Draw animated starfield background"""
-        import random
-        for _ in range(100):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            brightness = random.randint(100, 255)
+        rng = self.star_rng
+        for _ in range(self.star_count):
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT)
+            brightness = rng.randint(100, 255)
             color = (brightness, brightness, brightness)
             pygame.draw.circle(screen, color, (x, y), 1)
\ No newline at end of file
@@ -1,43 +1,89 @@
 """Main gameplay scene"""
 import pygame
-import random
 from game.scenes.base_scene import BaseScene
 from game.constants import *
 from game.entities.player import Player
-from game.entities.planet import Planet
-from game.entities.asteroid import Asteroid
-from game.entities.space_station import SpaceStation
+from game.entities.planet import GLOW_RING, PLANET, Planet, planet_fact
+from game.entities.asteroid import ASTEROID, Asteroid, spawn_asteroids
+from game.entities.space_station import STATION, SpaceStation
 from game.entities.mission_objective import MissionObjective
 from game.ui.dialog_system import DialogSystem
+from game.ui.widgets import Label, ProgressBar, TextList, WidgetLayer
+from game.utils import ecs
+from game.utils.asset_cache import not_baked
+from game.utils.ecs import VISIBLE, World
+from game.utils.event_bus import AsteroidScanned, PlanetVisited, QuestionAnswered, StationDocked
+from game.utils.navigation import Autopilot
+from game.utils.sprite_cache import get_font, get_sprite_cache
+
+# Shared with the multiplayer server so everyone explores the same map
+PLANET_LAYOUT = [
+    {'name': 'Earth', 'color': PLANET_COLORS['earth'], 'pos': (200, 200)},
+    {'name': 'Mars', 'color': PLANET_COLORS['mars'], 'pos': (600, 300)},
+    {'name': 'Moon', 'color': PLANET_COLORS['moon'], 'pos': (800, 150)},
+    {'name': 'Jupiter', 'color': PLANET_COLORS['jupiter'], 'pos': (400, 500)}
+]
+STATION_LAYOUT = {'name': 'International Space Station', 'pos': (300, 600)}
+# Snap to the server's position when local prediction drifts further than this
+RECONCILE_DISTANCE = 40
+# Stat rewards for each gameplay event
+EVENT_STATS = {
+    PlanetVisited: {'knowledge_points': 50, 'planets_visited': 1},
+    AsteroidScanned: {'knowledge_points': 25, 'asteroids_scanned': 1},
+    StationDocked: {'knowledge_points': 100, 'iss_docked': 1}
+}
+EVENT_SOUNDS = {PlanetVisited: 'success', AsteroidScanned: 'scan', StationDocked: 'dock'}
 
 class GameScene(BaseScene):
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.player.autopilot = Autopilot()
+        # Planets, asteroids and stations are stored here and updated a whole kind at a time
+        self.world = World()
         self.planets = []
         self.asteroids = []
         self.space_stations = []
         self.mission_progress = 0
-        self.mission_text = ""
         self.current_objective = None
         self.dialog_system = DialogSystem()
         self.resources_collected = 0
+        # Set from an answer until its result dialog replaces the question at the end of the frame
+        self.answer_pending = False
+        
+        # Set when playing on a classroom server; the server owns asteroids and stations
+        self.network = game_manager.network_client
+        self.remote_players = []
+        
+        # HUD widgets keep their surfaces until the value they show changes
+        self.build_hud()
+        self.game_manager.player_data.subscribe('knowledge_points', self.on_points_changed)
         
         # Import particle system
         from game.utils.particle_system import ParticleSystem
-        self.particle_system = ParticleSystem()
+        self.particle_system = ParticleSystem(game_manager.rng.stream('particles.game'))
         
         self.create_planets()
         self.create_asteroids()
         self.create_space_stations()
+        
+        # Gameplay only emits events; stats, sound, particles and dialogs react at the end of the frame
+        events = game_manager.events
+        for event_type in (PlanetVisited, AsteroidScanned, StationDocked, QuestionAnswered):
+            events.subscribe(event_type, self.record_event_stats)
+            events.subscribe(event_type, self.play_event_sound)
+            events.subscribe(event_type, self.add_event_particles)
+            events.subscribe(event_type, self.show_event_dialog)
     
     def on_enter(self):
         """Initialize mission when entering game scene"""
         mission = self.game_manager.player_data.get('current_mission')
         if mission:
-            self.mission_text = f"Mission: {mission['name']}"
+            self.mission_label.set_text(f"Mission: {mission['name']}")
             self.mission_progress = 0
-            self.current_objective = MissionObjective(mission['type'])
+            self.current_objective = MissionObjective(
+                mission['type'], scheduler=self.game_manager.question_scheduler
+            )
             
             # Show mission briefing
             self.dialog_system.show_dialog({
@@ -46,36 +92,92 @@ class GameScene(BaseScene):
                 'content': f"{mission['description']} Your objective is to explore, learn, and complete educational challenges to advance humanity's understanding of space."
             })
     
+    def build_hud(self):
+        """Create the HUD widgets"""
+        self.hud = WidgetLayer()
+        self.mission_label = self.hud.add(Label(self.font_medium, pos=(10, 10)))
+        self.hud.add(ProgressBar((300, 20), pos=(10, 50), value=lambda: self.mission_progress))
+        self.points_label = self.hud.add(Label(
+            self.font_small, f"Knowledge Points: {self.game_manager.player_data['knowledge_points']}",
+            YELLOW, pos=(10, 80)
+        ))
+        self.hud.add(Label(self.font_small, color=CYAN, pos=(10, 110),
+                           value=lambda: self.resources_collected, fmt="Resources Scanned: {}"))
+        self.autopilot_label = self.hud.add(Label(self.font_small, color=GREEN, pos=(10, 140),
+                                                  value=self.autopilot_status))
+        self.hud.add(TextList(self.font_small, [
+            "WASD - Move spacecraft",
+            "SPACE - Scan objects/Answer questions",
+            "T - Autopilot to next planet",
+            "Approach planets & stations",
+            "ESC - Return to menu"
+        ], pos=(SCREEN_WIDTH - 250, 10)))
+    
+    def apply_quality(self, settings):
+        """Scale particle bursts and planet glow with the quality tier"""
+        super().apply_quality(settings)
+        self.particle_system.emission_scale = settings['particles']
+        self.particle_system.max_particles = self.game_manager.settings['particle_cap']
+        self.world.fill(PLANET, GLOW_RING, settings['glow_rings'])
+    
+    music_intensity = 0.5
+    
+    @property
+    def animating(self):
+        """Flying needs every frame; a dialog over a quiet scene can wait for input"""
+        return bool(self.network or not self.dialog_system.active or self.particle_system.particles)
+    
+    def autopilot_status(self):
+        """Autopilot target with this frame's planning cost"""
+        autopilot = self.player.autopilot
+        if not autopilot.active:
+            return ""
+        return f"Autopilot: {autopilot.target_name} ({autopilot.stats['expansions']} nodes, {autopilot.stats['plan_ms']:.1f} ms)"
+    
+    def on_points_changed(self, key, old, new):
+        """Update the knowledge points label"""
+        self.points_label.set_text(f"Knowledge Points: {new}")
+    
+    def get_save_state(self):
+        """Persist visited planets, scanned asteroids and docked stations"""
+        return {
+            'visited_planets': [p.name for p in self.planets if p.visited],
+            'scanned_asteroids': [i for i, a in enumerate(self.asteroids) if a.scanned],
+            # Indices only mean something for the layout they were saved with
+            'asteroid_seed': self.game_manager.world_seed,
+            'docked_stations': [s.name for s in self.space_stations if s.docked],
+            'resources_collected': self.resources_collected
+        }
+    
+    def load_save_state(self, state):
+        """Restore exploration progress"""
+        visited = set(state.get('visited_planets', []))
+        for planet in self.planets:
+            planet.visited = planet.name in visited
+        if state.get('asteroid_seed') == self.game_manager.world_seed:
+            for index in state.get('scanned_asteroids', []):
+                if index < len(self.asteroids):
+                    self.asteroids[index].scanned = True
+        docked = set(state.get('docked_stations', []))
+        for station in self.space_stations:
+            station.docked = station.name in docked
+        self.resources_collected = state.get('resources_collected', 0)
+    
     def create_planets(self):
         """Create planets for exploration"""
-        planet_data = [
-            {'name': 'Earth', 'color': PLANET_COLORS['earth'], 'pos': (200, 200)},
-            {'name': 'Mars', 'color': PLANET_COLORS['mars'], 'pos': (600, 300)},
-            {'name': 'Moon', 'color': PLANET_COLORS['moon'], 'pos': (800, 150)},
-            {'name': 'Jupiter', 'color': PLANET_COLORS['jupiter'], 'pos': (400, 500)}
-        ]
-        
-        for data in planet_data:
-            planet = Planet(data['pos'][0], data['pos'][1], data['name'], data['color'])
+        for data in PLANET_LAYOUT:
+            planet = Planet(data['pos'][0], data['pos'][1], data['name'], data['color'], world=self.world)
             self.planets.append(planet)
     
     def create_asteroids(self):
         """Create asteroids for resource collection"""
-        for _ in range(8):
-            x = random.randint(100, SCREEN_WIDTH - 100)
-            y = random.randint(100, SCREEN_HEIGHT - 100)
-            # Avoid spawning too close to planets
-            too_close = any(
-                ((x - p.x)**2 + (y - p.y)**2)**0.5 < 100 
-                for p in self.planets
-            )
-            if not too_close:
-                asteroid = Asteroid(x, y)
-                self.asteroids.append(asteroid)
+        rng = self.game_manager.world_rng.stream('asteroids')
+        self.asteroids = spawn_asteroids(rng, self.planets, world=self.world)
     
     def create_space_stations(self):
         """Create space stations for collaboration missions"""
-        station = SpaceStation(300, 600, "International Space Station")
+        x, y = STATION_LAYOUT['pos']
+        station = SpaceStation(x, y, STATION_LAYOUT['name'], self.world)
         self.space_stations.append(station)
     
     def handle_event(self, event):
@@ -85,37 +187,44 @@ class GameScene(BaseScene):
             
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
+                self.game_manager.question_scheduler.save()
                 self.game_manager.change_state(MENU)
             elif event.key == pygame.K_SPACE:
                 self.scan_nearby_objects()
+            elif event.key == pygame.K_t:
+                self.travel_to_next_planet()
             elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
                 if self.current_objective and self.dialog_system.current_dialog:
-                    if self.dialog_system.current_dialog.get('type') == 'question':
+                    if self.dialog_system.current_dialog.get('type') == 'question' and not self.answer_pending:
                         answer_index = event.key - pygame.K_1
                         self.answer_question(answer_index)
         
         self.player.handle_event(event)
     
     def update(self, dt):
+        if self.player.autopilot.active:
+            obstacles = [a for a in self.asteroids if a.visible]
+            self.player.autopilot.update(self.player, obstacles)
         self.player.update(dt)
+        # Effects pan and fade relative to the ship
+        self.game_manager.sound_manager.listener = (self.player.x, self.player.y)
         
-        # Update asteroids
-        for asteroid in self.asteroids:
-            asteroid.update(dt)
-        
-        # Update space stations
-        for station in self.space_stations:
-            station.update(dt)
+        if self.network:
+            self.update_network()
+        else:
+            # Asteroids drift and wrap, asteroids and stations turn
+            ecs.move(self.world, dt)
+            ecs.spin(self.world, dt)
+            ecs.wrap(self.world)
         
         # Check interactions
-        for planet in self.planets:
-            if self.player.check_collision(planet):
-                self.interact_with_planet(planet)
+        player = self.player
+        for entity in ecs.within(self.world, PLANET, player.x, player.y, player.radius):
+            self.interact_with_planet(self.world.view(entity))
         
-        for station in self.space_stations:
-            distance = ((self.player.x - station.x)**2 + (self.player.y - station.y)**2)**0.5
-            if distance < station.radius + self.player.radius + 20:
-                self.interact_with_station(station)
+        if not self.network:
+            for entity in ecs.within(self.world, STATION, player.x, player.y, player.radius + 20):
+                self.interact_with_station(self.world.view(entity))
         
         # Update particle system
         self.particle_system.update(dt)
@@ -126,122 +235,187 @@ class GameScene(BaseScene):
         elif self.current_objective:
             self.mission_progress = self.current_objective.progress
     
+    def travel_to_next_planet(self):
+        """Engage the autopilot toward the nearest unvisited planet, or cancel it"""
+        autopilot = self.player.autopilot
+        if autopilot.active:
+            autopilot.cancel(self.player)
+            return
+        targets = [p for p in self.planets if not p.visited] or self.planets
+        target = min(targets, key=lambda p: (p.x - self.player.x)**2 + (p.y - self.player.y)**2)
+        obstacles = [a for a in self.asteroids if a.visible]
+        autopilot.engage(target.x, target.y, target.name, self.player, obstacles)
+    
+    def update_network(self):
+        """Send input, reconcile the local ship and mirror the server's world"""
+        network = self.network
+        network.send_input(self.player.keys)
+        
+        # The local ship moves immediately; correct it only if it drifts from the server
+        own = network.latest_state(network.player_entity) if network.player_entity else None
+        if own:
+            dx = own['x'] - self.player.x
+            dy = own['y'] - self.player.y
+            if dx * dx + dy * dy > RECONCILE_DISTANCE * RECONCILE_DISTANCE:
+                self.player.x, self.player.y = own['x'], own['y']
+        
+        self.remote_players = []
+        self.world.fill(ASTEROID, VISIBLE, False)
+        for entity_id, state in network.interpolated_entities().items():
+            kind = state.get('k')
+            if kind == 'p' and entity_id != network.player_entity:
+                self.remote_players.append(state)
+            elif kind == 'a':
+                index = int(entity_id[1:])
+                while index >= len(self.asteroids):
+                    # The server's seed may have spawned more asteroids than ours
+                    self.asteroids.append(Asteroid(state['x'], state['y'], self.game_manager.world_rng.stream('asteroids'), self.world))
+                asteroid = self.asteroids[index]
+                asteroid.x, asteroid.y = state['x'], state['y']
+                asteroid.radius, asteroid.rotation = state['r'], state['rot']
+                asteroid.mineral_type, asteroid.scanned = state['m'], state['sc']
+                asteroid.visible = True
+            elif kind == 's' and self.space_stations:
+                station = self.space_stations[0]
+                station.x, station.y = state['x'], state['y']
+                station.rotation, station.docked = state['rot'], state['d']
+        
+        for event in network.poll_events():
+            if event.get('kind') == 'scan':
+                self.on_remote_scan(event)
+            elif event.get('kind') == 'dock':
+                self.on_remote_dock(event)
+    
+    def on_remote_scan(self, scan_result):
+        """The server confirmed one of our scans"""
+        self.game_manager.events.emit(AsteroidScanned(scan_result['x'], scan_result['y'], scan_result['mineral'],
+                                                      scan_result['size'], scan_result['value']))
+    
+    def on_remote_dock(self, dock_result):
+        """The server docked us at the shared station"""
+        station = self.space_stations[0]
+        self.game_manager.events.emit(StationDocked(station.name, station.x, station.y,
+                                                    dock_result['message'], tuple(dock_result['crew'])))
+    
     def interact_with_planet(self, planet):
         """Handle planet interaction"""
         if not planet.visited:
             planet.visited = True
-            self.game_manager.player_data['knowledge_points'] += 50
-            self.game_manager.player_data['planets_visited'] += 1
-            
-            # Play success sound and add particles
-            self.game_manager.sound_manager.play_sound('success')
-            self.particle_system.add_explosion(planet.x, planet.y, planet.color)
-            
+            self.game_manager.events.emit(PlanetVisited(planet.name, planet.x, planet.y, planet.color))
+    
+    def record_event_stats(self, event):
+        """Stats subscriber: reward the player for what happened"""
+        if isinstance(event, QuestionAnswered):
+            if event.correct:
+                self.game_manager.add_stat('knowledge_points', 50)
+            return
+        if isinstance(event, AsteroidScanned):
+            self.resources_collected += 1
+        for key, amount in EVENT_STATS[type(event)].items():
+            self.game_manager.add_stat(key, amount)
+    
+    def play_event_sound(self, event):
+        """Audio subscriber"""
+        sounds = self.game_manager.sound_manager
+        if isinstance(event, QuestionAnswered):
+            sounds.play_sound('success' if event.correct else 'beep')
+        else:
+            sounds.play_sound(EVENT_SOUNDS[type(event)], (event.x, event.y))
+    
+    def add_event_particles(self, event):
+        """Particle subscriber"""
+        particles = self.particle_system
+        if isinstance(event, PlanetVisited):
+            particles.add_explosion(event.x, event.y, event.color)
+        elif isinstance(event, AsteroidScanned):
+            particles.add_scan_particles(event.x, event.y)
+        elif isinstance(event, StationDocked):
+            particles.add_warp_particles(event.x, event.y)
+        elif event.correct:
+            particles.add_success_particles(event.x, event.y)
+    
+    def show_event_dialog(self, event):
+        """Dialog subscriber: explain what happened"""
+        if isinstance(event, PlanetVisited):
             # Show educational content about the planet
             from game.data.nasa_facts import get_random_fact
-            fact = get_random_fact(planet.name)
-            
-            self.dialog_system.show_dialog({
-                'type': 'info',
-                'title': f'Exploring {planet.name}',
-                'content': f"Welcome to {planet.name}! {planet.get_fact()} Here's what NASA has discovered: {fact}"
-            })
+            fact = get_random_fact(event.name, self.game_manager.rng.stream('facts'))
+            dialog = {
+                'title': f'Exploring {event.name}',
+                'content': f"Welcome to {event.name}! {planet_fact(event.name)} Here's what NASA has discovered: {fact}"
+            }
+        elif isinstance(event, AsteroidScanned):
+            dialog = {
+                'title': 'Asteroid Scan Complete',
+                'content': f"Discovered {event.mineral} asteroid! Size: {event.size}, Value: {event.value} credits. This data helps NASA understand asteroid composition for future mining missions."
+            }
+        elif isinstance(event, StationDocked):
+            crew_list = "\n".join(event.crew[:2])  # Show first 2 crew members
+            if self.network:
+                closing = "Your classmates are exploring alongside you!"
+            else:
+                closing = "This collaboration represents humanity working together in space!"
+            dialog = {
+                'title': 'Space Station Docked',
+                'content': f"{event.message} You've connected with international crew members: {crew_list}. {closing}"
+            }
+        else:
+            self.answer_pending = False
+            dialog = {
+                'title': 'Answer Result',
+                'content': ("Correct! " if event.correct else "Incorrect. ") + event.explanation
+            }
+        dialog['type'] = 'info'
+        self.dialog_system.show_dialog(dialog)
     
-    def render(self, screen):
-        self.draw_stars(screen)
-        
-        # Draw planets
-        for planet in self.planets:
-            planet.render(screen)
-        
-        # Draw asteroids
-        for asteroid in self.asteroids:
-            asteroid.render(screen)
+    def get_drawables(self):
+        """Planets, asteroids, stations, ships, particles, HUD and dialog, back to front"""
+        drawables = ecs.drawables(self.world, Planet)
+        drawables += ecs.drawables(self.world, Asteroid)
+        drawables += ecs.drawables(self.world, SpaceStation)
         
-        # Draw space stations
-        for station in self.space_stations:
-            station.render(screen)
+        # Draw classmates
+        sprites = get_sprite_cache()
+        for i, state in enumerate(self.remote_players):
+            key = ('remote_player', state['n'], self.player.radius)
+            drawables.append((('remote_player', i), *sprites.place(key, build_remote_player_sprite, state['x'], state['y'])))
         
-        # Draw player
-        self.player.render(screen)
+        drawables.append((self.player, *self.player.get_sprite()))
         
         # Draw scan range indicator
         if pygame.key.get_pressed()[pygame.K_SPACE]:
-            pygame.draw.circle(screen, (0, 255, 0, 50), (int(self.player.x), int(self.player.y)), 80, 2)
+            drawables.append(('scan_range', *sprites.place(('scan_range', 80), build_scan_range_sprite,
+                                                           self.player.x, self.player.y)))
         
-        # Draw particle effects
-        if hasattr(self, 'particle_system'):
-            self.particle_system.render(screen)
+        drawables += self.particle_system.get_sprites()
         
         # Draw UI
-        self.draw_ui(screen)
-        
-        # Draw dialog system
-        self.dialog_system.render(screen)
-    
-    def draw_ui(self, screen):
-        """Draw game UI elements"""
-        # Mission info
-        mission_text = self.font_medium.render(self.mission_text, True, WHITE)
-        screen.blit(mission_text, (10, 10))
-        
-        # Progress bar
-        progress_rect = pygame.Rect(10, 50, 300, 20)
-        pygame.draw.rect(screen, WHITE, progress_rect, 2)
-        fill_width = int((self.mission_progress / 100) * 298)
-        fill_rect = pygame.Rect(11, 51, fill_width, 18)
-        pygame.draw.rect(screen, GREEN, fill_rect)
-        
-        # Knowledge points
-        points_text = self.font_small.render(
-            f"Knowledge Points: {self.game_manager.player_data['knowledge_points']}", 
-            True, YELLOW
-        )
-        screen.blit(points_text, (10, 80))
-        
-        # Resources collected
-        resources_text = self.font_small.render(
-            f"Resources Scanned: {self.resources_collected}", 
-            True, CYAN
-        )
-        screen.blit(resources_text, (10, 110))
-        
-        # Instructions
-        instructions = [
-            "WASD - Move spacecraft",
-            "SPACE - Scan objects/Answer questions",
-            "Approach planets & stations",
-            "ESC - Return to menu"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text = self.font_small.render(instruction, True, WHITE)
-            screen.blit(text, (SCREEN_WIDTH - 250, 10 + i * 25))
+        self.autopilot_label.set_visible(self.player.autopilot.active)
+        drawables += self.hud.get_drawables()
+        drawables += self.dialog_system.get_drawables()
+        return drawables
     
     def scan_nearby_objects(self):
         """Scan nearby asteroids and objects"""
         scan_range = 80
         scanned_something = False
         
-        for asteroid in self.asteroids:
-            distance = ((self.player.x - asteroid.x)**2 + (self.player.y - asteroid.y)**2)**0.5
-            if distance < scan_range:
+        if self.network:
+            # The server decides what was scanned; the result arrives as an event
+            for entity in ecs.within(self.world, ASTEROID, self.player.x, self.player.y, scan_range, add_radius=False):
+                asteroid = self.world.view(entity)
+                if asteroid.visible and not asteroid.scanned:
+                    self.network.send_action('scan')
+                    scanned_something = True
+                    break
+        else:
+            for entity in ecs.within(self.world, ASTEROID, self.player.x, self.player.y, scan_range, add_radius=False):
+                asteroid = self.world.view(entity)
                 scan_result = asteroid.scan()
                 if scan_result:
                     scanned_something = True
-                    self.resources_collected += 1
-                    self.game_manager.player_data['knowledge_points'] += 25
-                    self.game_manager.player_data['asteroids_scanned'] += 1
-                    
-                    # Play scan sound and add particles
-                    self.game_manager.sound_manager.play_sound('scan')
-                    self.particle_system.add_scan_particles(asteroid.x, asteroid.y)
-                    
-                    self.dialog_system.show_dialog({
-                        'type': 'info',
-                        'title': 'Asteroid Scan Complete',
-                        'content': f"Discovered {scan_result['mineral']} asteroid! Size: {scan_result['size']}, Value: {scan_result['value']} credits. This data helps NASA understand asteroid composition for future mining missions."
-                    })
+                    self.game_manager.events.emit(AsteroidScanned(asteroid.x, asteroid.y, scan_result['mineral'],
+                                                                  scan_result['size'], scan_result['value']))
                     break
         
         if not scanned_something:
@@ -257,37 +431,33 @@ class GameScene(BaseScene):
         """Process educational question answer"""
         if self.current_objective:
             is_correct, explanation = self.current_objective.answer_question(answer_index)
-            
-            if is_correct:
-                self.game_manager.player_data['knowledge_points'] += 50
-                result_text = "Correct! " + explanation
-                self.game_manager.sound_manager.play_sound('success')
-                self.particle_system.add_success_particles(self.player.x, self.player.y)
-            else:
-                result_text = "Incorrect. " + explanation
-                self.game_manager.sound_manager.play_sound('beep')
-            
-            self.dialog_system.show_dialog({
-                'type': 'info',
-                'title': 'Answer Result',
-                'content': result_text
-            })
+            self.answer_pending = True
+            self.game_manager.events.emit(QuestionAnswered(is_correct, explanation, self.player.x, self.player.y))
     
     def interact_with_station(self, station):
         """Handle space station interaction"""
         if not station.docked:
             dock_result = station.dock()
-            self.game_manager.player_data['knowledge_points'] += 100
-            self.game_manager.player_data['iss_docked'] += 1
-            
-            # Play docking sound and effects
-            self.game_manager.sound_manager.play_sound('dock')
-            self.particle_system.add_warp_particles(station.x, station.y)
-            
-            crew_list = "\n".join(dock_result['crew'][:2])  # Show first 2 crew members
-            
-            self.dialog_system.show_dialog({
-                'type': 'info',
-                'title': 'Space Station Docked',
-                'content': f"{dock_result['message']} You've connected with international crew members: {crew_list}. This collaboration represents humanity working together in space!"
-            })
\ No newline at end of file
+            self.game_manager.events.emit(StationDocked(station.name, station.x, station.y,
+                                                        dock_result['message'], dock_result['crew']))
+
+@not_baked
+def build_remote_player_sprite(key):
+    """Pre-render a classmate's ship with their name above it"""
+    _, name, radius = key
+    name_text = get_font(24).render(name, True, WHITE)
+    half_width = max(radius, name_text.get_width() // 2 + 1)
+    top = radius + 12 + name_text.get_height() // 2 + 1
+    surface = pygame.Surface((half_width * 2 + 1, top + radius + 1), pygame.SRCALPHA)
+    center = (half_width, top)
+    pygame.draw.circle(surface, PURPLE, center, radius)
+    pygame.draw.circle(surface, WHITE, center, radius, 2)
+    surface.blit(name_text, name_text.get_rect(center=(center[0], center[1] - radius - 12)))
+    return surface, center
+
+def build_scan_range_sprite(key):
+    """Pre-render the scan range ring"""
+    _, radius = key
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (0, 255, 0), (radius, radius), radius, 2)
+    return surface, (radius, radius)
\ No newline at end of file
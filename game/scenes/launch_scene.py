@@ -4,6 +4,7 @@ from game.scenes.base_scene import BaseScene
 from game.constants import *
 from game.entities.rocket import Rocket
 from game.ui.dialog_system import DialogSystem
+from game.ui.widgets import Label, WidgetLayer
 
 class LaunchScene(BaseScene):
     def __init__(self, game_manager):
@@ -16,12 +17,32 @@ class LaunchScene(BaseScene):
         self.countdown_active = False
         self.mission_briefing_shown = False
         self.launch_successful = False
+        self.build_hud()
+        
+    def build_hud(self):
+        """Create the HUD widgets"""
+        self.hud = WidgetLayer()
+        self.mission_label = self.hud.add(Label(self.font_medium, pos=(10, 10)))
+        self.countdown_label = self.hud.add(Label(self.font_large, pos=(SCREEN_WIDTH // 2, 100), anchor='center'))
+        
+        # Rocket telemetry
+        self.telemetry_labels = [
+            self.hud.add(Label(self.font_small, color=CYAN, pos=(10, 50),
+                               value=lambda: self.rocket.get_altitude(), fmt="Altitude: {:.1f} km")),
+            self.hud.add(Label(self.font_small, color=GREEN, pos=(10, 75),
+                               value=lambda: self.rocket.get_mission_progress(), fmt="Mission Progress: {:.1f}%")),
+            self.hud.add(Label(self.font_small, pos=(10, 100),
+                               value=lambda: self.rocket.destination['name'], fmt="Destination: {}"))
+        ]
+        self.instruction_label = self.hud.add(Label(self.font_small, color=YELLOW,
+                                                    pos=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30), anchor='center'))
         
     def on_enter(self):
         """Initialize launch scene with current mission"""
         mission = self.game_manager.player_data.get('current_mission')
         if mission:
-            self.rocket = Rocket(self.launch_pad_x, self.launch_pad_y, mission['type'])
+            self.rocket = Rocket(self.launch_pad_x, self.launch_pad_y, mission['type'],
+                                 self.game_manager.rng.stream('rocket'))
             self.countdown = 10
             self.countdown_active = False
             self.mission_briefing_shown = False
@@ -61,6 +82,15 @@ class LaunchScene(BaseScene):
                 elif self.countdown <= 0 and not self.rocket.launched:
                     self.launch_rocket()
     
+    @property
+    def music_intensity(self):
+        """Builds through the countdown and peaks while waiting for ignition"""
+        if self.rocket and self.rocket.launched:
+            return 0.4 if self.launch_successful and self.rocket.is_mission_complete() else 0.8
+        if self.countdown_active:
+            return 0.6 + 0.4 * (1 - self.countdown / 10)
+        return 0.4
+    
     def start_countdown(self):
         """Start the launch countdown"""
         self.countdown_active = True
@@ -89,8 +119,8 @@ class LaunchScene(BaseScene):
     def show_mission_complete(self):
         """Show mission completion dialog"""
         mission = self.game_manager.player_data.get('current_mission')
-        self.game_manager.player_data['missions_completed'] += 1
-        self.game_manager.player_data['knowledge_points'] += mission.get('points', 100)
+        self.game_manager.add_stat('missions_completed', 1)
+        self.game_manager.add_stat('knowledge_points', mission.get('points', 100))
         
         content = f"Mission Complete!\n\n"
         content += f"Congratulations! You have successfully completed the {mission['name']} mission.\n\n"
@@ -164,37 +194,24 @@ class LaunchScene(BaseScene):
         """Draw launch UI elements"""
         # Mission info
         mission = self.game_manager.player_data.get('current_mission')
+        self.mission_label.set_visible(bool(mission))
         if mission:
-            mission_text = self.font_medium.render(f"Mission: {mission['name']}", True, WHITE)
-            screen.blit(mission_text, (10, 10))
+            self.mission_label.set_text(f"Mission: {mission['name']}")
         
         # Countdown
+        self.countdown_label.set_visible(self.countdown_active)
         if self.countdown_active:
             if self.countdown > 0:
-                countdown_text = self.font_large.render(f"T-{int(self.countdown + 1)}", True, RED)
-                countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-                screen.blit(countdown_text, countdown_rect)
+                self.countdown_label.set_text(f"T-{int(self.countdown + 1)}")
+                self.countdown_label.set_color(RED)
             else:
-                launch_text = self.font_large.render("LAUNCH!", True, GREEN)
-                launch_rect = launch_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-                screen.blit(launch_text, launch_rect)
+                self.countdown_label.set_text("LAUNCH!")
+                self.countdown_label.set_color(GREEN)
         
         # Rocket telemetry
-        if self.rocket and self.rocket.launched:
-            telemetry_y = 50
-            
-            # Altitude
-            altitude_text = self.font_small.render(f"Altitude: {self.rocket.get_altitude():.1f} km", True, CYAN)
-            screen.blit(altitude_text, (10, telemetry_y))
-            
-            # Mission progress
-            progress = self.rocket.get_mission_progress()
-            progress_text = self.font_small.render(f"Mission Progress: {progress:.1f}%", True, GREEN)
-            screen.blit(progress_text, (10, telemetry_y + 25))
-            
-            # Destination
-            dest_text = self.font_small.render(f"Destination: {self.rocket.destination['name']}", True, WHITE)
-            screen.blit(dest_text, (10, telemetry_y + 50))
+        launched = bool(self.rocket and self.rocket.launched)
+        for label in self.telemetry_labels:
+            label.set_visible(launched)
         
         # Instructions
         if not self.countdown_active and not self.rocket.launched:
@@ -203,7 +220,6 @@ class LaunchScene(BaseScene):
             instruction = "Press SPACE to LAUNCH!"
         else:
             instruction = "ESC - Return to mission select"
+        self.instruction_label.set_text(instruction)
         
-        inst_text = self.font_small.render(instruction, True, YELLOW)
-        inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-        screen.blit(inst_text, inst_rect)
\ No newline at end of file
+        self.hud.draw(screen)
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Live class leaderboard scene"""
+import pygame
+from game.scenes.base_scene import BaseScene
+from game.constants import *
+from game.ui.widgets import Label, WidgetLayer
+
+class LeaderboardScene(BaseScene):
+    animating = False
+    
+    def __init__(self, game_manager):
+        super().__init__(game_manager)
+        # Rows are re-rendered only when a new board arrives
+        self.shown_board = None
+        self.hud = WidgetLayer([
+            Label(self.font_large, "Class Leaderboard", CYAN, (SCREEN_WIDTH // 2, 80), anchor='center'),
+            Label(self.font_small, "ESC - Return to menu", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30), anchor='center')
+        ])
+        message = "Connecting to leaderboard..." if game_manager.leaderboard_client else "Start with --leaderboard HOST to join a class leaderboard"
+        self.message_label = Label(self.font_medium, message, WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), anchor='center')
+        self.rows = WidgetLayer()
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.game_manager.change_state(MENU)
+    
+    def build_rows(self, board):
+        """Create one set of labels per leaderboard row"""
+        own_id = self.game_manager.leaderboard_client.player_id
+        self.rows = WidgetLayer()
+        for i, (player_id, player, score) in enumerate(board['top']):
+            color = YELLOW if player_id == own_id else WHITE
+            y_pos = 150 + i * 45
+            self.rows.add(Label(self.font_medium, f"{i + 1}.", color, (200, y_pos)))
+            self.rows.add(Label(self.font_medium, player, color, (260, y_pos)))
+            self.rows.add(Label(self.font_medium, str(score), color, (SCREEN_WIDTH - 200, y_pos), anchor='topright'))
+        
+        # Own rank, even when outside the top rows
+        if board['rank']:
+            status = f"Your rank: {board['rank']} of {board['total']} ({board['score']} points)"
+        else:
+            status = f"{board['total']} explorers ranked"
+        self.rows.add(Label(self.font_medium, status, GREEN, (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 90), anchor='center'))
+        self.shown_board = board
+    
+    def get_drawables(self):
+        client = self.game_manager.leaderboard_client
+        board = client.get_board() if client else None
+        drawables = self.hud.get_drawables()
+        if board is None:
+            drawables.append((self.message_label, self.message_label.get_surface(), self.message_label.rect))
+        else:
+            if board is not self.shown_board:
+                self.build_rows(board)
+            drawables += self.rows.get_drawables()
+        return drawables
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Loading scene shown while the game starts up on a worker thread"""
+import pygame
+from game.constants import *
+from game.ui.widgets import Label, ProgressBar, WidgetLayer
+
+class LoadingScene:
+    """Title, progress bar and current step of a BootLoader.
+    
+    It runs before the GameManager exists, so unlike the other scenes it
+    needs nothing but fonts and the loader it reports on, and repaints the
+    whole screen itself.
+    """
+    
+    def __init__(self, loader):
+        self.loader = loader
+        center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        self.hud = WidgetLayer()
+        self.hud.add(Label(pygame.font.Font(None, 64), "Flokapp", CYAN, (center_x, center_y - 80), anchor='center'))
+        self.hud.add(ProgressBar((400, 24), CYAN, WHITE, (center_x, center_y), anchor='center',
+                                 value=lambda: loader.fraction * 100))
+        self.hud.add(Label(pygame.font.Font(None, 24), pos=(center_x, center_y + 40), anchor='center',
+                           value=lambda: loader.label, fmt="{}..."))
+    
+    def render(self, screen):
+        screen.fill(SPACE_BLUE)
+        self.hud.draw(screen)
\ No newline at end of file
@@ -2,20 +2,27 @@
 import pygame
 from game.scenes.base_scene import BaseScene
 from game.constants import *
+from game.ui.widgets import Label, WidgetLayer
+from game.utils.sprite_cache import get_sprite_cache
 
 class MenuScene(BaseScene):
+    # The bobbing title is decorative, so the menu runs at a reduced frame rate
+    animating = False
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.menu_options = [
             "Start Mission",
             "Solar System Explorer",
             "Achievements", 
+            "Leaderboard",
             "Mission Archive",
             "Settings",
             "Exit"
         ]
         self.selected_option = 0
         self.title_animation = 0
+        self.build_hud()
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -33,44 +40,51 @@ class MenuScene(BaseScene):
             self.game_manager.change_state('solar_system')
         elif self.selected_option == 2:  # Achievements
             self.game_manager.change_state('achievements')
-        elif self.selected_option == 3:  # Mission Archive
+        elif self.selected_option == 3:  # Leaderboard
+            self.game_manager.change_state('leaderboard')
+        elif self.selected_option == 4:  # Mission Archive
             pass  # TODO: Implement mission archive
-        elif self.selected_option == 4:  # Settings
-            pass  # TODO: Implement settings
-        elif self.selected_option == 5:  # Exit
-            pygame.quit()
-            exit()
+        elif self.selected_option == 5:  # Settings
+            self.game_manager.change_state('settings')
+        elif self.selected_option == 6:  # Exit
+            # Let the main loop shut down cleanly so progress is saved
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
     
     def update(self, dt):
         self.title_animation += dt * 2
     
-    def render(self, screen):
-        self.draw_stars(screen)
-        
-        # Draw animated title
+    def build_hud(self):
+        """Create the title and option labels once"""
+        self.hud = WidgetLayer()
+        self.title_label = self.hud.add(Label(self.font_large, "🚀 FLOKAPP", CYAN, (SCREEN_WIDTH // 2, 150), anchor='center'))
+        self.subtitle_label = self.hud.add(Label(self.font_medium, "Connecting Minds to Conquer Space", WHITE,
+                                                 (SCREEN_WIDTH // 2, 210), anchor='center'))
+        self.option_labels = [
+            self.hud.add(Label(self.font_medium, option, WHITE, (SCREEN_WIDTH // 2, 350 + i * 50), anchor='center'))
+            for i, option in enumerate(self.menu_options)
+        ]
+        self.hud.add(Label(self.font_small, "Use ↑↓ to navigate, ENTER to select", WHITE,
+                           (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50), anchor='center'))
+    
+    def get_drawables(self):
+        # Animate the title by moving its cached surface
         title_y = 150 + int(10 * pygame.math.Vector2(0, 1).rotate(self.title_animation * 50).y)
-        title_text = self.font_large.render("🚀 FLOKAPP", True, CYAN)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, title_y))
-        screen.blit(title_text, title_rect)
-        
-        # Draw subtitle
-        subtitle = self.font_medium.render("Connecting Minds to Conquer Space", True, WHITE)
-        subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, title_y + 60))
-        screen.blit(subtitle, subtitle_rect)
+        self.title_label.set_pos((SCREEN_WIDTH // 2, title_y))
+        self.subtitle_label.set_pos((SCREEN_WIDTH // 2, title_y + 60))
         
-        # Draw menu options
-        for i, option in enumerate(self.menu_options):
-            color = YELLOW if i == self.selected_option else WHITE
-            text = self.font_medium.render(option, True, color)
-            y_pos = 350 + i * 50
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-            screen.blit(text, text_rect)
-            
-            # Draw selection indicator
-            if i == self.selected_option:
-                pygame.draw.rect(screen, YELLOW, text_rect, 2)
+        for i, label in enumerate(self.option_labels):
+            label.set_color(YELLOW if i == self.selected_option else WHITE)
+        drawables = self.hud.get_drawables()
         
-        # Draw instructions
-        instructions = self.font_small.render("Use ↑↓ to navigate, ENTER to select", True, WHITE)
-        inst_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        screen.blit(instructions, inst_rect)
\ No newline at end of file
+        # Draw selection indicator
+        selected = self.option_labels[self.selected_option].rect
+        outline = get_sprite_cache().get(('outline', selected.size, YELLOW, 2), build_outline_sprite)[0]
+        drawables.append(('selection', outline, selected))
+        return drawables
+
+def build_outline_sprite(key):
+    """Pre-render a rectangle outline"""
+    _, size, color, width = key
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, surface.get_rect(), width)
+    return surface, (0, 0)
\ No newline at end of file
@@ -2,8 +2,11 @@
 import pygame
 from game.scenes.base_scene import BaseScene
 from game.constants import *
+from game.ui.widgets import Card, Label, WidgetLayer
 
 class MissionScene(BaseScene):
+    animating = False
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.missions = [
@@ -37,6 +40,7 @@ class MissionScene(BaseScene):
             }
         ]
         self.selected_mission = 0
+        self.build_hud()
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -55,38 +59,26 @@ class MissionScene(BaseScene):
         # Go to launch scene first, then to gameplay
         self.game_manager.change_state('launch')
     
-    def render(self, screen):
-        self.draw_stars(screen)
-        
-        # Title
-        title = self.font_large.render("Mission Selection", True, CYAN)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        screen.blit(title, title_rect)
+    def build_hud(self):
+        """Create the mission cards once; selection only restyles them"""
+        self.hud = WidgetLayer()
+        self.hud.add(Label(self.font_large, "Mission Selection", CYAN, (SCREEN_WIDTH // 2, 80), anchor='center'))
         
-        # Mission list
+        self.cards = []
         for i, mission in enumerate(self.missions):
             y_pos = 180 + i * 120
-            
-            # Mission card background
-            card_rect = pygame.Rect(100, y_pos - 10, SCREEN_WIDTH - 200, 100)
-            color = BLUE if i == self.selected_mission else (20, 30, 50)
-            pygame.draw.rect(screen, color, card_rect)
-            pygame.draw.rect(screen, WHITE, card_rect, 2)
-            
-            # Mission details
-            name_text = self.font_medium.render(mission['name'], True, WHITE)
-            screen.blit(name_text, (120, y_pos))
-            
-            desc_text = self.font_small.render(mission['description'], True, WHITE)
-            screen.blit(desc_text, (120, y_pos + 30))
-            
-            diff_text = self.font_small.render(f"Difficulty: {mission['difficulty']}", True, YELLOW)
-            screen.blit(diff_text, (120, y_pos + 50))
-            
-            points_text = self.font_small.render(f"Points: {mission['points']}", True, GREEN)
-            screen.blit(points_text, (120, y_pos + 70))
+            card = Card((SCREEN_WIDTH - 200, 100), pos=(100, y_pos - 10), children=[
+                Label(self.font_medium, mission['name'], WHITE, (20, 10)),
+                Label(self.font_small, mission['description'], WHITE, (20, 40)),
+                Label(self.font_small, f"Difficulty: {mission['difficulty']}", YELLOW, (20, 60)),
+                Label(self.font_small, f"Points: {mission['points']}", GREEN, (20, 80))
+            ])
+            self.cards.append(self.hud.add(card))
         
-        # Instructions
-        instructions = self.font_small.render("↑↓ Navigate | ENTER Start Mission | ESC Back", True, WHITE)
-        inst_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-        screen.blit(instructions, inst_rect)
\ No newline at end of file
+        self.hud.add(Label(self.font_small, "↑↓ Navigate | ENTER Start Mission | ESC Back", WHITE,
+                           (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30), anchor='center'))
+    
+    def get_drawables(self):
+        for i, card in enumerate(self.cards):
+            card.set_style(fill=BLUE if i == self.selected_mission else (20, 30, 50))
+        return self.hud.get_drawables()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Settings scene: performance presets and individual settings"""
+import pygame
+from game.scenes.base_scene import BaseScene
+from game.constants import *
+from game.ui.widgets import Label, WidgetLayer
+from game.utils.settings import CUSTOM
+
+# (label, setting key or None for the preset row, value format)
+ROWS = [
+    ("Preset", None, None),
+    ("Resolution", 'resolution', lambda value: f"{value[0]} x {value[1]}"),
+    ("Render scale", 'render_scale', lambda value: f"{value:g}x"),
+    ("Sharp text", 'native_text', lambda value: "On" if value else "Off"),
+    ("FPS cap", 'fps', lambda value: f"{value} fps"),
+    ("VSync", 'vsync', lambda value: "On" if value else "Off"),
+    ("Particle cap", 'particle_cap', str),
+    ("Stars", 'star_count', str),
+    ("Audio buffer", 'audio_buffer', lambda value: f"{value} samples"),
+    ("Sample rate", 'sample_rate', lambda value: f"{value} Hz")
+]
+
+class SettingsScene(BaseScene):
+    animating = False
+    
+    def __init__(self, game_manager):
+        super().__init__(game_manager)
+        self.selected_row = 0
+        self.build_hud()
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.selected_row = (self.selected_row - 1) % len(ROWS)
+            elif event.key == pygame.K_DOWN:
+                self.selected_row = (self.selected_row + 1) % len(ROWS)
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                self.change_selected(1 if event.key == pygame.K_RIGHT else -1)
+            elif event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
+                if self.game_manager.persist:
+                    self.game_manager.settings.save()
+                self.game_manager.change_state(MENU)
+    
+    def change_selected(self, step):
+        """Step the selected row's value and apply it straight away"""
+        settings = self.game_manager.settings
+        key = ROWS[self.selected_row][1]
+        if key is None:
+            settings.cycle_preset(step)
+        else:
+            settings.cycle(key, step)
+        self.game_manager.apply_settings()
+        self.game_manager.sound_manager.play_sound('menu_select')
+    
+    def build_hud(self):
+        """Create a name and a value label per row"""
+        self.hud = WidgetLayer()
+        self.hud.add(Label(self.font_large, "Settings", CYAN, (SCREEN_WIDTH // 2, 80), anchor='center'))
+        self.name_labels = []
+        self.value_labels = []
+        for i, (name, _, _) in enumerate(ROWS):
+            y_pos = 150 + i * 45
+            self.name_labels.append(self.hud.add(Label(self.font_medium, name, WHITE, (250, y_pos))))
+            self.value_labels.append(self.hud.add(Label(self.font_medium, pos=(SCREEN_WIDTH - 250, y_pos), anchor='topright')))
+        self.hud.add(Label(self.font_small, "UP/DOWN to choose, LEFT/RIGHT to change, ESC to save and return", WHITE,
+                           (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50), anchor='center'))
+    
+    def get_drawables(self):
+        settings = self.game_manager.settings
+        for i, (_, key, fmt) in enumerate(ROWS):
+            color = YELLOW if i == self.selected_row else WHITE
+            self.name_labels[i].set_color(color)
+            if key is None:
+                # Values changed one by one may no longer match any preset
+                text = settings.preset
+                value_color = (150, 150, 150) if text == CUSTOM else color
+            else:
+                text = fmt(settings[key])
+                value_color = color
+            self.value_labels[i].set_text(text)
+            self.value_labels[i].set_color(value_color)
+        return self.hud.get_drawables()
\ No newline at end of file
@@ -1,12 +1,26 @@
 """Solar system exploration scene with realistic orbital mechanics"""
 import pygame
+import threading
+import time
+from datetime import date, timedelta
 from game.scenes.base_scene import BaseScene
 from game.constants import *
 from game.entities.player import Player
 from game.entities.solar_system import SolarSystem
 from game.ui.dialog_system import DialogSystem
+from game.ui.widgets import Label, TextList, WidgetLayer
+from game.data.space_weather import CMETimeline
+from game.data.content_store import get_content_store
+
+# Simulated space-weather seconds per real second at time scale 1.0
+WEATHER_SECONDS_PER_SECOND = 6 * 3600
+WEATHER_WINDOW_DAYS = 30
+# Seconds to wait before asking for a window again after a failed request
+WEATHER_RETRY_DELAY = 30.0
 
 class SolarSystemScene(BaseScene):
+    music_intensity = 0.1
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.player = Player(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2)
@@ -18,6 +32,112 @@ class SolarSystemScene(BaseScene):
         self.selected_planet = None
         self.data_collected = {}
         
+        # DONKI CME timeline, filled in window by window on a background thread
+        self.space_weather = CMETimeline()
+        self.weather_time = None
+        self.weather_fetching = False
+        self.next_weather_window = date(2024, 1, 1)
+        self.weather_retry_timer = 0.0
+        
+        # HUD widgets keep their surfaces until the value they show changes
+        self.build_hud()
+        self.game_manager.player_data.subscribe('knowledge_points', self.on_points_changed)
+    
+    def build_hud(self):
+        """Create the HUD widgets"""
+        self.hud = WidgetLayer()
+        self.points_label = self.hud.add(Label(
+            self.font_medium, f"Knowledge Points: {self.game_manager.player_data['knowledge_points']}",
+            YELLOW, pos=(10, 10)
+        ))
+        self.hud.add(TextList(self.font_small, color=CYAN, pos=(10, 50), value=lambda: [
+            f"{data_type.title()} Data: {amount:.0f}" for data_type, amount in self.data_collected.items()
+        ]))
+        self.weather_label = self.hud.add(Label(self.font_small, color=(255, 140, 0), pos=(10, SCREEN_HEIGHT - 55),
+                                                value=self.weather_status))
+        self.hud.add(TextList(self.font_small, [
+            "WASD - Move spacecraft",
+            "SPACE - Interact with objects", 
+            "+/- - Change time scale",
+            "Z/X - Zoom in/out",
+            "ESC - Return to menu"
+        ], pos=(SCREEN_WIDTH - 250, 10), spacing=20))
+        self.hud.add(Label(self.font_small, pos=(SCREEN_WIDTH - 100, SCREEN_HEIGHT - 30),
+                           value=lambda: self.zoom, fmt="Zoom: {:.1f}x"))
+    
+    def weather_status(self):
+        """Space weather clock line"""
+        if self.weather_time is None:
+            return ""
+        in_flight = len(self.space_weather.active_at(self.weather_time))
+        stamp = time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(self.weather_time))
+        return f"Space Weather {stamp} - CMEs in flight: {in_flight}"
+    
+    def on_points_changed(self, key, old, new):
+        """Update the knowledge points label"""
+        self.points_label.set_text(f"Knowledge Points: {new}")
+    
+    def get_save_state(self):
+        """Persist visited planets and satellite data"""
+        return {
+            'visited_planets': [p.name for p in self.solar_system.planets if p.visited],
+            'data_collected': dict(self.data_collected)
+        }
+    
+    def load_save_state(self, state):
+        """Restore exploration progress"""
+        visited = set(state.get('visited_planets', []))
+        for planet in self.solar_system.planets:
+            planet.visited = planet.name in visited
+        self.data_collected = dict(state.get('data_collected', {}))
+    
+    def on_enter(self):
+        """Start fetching space weather the first time the scene opens"""
+        if not self.space_weather.fetched_windows and not self.weather_fetching:
+            self.request_weather_window()
+    
+    def request_weather_window(self):
+        """Fetch the next DONKI window without blocking the frame loop"""
+        start = self.next_weather_window
+        end = start + timedelta(days=WEATHER_WINDOW_DAYS - 1)
+        self.next_weather_window = end + timedelta(days=1)
+        self.weather_fetching = True
+        
+        def worker():
+            added = None
+            try:
+                added = self.space_weather.fetch_window(start.isoformat(), end.isoformat())
+            finally:
+                if added is None:
+                    # Ask for the same window again once the retry delay is up
+                    self.next_weather_window = start
+                    self.weather_retry_timer = WEATHER_RETRY_DELAY
+                self.weather_fetching = False
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def update_space_weather(self, dt):
+        """Advance the space-weather clock with the solar system time warp"""
+        self.weather_retry_timer -= dt
+        can_fetch = (not self.weather_fetching and self.weather_retry_timer <= 0
+                     and self.next_weather_window <= date.today())
+        span = self.space_weather.time_span()
+        if not span:
+            # Nothing indexed yet: the last request failed or its window had no CMEs
+            if can_fetch:
+                self.request_weather_window()
+            return
+        if self.weather_time is None:
+            self.weather_time = span[0]
+        
+        self.weather_time += dt * self.solar_system.time_scale * WEATHER_SECONDS_PER_SECOND
+        if self.weather_time > span[1] and not self.weather_fetching:
+            if can_fetch:
+                # Append the following window; the index is extended in place
+                self.request_weather_window()
+            else:
+                self.weather_time = span[0]
+        
     def handle_event(self, event):
         # Dialog system gets priority
         if self.dialog_system.handle_event(event):
@@ -57,49 +177,10 @@ class SolarSystemScene(BaseScene):
         """Handle planet interaction with detailed information"""
         if not planet.visited:
             planet.visited = True
-            self.game_manager.player_data['knowledge_points'] += 100
+            self.game_manager.add_stat('knowledge_points', 100)
         
         # Detailed planet information
-        planet_info = {
-            'Mercury': {
-                'distance_from_sun': '58 million km',
-                'day_length': '59 Earth days',
-                'temperature': '-173°C to 427°C',
-                'interesting_fact': 'Mercury has no atmosphere and extreme temperature variations.'
-            },
-            'Venus': {
-                'distance_from_sun': '108 million km', 
-                'day_length': '243 Earth days',
-                'temperature': '462°C (hottest planet)',
-                'interesting_fact': 'Venus rotates backwards and has a thick, toxic atmosphere.'
-            },
-            'Earth': {
-                'distance_from_sun': '150 million km',
-                'day_length': '24 hours',
-                'temperature': '-89°C to 58°C',
-                'interesting_fact': 'The only known planet with life, protected by a magnetic field.'
-            },
-            'Mars': {
-                'distance_from_sun': '228 million km',
-                'day_length': '24.6 hours', 
-                'temperature': '-87°C to -5°C',
-                'interesting_fact': 'Mars has the largest volcano and canyon in the solar system.'
-            },
-            'Jupiter': {
-                'distance_from_sun': '778 million km',
-                'day_length': '9.9 hours',
-                'temperature': '-108°C',
-                'interesting_fact': 'Jupiter is a gas giant with over 80 moons and protects inner planets.'
-            },
-            'Saturn': {
-                'distance_from_sun': '1.4 billion km',
-                'day_length': '10.7 hours',
-                'temperature': '-139°C', 
-                'interesting_fact': 'Saturn has spectacular rings made of ice and rock particles.'
-            }
-        }
-        
-        info = planet_info.get(planet.name, {})
+        info = get_content_store().get_planet_info(planet.name)
         content = f"Welcome to {planet.name}!\n\n"
         content += f"Distance from Sun: {info.get('distance_from_sun', 'Unknown')}\n"
         content += f"Day Length: {info.get('day_length', 'Unknown')}\n"
@@ -121,7 +202,7 @@ class SolarSystemScene(BaseScene):
                 self.data_collected[satellite_type] = 0
             
             self.data_collected[satellite_type] += data['amount']
-            self.game_manager.player_data['knowledge_points'] += 50
+            self.game_manager.add_stat('knowledge_points', 50)
             
             content = f"Connected to {data['name']}!\n\n"
             content += f"Function: {data['function']}\n\n"
@@ -137,6 +218,7 @@ class SolarSystemScene(BaseScene):
     def update(self, dt):
         self.player.update(dt)
         self.solar_system.update(dt)
+        self.update_space_weather(dt)
         
         # Update camera to follow player (with some offset)
         target_camera_x = -self.player.x + SCREEN_WIDTH // 2
@@ -157,6 +239,10 @@ class SolarSystemScene(BaseScene):
         
         # Draw solar system
         self.solar_system.render(camera_surface)
+        if self.weather_time is not None:
+            self.solar_system.render_cmes(camera_surface, 
+                                          self.space_weather.active_at(self.weather_time), 
+                                          self.weather_time)
         
         # Draw player
         self.player.render(camera_surface)
@@ -181,36 +267,5 @@ class SolarSystemScene(BaseScene):
     
     def draw_ui(self, screen):
         """Draw UI elements"""
-        # Knowledge points
-        points_text = self.font_medium.render(
-            f"Knowledge Points: {self.game_manager.player_data['knowledge_points']}", 
-            True, YELLOW
-        )
-        screen.blit(points_text, (10, 10))
-        
-        # Data collected summary
-        y_offset = 50
-        for data_type, amount in self.data_collected.items():
-            data_text = self.font_small.render(
-                f"{data_type.title()} Data: {amount:.0f}", 
-                True, CYAN
-            )
-            screen.blit(data_text, (10, y_offset))
-            y_offset += 25
-        
-        # Controls
-        controls = [
-            "WASD - Move spacecraft",
-            "SPACE - Interact with objects", 
-            "+/- - Change time scale",
-            "Z/X - Zoom in/out",
-            "ESC - Return to menu"
-        ]
-        
-        for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, WHITE)
-            screen.blit(text, (SCREEN_WIDTH - 250, 10 + i * 20))
-        
-        # Zoom indicator
-        zoom_text = self.font_small.render(f"Zoom: {self.zoom:.1f}x", True, WHITE)
-        screen.blit(zoom_text, (SCREEN_WIDTH - 100, SCREEN_HEIGHT - 30))
\ No newline at end of file
+        self.weather_label.set_visible(self.weather_time is not None)
+        self.hud.draw(screen)
\ No newline at end of file
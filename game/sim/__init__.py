@@ -0,0 +1 @@
+# Headless simulation package
\ No newline at end of file
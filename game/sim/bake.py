@@ -0,0 +1,49 @@
+"""Pre-bake the asset cache: every generated sound and the sprites the game draws"""
+import argparse
+import os
+
+from game.constants import *
+from game.sim import farm
+from game.utils.asset_cache import ASSET_DIR, AssetCache, set_asset_cache
+from game.utils.settings import OPTIONS
+
+# Scenes whose sprites the bake draws besides the ones bot sessions reach
+BAKE_SCENES = [MENU, 'solar_system']
+BAKE_POLICIES = ['greedy', 'scanner']
+
+
+def bake(directory, seconds, seed):
+    """Generate every sound at every sample rate, then tour the scenes and play a bot session per mission"""
+    farm.init_worker()
+    cache = AssetCache(directory)
+    set_asset_cache(cache)
+    from game.game_manager import GameManager
+    game_manager = GameManager(farm._screen, seed=seed, persist=False)
+    sound_manager = game_manager.sound_manager
+    for sample_rate in OPTIONS['sample_rate']:
+        sound_manager.reinit(sample_rate, sound_manager.mixer_settings[1])
+    # Rotating sprites pass through every angle bucket within a minute or so
+    for state in BAKE_SCENES:
+        game_manager.change_state(state)
+        for _ in range(int(seconds / farm.STEP)):
+            game_manager.update(farm.STEP)
+            game_manager.render()
+    for task in farm.make_tasks(BAKE_POLICIES, 4, seed, seconds, True, 0.75):
+        farm.run_episode(task)
+    cache.flush()
+    return cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-bake Flokapp's generated sounds and sprites")
+    parser.add_argument('--dir', default=ASSET_DIR, help="Cache directory (default: in the Flokapp data directory)")
+    parser.add_argument('--seconds', type=float, default=60.0, help="Simulated seconds per scene and bot session")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+    cache = bake(args.dir, args.seconds, args.seed)
+    size = sum(os.path.getsize(os.path.join(args.dir, name)) for name in os.listdir(args.dir))
+    print(f"{cache.report()}, {size / (1024 * 1024):.1f} MB in {args.dir}")
+
+
+if __name__ == '__main__':
+    main()
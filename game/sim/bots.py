@@ -0,0 +1,132 @@
+"""Bot policies that play GameScene through the same key events as a player"""
+import math
+import pygame
+
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.utils.geometry import wrapped_delta
+
+MOVE_KEYS = {'up': pygame.K_w, 'down': pygame.K_s, 'left': pygame.K_a, 'right': pygame.K_d}
+ANSWER_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4)
+# Bots press a key at most this often, roughly a quick human
+REACTION_TIME = 0.25
+ARRIVE_DISTANCE = 10
+
+
+def key_event(kind, key):
+    return pygame.event.Event(kind, key=key, mod=0, unicode='')
+
+
+class BotPolicy:
+    """Base policy: reads the scene, answers questions with some accuracy"""
+
+    name = 'idle'
+
+    def __init__(self, rng, accuracy=0.75):
+        self.rng = rng
+        self.accuracy = accuracy
+        self.cooldown = 0.0
+        self.answers = 0
+        self.correct_answers = 0
+
+    def steer(self, scene, desired):
+        """Key events that turn the ship's held keys into the desired ones"""
+        events = []
+        for direction, key in MOVE_KEYS.items():
+            held = scene.player.keys[direction]
+            if desired.get(direction, False) and not held:
+                events.append(key_event(pygame.KEYDOWN, key))
+            elif held and not desired.get(direction, False):
+                events.append(key_event(pygame.KEYUP, key))
+        return events
+
+    def toward(self, scene, x, y):
+        """Movement keys that head for a point by the shortest wrapped path"""
+        dx = wrapped_delta(scene.player.x, x, SCREEN_WIDTH)
+        dy = wrapped_delta(scene.player.y, y, SCREEN_HEIGHT)
+        return {'left': dx < -ARRIVE_DISTANCE, 'right': dx > ARRIVE_DISTANCE,
+                'up': dy < -ARRIVE_DISTANCE, 'down': dy > ARRIVE_DISTANCE}
+
+    def answer(self, scene):
+        """Press an answer key, right with probability accuracy"""
+        question = scene.dialog_system.current_dialog
+        correct = question['correct']
+        if self.rng.random() < self.accuracy:
+            choice = correct
+        else:
+            wrong = [i for i in range(len(question['options'])) if i != correct]
+            choice = self.rng.choice(wrong) if wrong else correct
+        self.answers += 1
+        self.correct_answers += choice == correct
+        return [key_event(pygame.KEYDOWN, ANSWER_KEYS[choice])]
+
+    def act(self, scene, dt):
+        """Events for this frame"""
+        self.cooldown -= dt
+        if self.cooldown > 0:
+            return []
+        self.cooldown = REACTION_TIME
+        dialog = scene.dialog_system.current_dialog if scene.dialog_system.active else None
+        if dialog and dialog.get('type') == 'question':
+            return self.answer(scene)
+        if dialog:
+            return [key_event(pygame.KEYDOWN, pygame.K_SPACE)]
+        return self.decide(scene)
+
+    def decide(self, scene):
+        """Ask for a question; subclasses explore first"""
+        return self.steer(scene, {}) + [key_event(pygame.KEYDOWN, pygame.K_SPACE)]
+
+
+class GreedyExplorer(BotPolicy):
+    """Flies to the nearest unvisited planet, then works through the questions"""
+
+    name = 'greedy'
+
+    def decide(self, scene):
+        targets = [p for p in scene.planets if not p.visited]
+        if not targets:
+            return super().decide(scene)
+        player = scene.player
+        target = min(targets, key=lambda p: math.hypot(wrapped_delta(player.x, p.x, SCREEN_WIDTH),
+                                                       wrapped_delta(player.y, p.y, SCREEN_HEIGHT)))
+        return self.steer(scene, self.toward(scene, target.x, target.y))
+
+
+class AutopilotExplorer(BotPolicy):
+    """Lets the in-game autopilot fly to each unvisited planet"""
+
+    name = 'autopilot'
+
+    def decide(self, scene):
+        if not any(not p.visited for p in scene.planets):
+            return super().decide(scene)
+        if scene.player.autopilot.active:
+            return []
+        return [key_event(pygame.KEYDOWN, pygame.K_t)]
+
+
+class RandomScanner(BotPolicy):
+    """Wanders in random directions, scanning whenever it can"""
+
+    name = 'scanner'
+
+    def __init__(self, rng, accuracy=0.5):
+        super().__init__(rng, accuracy)
+        self.heading = {}
+        self.heading_time = 0.0
+
+    def decide(self, scene):
+        self.heading_time -= REACTION_TIME
+        if self.heading_time <= 0:
+            self.heading = {direction: self.rng.random() < 0.35 for direction in MOVE_KEYS}
+            self.heading_time = self.rng.uniform(1.0, 4.0)
+        return self.steer(scene, self.heading) + [key_event(pygame.KEYDOWN, pygame.K_SPACE)]
+
+
+class QuizTaker(BotPolicy):
+    """Stays put and only answers questions"""
+
+    name = 'quiz'
+
+
+POLICIES = {policy.name: policy for policy in (GreedyExplorer, AutopilotExplorer, RandomScanner, QuizTaker)}
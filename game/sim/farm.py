@@ -0,0 +1,178 @@
+"""Headless playtest farm: many bot-driven GameManagers across a process pool"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+import numpy as np
+
+from game.constants import *
+from game.sim.bots import POLICIES
+
+DEFAULT_MAX_TIME = 600.0
+STEP = 1.0 / FPS
+
+# One display surface per worker process, created by init_worker
+_screen = None
+
+COLUMNS = [
+    ('policy', 'U16'), ('seed', 'i8'), ('mission', 'U32'), ('completed', '?'),
+    ('time_to_complete', 'f8'), ('sim_time', 'f8'), ('knowledge_points', 'i8'),
+    ('planets_visited', 'i8'), ('asteroids_scanned', 'i8'), ('questions_answered', 'i8'),
+    ('questions_correct', 'i8'), ('longest_stall', 'f8'), ('stall_progress', 'i8'),
+    ('frames', 'i8'), ('frame_ms_mean', 'f8'), ('frame_ms_p95', 'f8'), ('wall_seconds', 'f8')
+]
+
+
+def init_worker():
+    """Start pygame without a window or sound card"""
+    global _screen
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    # Otherwise SDL turns SIGTERM into a QUIT event and the pool can't stop workers
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    import pygame
+    pygame.init()
+    _screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def run_episode(task):
+    """Play one mission with one bot until it completes or time runs out"""
+    from game.game_manager import GameManager
+    policy_name, seed, mission_index, max_time, render, accuracy = task
+    started = time.perf_counter()
+
+    game_manager = GameManager(_screen, seed=seed, persist=False)
+    mission = game_manager.scenes[MISSION_SELECT].missions[mission_index]
+    game_manager.player_data['current_mission'] = mission
+    game_manager.change_state(PLAYING)
+    scene = game_manager.scenes[PLAYING]
+    policy = POLICIES[policy_name](random.Random(seed), accuracy)
+
+    frame_ms = []
+    sim_time = 0.0
+    completed_at = float('nan')
+    last_progress, last_progress_time = 0, 0.0
+    longest_stall, stall_progress = 0.0, 0
+    while sim_time < max_time:
+        for event in policy.act(scene, STEP):
+            game_manager.handle_event(event)
+        frame_start = time.perf_counter()
+        game_manager.update(STEP)
+        if render:
+            game_manager.render()
+        frame_ms.append((time.perf_counter() - frame_start) * 1000)
+        sim_time += STEP
+
+        # Long stretches without mission progress show where players get stuck
+        progress = scene.mission_progress
+        if progress != last_progress:
+            last_progress, last_progress_time = progress, sim_time
+        elif sim_time - last_progress_time > longest_stall:
+            longest_stall, stall_progress = sim_time - last_progress_time, progress
+        if scene.current_objective and scene.current_objective.is_complete():
+            completed_at = sim_time
+            break
+
+    stats = game_manager.player_data
+    frame_ms = np.asarray(frame_ms)
+    return {
+        'policy': policy_name, 'seed': seed, 'mission': mission['name'],
+        'completed': completed_at == completed_at, 'time_to_complete': completed_at,
+        'sim_time': sim_time, 'knowledge_points': stats['knowledge_points'],
+        'planets_visited': stats['planets_visited'], 'asteroids_scanned': stats['asteroids_scanned'],
+        'questions_answered': policy.answers, 'questions_correct': policy.correct_answers,
+        'longest_stall': longest_stall, 'stall_progress': stall_progress,
+        'frames': len(frame_ms), 'frame_ms_mean': float(frame_ms.mean()),
+        'frame_ms_p95': float(np.percentile(frame_ms, 95)),
+        'wall_seconds': time.perf_counter() - started
+    }
+
+
+def make_tasks(policies, runs, base_seed, max_time, render, accuracy, missions=4):
+    """One task per (policy, run), cycling through the missions"""
+    tasks = []
+    for policy in policies:
+        for run in range(runs):
+            tasks.append((policy, base_seed + run, run % missions, max_time, render, accuracy))
+    return tasks
+
+
+def run_farm(tasks, workers=None):
+    """Run tasks across a process pool; returns columnar numpy arrays"""
+    if not workers:
+        # Cores this process may actually use, which can be fewer than the machine has
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    pool = multiprocessing.Pool(workers, initializer=init_worker)
+    try:
+        rows = list(pool.imap_unordered(run_episode, tasks, chunksize=max(1, len(tasks) // (workers * 8))))
+    finally:
+        pool.close()
+        pool.join()
+    rows.sort(key=lambda row: (row['policy'], row['seed']))
+    return {name: np.array([row[name] for row in rows], dtype=dtype) for name, dtype in COLUMNS}
+
+
+def save_results(path, columns):
+    np.savez_compressed(path, **columns)
+
+
+def load_results(path):
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def summarize(columns):
+    """Per-policy summary lines: completion rate, time to complete, stalls and frame cost"""
+    lines = [f"{'policy':<10}{'runs':>6}{'done':>7}{'median s':>10}{'p90 s':>9}"
+             f"{'points':>9}{'stall s':>9}{'stall at':>10}{'frame ms':>10}{'p95 ms':>8}"]
+    for policy in np.unique(columns['policy']):
+        mask = columns['policy'] == policy
+        done = columns['time_to_complete'][mask & columns['completed']]
+        median = np.median(done) if len(done) else float('nan')
+        p90 = np.percentile(done, 90) if len(done) else float('nan')
+        # The progress level bots most often stalled at
+        stall_levels, stall_counts = np.unique(columns['stall_progress'][mask], return_counts=True)
+        lines.append(
+            f"{policy:<10}{mask.sum():>6}{columns['completed'][mask].mean():>7.0%}"
+            f"{median:>10.1f}{p90:>9.1f}{columns['knowledge_points'][mask].mean():>9.0f}"
+            f"{columns['longest_stall'][mask].mean():>9.1f}{stall_levels[stall_counts.argmax()]:>9}%"
+            f"{columns['frame_ms_mean'][mask].mean():>10.2f}{columns['frame_ms_p95'][mask].mean():>8.2f}"
+        )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flokapp headless playtest farm")
+    parser.add_argument('--policies', default=','.join(POLICIES), help="Comma-separated bot policies")
+    parser.add_argument('--runs', type=int, default=20, help="Runs per policy")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: one per core)")
+    parser.add_argument('--seed', type=int, default=1, help="Seed of the first run")
+    parser.add_argument('--max-time', type=float, default=DEFAULT_MAX_TIME, help="Simulated seconds per run")
+    parser.add_argument('--accuracy', type=float, default=0.75, help="Chance a bot answers correctly")
+    parser.add_argument('--no-render', action='store_true', help="Skip rendering for faster runs")
+    parser.add_argument('--out', default='playtest.npz', help="Columnar results file")
+    parser.add_argument('--summary', metavar='PATH', help="Only summarize an existing results file")
+    args = parser.parse_args(argv)
+
+    if args.summary:
+        columns = load_results(args.summary)
+    else:
+        policies = [name for name in args.policies.split(',') if name]
+        unknown = set(policies) - set(POLICIES)
+        if unknown:
+            parser.error(f"unknown policies: {', '.join(sorted(unknown))}")
+        tasks = make_tasks(policies, args.runs, args.seed, args.max_time, not args.no_render, args.accuracy)
+        started = time.perf_counter()
+        columns = run_farm(tasks, args.workers)
+        elapsed = time.perf_counter() - started
+        save_results(args.out, columns)
+        simulated = columns['sim_time'].sum()
+        print(f"{len(tasks)} runs in {elapsed:.1f}s ({simulated / elapsed:.0f}x real time), saved to {args.out}")
+    for line in summarize(columns):
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
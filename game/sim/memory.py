@@ -0,0 +1,74 @@
+"""Memory benchmark: bytes each kind of entity costs when the world holds thousands of them"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from game.constants import *
+from game.entities.asteroid import Asteroid
+from game.entities.planet import Planet
+from game.entities.satellite import SATELLITE_TYPES, Satellite
+from game.entities.space_station import SpaceStation
+from game.utils.ecs import World
+from game.utils.particle_system import Particle
+
+
+def make_asteroid(world, rng, i):
+    return Asteroid(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), rng, world)
+
+
+def make_planet(world, rng, i):
+    return Planet(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), 'Mars', PLANET_COLORS['mars'], world=world)
+
+
+def make_satellite(world, rng, i):
+    satellite_type = list(SATELLITE_TYPES)[i % len(SATELLITE_TYPES)]
+    return Satellite(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), satellite_type,
+                     orbit_angle=rng.uniform(0, 6.28), world=world)
+
+
+def make_station(world, rng, i):
+    return SpaceStation(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), world=world)
+
+
+def make_particle(world, rng, i):
+    return Particle(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                    rng.uniform(-50, 50), rng.uniform(-50, 50), WHITE, rng.uniform(0.5, 1.5))
+
+
+KINDS = {
+    'asteroid': make_asteroid,
+    'planet': make_planet,
+    'satellite': make_satellite,
+    'station': make_station,
+    'particle': make_particle
+}
+
+
+def measure(make, count, seed=1):
+    """Bytes allocated per entity while count of them are alive, including their share of the world's columns"""
+    rng = random.Random(seed)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    world = World()
+    entities = [make(world, rng, i) for i in range(count)]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del entities, world
+    return used / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure per-entity memory at scale")
+    parser.add_argument('--count', type=int, default=10000, help="Entities of each kind")
+    parser.add_argument('--kinds', default=','.join(KINDS), help="Comma-separated entity kinds")
+    args = parser.parse_args(argv)
+    print(f"{'kind':<12}{'bytes/entity':>14}")
+    for kind in args.kinds.split(','):
+        print(f"{kind:<12}{measure(KINDS[kind], args.count):>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""F3 debug overlay with frame pacing and rendering statistics"""
+from game.constants import *
+from game.ui.widgets import TextList
+from game.utils.sprite_cache import get_font, get_sprite_cache
+from game.utils.asset_cache import get_asset_cache
+
+# Seconds between text refreshes; faster would keep idle screens busy redrawing it
+REFRESH_INTERVAL = 1.0
+
+class DebugOverlay:
+    native_resolution = True
+    
+    def __init__(self, game_manager):
+        self.game_manager = game_manager
+        self.visible = False
+        self.timer = 0.0
+        self.frames = 0
+        self.panel = TextList(get_font(20), color=GREEN, spacing=18, pos=(10, SCREEN_HEIGHT - 10), anchor='bottomleft')
+    
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            self.timer = 0.0
+            self.frames = 0
+            self.panel.set_lines(self.collect_lines(0.0))
+    
+    def update(self, dt):
+        """Refresh the text about once a second while shown"""
+        if not self.visible:
+            return
+        self.timer += dt
+        self.frames += 1
+        if self.timer >= REFRESH_INTERVAL:
+            self.panel.set_lines(self.collect_lines(self.frames / self.timer))
+            self.timer = 0.0
+            self.frames = 0
+    
+    def collect_lines(self, fps):
+        """One line per statistic"""
+        manager = self.game_manager
+        scheduler = manager.frame_scheduler
+        scene = manager.current_state
+        assets = get_asset_cache()
+        lines = [
+            f"{fps:.1f} fps ({scheduler.mode})",
+            f"CPU in {scene}: {scheduler.cpu_share(scene):.0%}",
+            manager.quality.status(),
+            manager.sound_manager.mixer.report(),
+            manager.sound_manager.music.report(),
+            manager.renderer.report(),
+            manager.events.report(),
+            manager.save_system.report(),
+            get_sprite_cache().report()
+        ]
+        if assets is not None:
+            lines.append(assets.report())
+        return lines
+    
+    def get_drawables(self):
+        """The panel as a (key, surface, rect) drawable while shown"""
+        if not self.visible:
+            return []
+        return [(self, self.panel.get_surface(), self.panel.rect)]
+    
+    def render(self, screen):
+        """Draw the panel on top of a scene that paints itself"""
+        if self.visible:
+            self.panel.draw(screen)
\ No newline at end of file
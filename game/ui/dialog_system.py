@@ -1,8 +1,11 @@
 """Dialog system for educational content and interactions"""
 import pygame
 from game.constants import *
+from game.ui.widgets import text_style
 
 class DialogSystem:
+    native_resolution = True
+    
     def __init__(self):
         self.active = False
         self.current_dialog = None
@@ -10,6 +13,20 @@ class DialogSystem:
         self.font_medium = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 20)
         
+        # Semi-transparent overlay
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay.set_alpha(128)
+        self.overlay.fill(BLACK)
+        
+        # The panel is rendered once per dialog, not every frame
+        dialog_width = 600
+        dialog_height = 400
+        self.panel_rect = pygame.Rect((SCREEN_WIDTH - dialog_width) // 2, (SCREEN_HEIGHT - dialog_height) // 2,
+                                      dialog_width, dialog_height)
+        self.panel = None
+        self.panel_dialog = None
+        self.panel_generation = None
+        
     def show_dialog(self, dialog_data):
         """Show a dialog with the given data"""
         self.current_dialog = dialog_data
@@ -33,38 +50,44 @@ class DialogSystem:
                 elif self.current_dialog.get('type') == 'question':
                     # Handle question selection
                     pass
+            elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
+                # Answer keys go to the scene that asked the question
+                if self.current_dialog.get('type') == 'question':
+                    return False
             elif event.key == pygame.K_ESCAPE:
                 self.hide_dialog()
                 return True
         
         return True  # Dialog consumed the event
     
+    def get_drawables(self):
+        """(key, surface, rect) for the overlay and dialog panel while a dialog is open"""
+        if not self.active or not self.current_dialog:
+            return []
+        if self.panel_dialog is not self.current_dialog or self.panel_generation != text_style['generation']:
+            self.panel = self.build_panel()
+            self.panel_dialog = self.current_dialog
+            self.panel_generation = text_style['generation']
+        return [(self.overlay, self.overlay, self.overlay.get_rect()), (self, self.panel, self.panel_rect)]
+    
     def render(self, screen):
         """Render the dialog if active"""
-        if not self.active or not self.current_dialog:
-            return
-        
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
-        
-        # Dialog box
-        dialog_width = 600
-        dialog_height = 400
-        dialog_x = (SCREEN_WIDTH - dialog_width) // 2
-        dialog_y = (SCREEN_HEIGHT - dialog_height) // 2
-        
-        dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-        pygame.draw.rect(screen, (20, 30, 50), dialog_rect)
-        pygame.draw.rect(screen, WHITE, dialog_rect, 3)
+        for _, surface, rect in self.get_drawables():
+            screen.blit(surface, rect)
+    
+    def build_panel(self):
+        """Render the dialog box and its content"""
+        panel = pygame.Surface(self.panel_rect.size)
+        dialog_rect = panel.get_rect()
+        panel.fill((20, 30, 50))
+        pygame.draw.rect(panel, WHITE, dialog_rect, 3)
         
         # Dialog content
         if self.current_dialog['type'] == 'info':
-            self.render_info_dialog(screen, dialog_rect)
+            self.render_info_dialog(panel, dialog_rect)
         elif self.current_dialog['type'] == 'question':
-            self.render_question_dialog(screen, dialog_rect)
+            self.render_question_dialog(panel, dialog_rect)
+        return panel
     
     def render_info_dialog(self, screen, rect):
         """Render an information dialog"""
@@ -72,7 +95,7 @@ class DialogSystem:
         content = self.current_dialog.get('content', '')
         
         # Title
-        title_text = self.font_large.render(title, True, CYAN)
+        title_text = self.font_large.render(title, text_style['antialias'], CYAN)
         title_rect = title_text.get_rect(center=(rect.centerx, rect.y + 40))
         screen.blit(title_text, title_rect)
         
@@ -95,12 +118,12 @@ class DialogSystem:
         
         # Render lines
         for i, line in enumerate(lines):
-            line_text = self.font_medium.render(line, True, WHITE)
+            line_text = self.font_medium.render(line, text_style['antialias'], WHITE)
             line_y = rect.y + 100 + i * 30
             screen.blit(line_text, (rect.x + 20, line_y))
         
         # Instructions
-        instruction = self.font_small.render("Press SPACE or ENTER to continue", True, YELLOW)
+        instruction = self.font_small.render("Press SPACE or ENTER to continue", text_style['antialias'], YELLOW)
         inst_rect = instruction.get_rect(center=(rect.centerx, rect.bottom - 30))
         screen.blit(instruction, inst_rect)
     
@@ -109,17 +132,17 @@ class DialogSystem:
         question_data = self.current_dialog
         
         # Question
-        question_text = self.font_medium.render(question_data['question'], True, WHITE)
+        question_text = self.font_medium.render(question_data['question'], text_style['antialias'], WHITE)
         question_rect = question_text.get_rect(center=(rect.centerx, rect.y + 50))
         screen.blit(question_text, question_rect)
         
         # Options
         for i, option in enumerate(question_data['options']):
-            option_text = self.font_medium.render(f"{i+1}. {option}", True, WHITE)
+            option_text = self.font_medium.render(f"{i+1}. {option}", text_style['antialias'], WHITE)
             option_y = rect.y + 120 + i * 40
             screen.blit(option_text, (rect.x + 40, option_y))
         
         # Instructions
-        instruction = self.font_small.render("Press 1-4 to select answer", True, YELLOW)
+        instruction = self.font_small.render("Press 1-4 to select answer", text_style['antialias'], YELLOW)
         inst_rect = instruction.get_rect(center=(rect.centerx, rect.bottom - 30))
         screen.blit(instruction, inst_rect)
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""Retained-mode HUD widgets that re-render only when what they show changes"""
+import pygame
+from game.constants import *
+
+# Shared by every widget; bumping the generation re-renders all text on the next frame
+text_style = {'antialias': True, 'generation': 0}
+
+def set_text_antialias(antialias):
+    """Switch antialiased text on or off everywhere"""
+    if antialias != text_style['antialias']:
+        text_style['antialias'] = antialias
+        text_style['generation'] += 1
+
+class Widget:
+    """Keeps its rendered surface until invalidated.
+    
+    Widgets either get new values pushed in (set_text, set_value...) or pull
+    them each frame from a bound callable in refresh(); both paths only mark
+    the widget dirty when the value actually differs.
+    """
+    # Drawn at window resolution even when the world renders at a reduced scale
+    native_resolution = True
+    
+    def __init__(self, pos=(0, 0), anchor='topleft'):
+        self.pos = pos
+        self.anchor = anchor
+        self.visible = True
+        self.surface = None
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.dirty = True
+        self.generation = text_style['generation']
+    
+    def invalidate(self):
+        self.dirty = True
+    
+    def refresh(self):
+        """Pull bound values; subclasses invalidate on change"""
+        pass
+    
+    def build(self):
+        """Render the widget to a new surface"""
+        raise NotImplementedError
+    
+    def set_pos(self, pos):
+        """Move without re-rendering"""
+        if pos != self.pos:
+            self.pos = pos
+            if self.surface is not None:
+                self.rect = self.surface.get_rect(**{self.anchor: pos})
+    
+    def set_visible(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            # Lets a parent card know to redraw without this child
+            self.dirty = True
+    
+    def get_surface(self):
+        if self.dirty or self.surface is None or self.generation != text_style['generation']:
+            self.generation = text_style['generation']
+            self.surface = self.build()
+            self.rect = self.surface.get_rect(**{self.anchor: self.pos})
+            self.dirty = False
+        return self.surface
+    
+    def draw(self, screen):
+        if self.visible:
+            surface = self.get_surface()
+            screen.blit(surface, self.rect)
+
+class Label(Widget):
+    """A line of text, optionally bound to a value and a format string"""
+    
+    def __init__(self, font, text='', color=WHITE, pos=(0, 0), anchor='topleft', value=None, fmt='{}'):
+        super().__init__(pos, anchor)
+        self.font = font
+        self.text = text
+        self.color = color
+        self.value = value
+        self.fmt = fmt
+    
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.dirty = True
+    
+    def set_color(self, color):
+        if color != self.color:
+            self.color = color
+            self.dirty = True
+    
+    def refresh(self):
+        if self.value is not None:
+            self.set_text(self.fmt.format(self.value()))
+    
+    def build(self):
+        return self.font.render(self.text, text_style['antialias'], self.color)
+
+class TextList(Widget):
+    """Lines of text stacked with fixed spacing, rendered as one surface"""
+    
+    def __init__(self, font, lines=(), color=WHITE, pos=(0, 0), spacing=25, anchor='topleft', value=None):
+        super().__init__(pos, anchor)
+        self.font = font
+        self.lines = list(lines)
+        self.color = color
+        self.spacing = spacing
+        self.value = value
+    
+    def set_lines(self, lines):
+        lines = list(lines)
+        if lines != self.lines:
+            self.lines = lines
+            self.dirty = True
+    
+    def refresh(self):
+        if self.value is not None:
+            self.set_lines(self.value())
+    
+    def build(self):
+        rendered = [self.font.render(line, text_style['antialias'], self.color) for line in self.lines]
+        width = max((text.get_width() for text in rendered), default=0)
+        height = self.spacing * (len(rendered) - 1) + rendered[-1].get_height() if rendered else 0
+        surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        for i, text in enumerate(rendered):
+            surface.blit(text, (0, i * self.spacing))
+        return surface
+
+class ProgressBar(Widget):
+    """Outlined bar filled to a 0-100 value"""
+    
+    def __init__(self, size, fill_color=GREEN, border_color=WHITE, pos=(0, 0), anchor='topleft', value=None):
+        super().__init__(pos, anchor)
+        self.size = size
+        self.fill_color = fill_color
+        self.border_color = border_color
+        self.value = value
+        self.fill_width = 0
+    
+    def set_value(self, percent):
+        # Only a change of whole pixels needs a new surface
+        fill_width = int((percent / 100) * (self.size[0] - 2))
+        if fill_width != self.fill_width:
+            self.fill_width = fill_width
+            self.dirty = True
+    
+    def refresh(self):
+        if self.value is not None:
+            self.set_value(self.value())
+    
+    def build(self):
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, self.border_color, surface.get_rect(), 2)
+        if self.fill_width > 0:
+            pygame.draw.rect(surface, self.fill_color, (1, 1, self.fill_width, self.size[1] - 2))
+        return surface
+
+class Card(Widget):
+    """Filled, outlined panel holding child widgets positioned inside it"""
+    
+    def __init__(self, size, fill=(20, 30, 50), border=WHITE, pos=(0, 0), anchor='topleft', children=(), border_width=2):
+        super().__init__(pos, anchor)
+        self.size = size
+        self.fill = fill
+        self.border = border
+        self.border_width = border_width
+        self.children = list(children)
+    
+    def set_style(self, fill=None, border=None):
+        fill = self.fill if fill is None else fill
+        border = self.border if border is None else border
+        if (fill, border) != (self.fill, self.border):
+            self.fill, self.border = fill, border
+            self.dirty = True
+    
+    def refresh(self):
+        for child in self.children:
+            child.refresh()
+            if child.dirty:
+                self.dirty = True
+    
+    def build(self):
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface.fill(self.fill)
+        pygame.draw.rect(surface, self.border, surface.get_rect(), self.border_width)
+        for child in self.children:
+            child.draw(surface)
+        return surface
+
+class WidgetLayer:
+    """A scene's HUD: refreshes bound widgets and composites their cached surfaces"""
+    
+    def __init__(self, widgets=()):
+        self.widgets = list(widgets)
+    
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+    
+    def draw(self, screen):
+        for widget in self.widgets:
+            widget.refresh()
+            widget.draw(screen)
+    
+    def get_drawables(self):
+        """(widget, surface, rect) for every visible widget"""
+        drawables = []
+        for widget in self.widgets:
+            widget.refresh()
+            if widget.visible:
+                drawables.append((widget, widget.get_surface(), widget.rect))
+        return drawables
\ No newline at end of file
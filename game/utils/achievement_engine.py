@@ -0,0 +1,140 @@
+"""Compiled, event-driven achievement rules"""
+import operator
+import re
+from collections import deque
+
+OPERATORS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+CLAUSE_PATTERN = re.compile(
+    r'^(?:gain\(\s*(?P<gain_stat>\w+)\s*,\s*(?P<window>\d+(?:\.\d+)?)\s*\)|(?P<stat>\w+))'
+    r'\s*(?P<op>>=|<=|==|>|<)\s*(?P<value>-?\d+(?:\.\d+)?)$'
+)
+
+
+def compile_requirement(requirement):
+    """Compile a requirement string.
+
+    Returns (predicate, stats, windows) where predicate(engine, now) -> bool,
+    stats is the set of stats it reads and windows maps stat -> longest window.
+    """
+    stats = set()
+    windows = {}
+    alternatives = []
+    for alternative in re.split(r'\s+or\s+', requirement.strip()):
+        clauses = []
+        for text in re.split(r'\s+and\s+', alternative.strip()):
+            match = CLAUSE_PATTERN.match(text.strip())
+            if not match:
+                raise ValueError(f"Invalid achievement requirement: {requirement!r}")
+            compare = OPERATORS[match.group('op')]
+            target = float(match.group('value'))
+            if match.group('gain_stat'):
+                stat = match.group('gain_stat')
+                window = float(match.group('window'))
+                windows[stat] = max(windows.get(stat, 0.0), window)
+                clauses.append(lambda engine, now, s=stat, w=window, c=compare, t=target:
+                               c(engine.gain(s, w, now), t))
+            else:
+                stat = match.group('stat')
+                clauses.append(lambda engine, now, s=stat, c=compare, t=target:
+                               c(engine.values.get(s, 0), t))
+            stats.add(stat)
+        alternatives.append(clauses)
+
+    def predicate(engine, now):
+        return any(all(clause(engine, now) for clause in clauses) for clauses in alternatives)
+
+    return predicate, stats, windows
+
+
+class AchievementEngine:
+    """Evaluates achievements only when a stat they depend on changes.
+
+    Requirements are compiled once and indexed by stat. Stats used in
+    gain(...) clauses keep a short history trimmed to their longest window.
+    Listeners are called with each achievement as it unlocks.
+    """
+
+    def __init__(self, definitions):
+        self.achievements = []
+        self.predicates = []
+        self.index = {}
+        self.windows = {}
+        self.history = {}
+        self.values = {}
+        self.listeners = []
+
+        for definition in definitions:
+            predicate, stats, windows = compile_requirement(definition['requirement'])
+            achievement = dict(definition, unlocked=False)
+            position = len(self.achievements)
+            self.achievements.append(achievement)
+            self.predicates.append(predicate)
+            for stat in stats:
+                self.index.setdefault(stat, []).append(position)
+            for stat, window in windows.items():
+                self.windows[stat] = max(self.windows.get(stat, 0.0), window)
+
+    def subscribe(self, callback):
+        """Call callback(achievement) whenever an achievement unlocks"""
+        self.listeners.append(callback)
+
+    def gain(self, stat, window, now):
+        """How much a stat grew over the last `window` seconds"""
+        history = self.history.get(stat)
+        if not history:
+            return 0
+        cutoff = now - window
+        baseline = history[0][1]
+        for sample_time, value in history:
+            if sample_time > cutoff:
+                break
+            baseline = value
+        return self.values.get(stat, 0) - baseline
+
+    def record(self, stat, value, now):
+        """Store a stat value without evaluating anything"""
+        if stat in self.windows:
+            history = self.history.setdefault(stat, deque())
+            if not history:
+                # Baseline so the first change counts as a gain
+                history.append((now, self.values.get(stat, 0)))
+            history.append((now, value))
+            cutoff = now - self.windows[stat]
+            while len(history) > 1 and history[1][0] <= cutoff:
+                history.popleft()
+        self.values[stat] = value
+
+    def on_stat_changed(self, stat, value, now):
+        """Record a new stat value and unlock any achievements it completes"""
+        self.record(stat, value, now)
+        return self.evaluate(self.index.get(stat, ()), now)
+
+    def load_stats(self, stats, now=0.0):
+        """Seed stat values (e.g. from a save) and evaluate everything once"""
+        for stat, value in stats.items():
+            if isinstance(value, (int, float)):
+                # A loaded value is where gains are measured from, not a gain itself
+                if stat in self.windows:
+                    self.history[stat] = deque([(now, value)])
+                self.values[stat] = value
+        return self.evaluate(range(len(self.achievements)), now)
+
+    def evaluate(self, positions, now):
+        """Check the given achievements, emitting unlock events"""
+        newly_unlocked = []
+        for position in positions:
+            achievement = self.achievements[position]
+            if not achievement['unlocked'] and self.predicates[position](self, now):
+                achievement['unlocked'] = True
+                newly_unlocked.append(achievement)
+        for achievement in newly_unlocked:
+            for listener in self.listeners:
+                listener(achievement)
+        return newly_unlocked
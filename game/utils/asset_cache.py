@@ -0,0 +1,311 @@
+"""On-disk cache of generated sounds and pre-rendered sprites, keyed by their generator's code"""
+import hashlib
+import json
+import os
+import types
+
+import numpy as np
+import pygame
+
+from game.constants import DATA_DIR
+from game.utils.save_system import write_atomic
+
+ASSET_DIR = os.path.join(DATA_DIR, 'cache', 'assets')
+# Bump when a generator's output changes in a way its code can't show, such as a data file
+ASSET_VERSION = 2
+# A pack, including the sprites waiting for flush(), stops taking new ones at this size
+MAX_PACK_BYTES = 64 * 1024 * 1024
+PLAIN_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+# Build functions whose sprites are never written to disk
+_unbaked = set()
+
+
+def not_baked(build):
+    """Mark a sprite build function whose keys are unbounded (player names, say) as memory-only"""
+    _unbaked.add(build)
+    return build
+
+
+def is_game_object(value):
+    return (getattr(value, '__module__', None) or '').split('.')[0] == 'game'
+
+
+def plain_repr(value):
+    """Stable repr of plain data, or None for anything holding other objects"""
+    if isinstance(value, PLAIN_TYPES):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        parts = [plain_repr(item) for item in value]
+        return None if None in parts else f"{type(value).__name__}({','.join(parts)})"
+    if isinstance(value, (set, frozenset)):
+        parts = [plain_repr(item) for item in value]
+        return None if None in parts else f"set({','.join(sorted(parts))})"
+    if isinstance(value, dict):
+        parts = [plain_repr(item) for pair in value.items() for item in pair]
+        return None if None in parts else f"dict({','.join(parts)})"
+    return None
+
+
+def code_version(func, args=()):
+    """Hash of a generator and everything in the game it reaches, plus its call arguments.
+
+    Besides the generator's own bytecode this covers the game functions it
+    calls, the methods it reaches through self or a class, and the global
+    constants any of them read, so editing a helper or a colour also makes
+    old assets miss. Library code is covered by the pygame version; other
+    objects count by type only, since their repr isn't stable between runs.
+    """
+    digest = hashlib.sha1(f"{ASSET_VERSION} {pygame.version.ver} {args!r}".encode('utf-8'))
+    seen = set()
+
+    def update(text):
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+
+    def add_code(code, namespace, owners):
+        digest.update(code.co_code)
+        update(repr(code.co_names))
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                add_code(const, namespace, owners)
+            else:
+                update(plain_repr(const) or type(const).__name__)
+        # Classes named in the code are where its attribute lookups may land
+        owners = owners + [value for value in map(namespace.get, code.co_names)
+                           if isinstance(value, type) and is_game_object(value)]
+        for name in code.co_names:
+            value = namespace.get(name)
+            # Module data counts only if it's named like a constant; the rest is runtime state such as caches
+            if name in namespace and (name.isupper() or callable(value) or isinstance(value, types.ModuleType)):
+                add_value(value)
+            for owner in owners:
+                attribute = next((vars(cls)[name] for cls in owner.__mro__ if name in vars(cls)), None)
+                if attribute is not None:
+                    add_value(attribute)
+
+    def add_function(function):
+        if function in seen:
+            return
+        seen.add(function)
+        if not is_game_object(function):
+            update(f"{function.__module__}.{function.__qualname__}")
+            return
+        update(function.__qualname__)
+        for value in (function.__defaults__ or ()) + tuple((function.__kwdefaults__ or {}).values()):
+            add_value(value)
+        for cell in function.__closure__ or ():
+            try:
+                add_value(cell.cell_contents)
+            except ValueError:
+                pass
+        # A method's own class, for the helpers it calls through self
+        owner = function.__globals__.get(function.__qualname__.split('.')[0])
+        owners = [owner] if isinstance(owner, type) and '.' in function.__qualname__ else []
+        add_code(function.__code__, function.__globals__, owners)
+
+    def add_value(value):
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        if isinstance(value, types.FunctionType):
+            add_function(value)
+        elif isinstance(value, (type, types.ModuleType)) or callable(value):
+            # Game classes are walked through the attributes the code uses
+            update(getattr(value, '__name__', type(value).__name__))
+        else:
+            text = plain_repr(value)
+            update(type(value).__name__ if text is None else text)
+
+    add_function(func)
+    return digest.hexdigest()[:16]
+
+
+def remove_stale(directory, prefix, keep):
+    """Delete files for an older version of the same generator"""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return 0
+    removed = 0
+    for name in names:
+        if name.startswith(prefix) and name not in keep:
+            try:
+                os.remove(os.path.join(directory, name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def pack_prefix(name):
+    return f"sprites-{name}-"
+
+
+class SpritePack:
+    """Every baked sprite of one generator version: an RGBA pixel blob and an index.
+
+    The blob is memory-mapped, so a sprite costs one frombuffer call over
+    pages the OS loads on first touch. New sprites are kept in memory until
+    save() appends them to the blob and then writes the index, which records
+    how many bytes of the blob it covers. Bytes already written never move,
+    so an older index stays valid against a longer blob, and a save costs
+    only the new sprites.
+    """
+
+    def __init__(self, directory, name, version):
+        self.directory = directory
+        self.prefix = pack_prefix(name)
+        self.index_path = os.path.join(directory, f"{self.prefix}{version}.json")
+        self.blob_name = f"{self.prefix}{version}.bin"
+        self.blob_path = os.path.join(directory, self.blob_name)
+        self.version = version
+        self.index = {}
+        self.blob = None
+        self.added = {}
+        self.pending_bytes = 0
+        self.size = 0
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data['blob'] != self.blob_name:
+                raise ValueError(data['blob'])
+            self.blob = self.map_blob(data['size'])
+            self.index = data['sprites']
+            self.size = data['size']
+        except (OSError, ValueError, KeyError):
+            self.index = {}
+            self.blob = None
+            self.size = 0
+
+    def map_blob(self, size):
+        return np.memmap(self.blob_path, dtype=np.uint8, mode='r', shape=(size,)) if size else None
+
+    def get(self, key):
+        """(surface, anchor) for a baked key, or None"""
+        entry = self.index.get(repr(key))
+        if entry is None:
+            return None
+        offset, width, height, ax, ay = entry
+        pixels = self.blob[offset:offset + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), 'RGBA'), (ax, ay)
+
+    def add(self, key, surface, anchor):
+        """Keep a sprite for the next save(), unless the pack is full"""
+        pixels = pygame.image.tobytes(surface, 'RGBA')
+        if self.size + self.pending_bytes + len(pixels) > MAX_PACK_BYTES:
+            return
+        self.added[repr(key)] = (pixels, surface.get_size(), anchor)
+        self.pending_bytes += len(pixels)
+
+    def save(self):
+        """Append the new sprites to the blob, then point the index at them"""
+        if not self.added:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        index = dict(self.index)
+        with open(self.blob_path, 'ab') as f:
+            # Start after whatever is there, even bytes a crashed save left past the index
+            offset = f.seek(0, os.SEEK_END)
+            for key, (pixels, (width, height), (ax, ay)) in self.added.items():
+                index[key] = [offset, width, height, ax, ay]
+                f.write(pixels)
+                offset += len(pixels)
+            f.flush()
+            os.fsync(f.fileno())
+        write_atomic(self.index_path, json.dumps({'blob': self.blob_name, 'size': offset,
+                                                  'sprites': index}).encode('utf-8'))
+        remove_stale(self.directory, self.prefix, {self.blob_name, os.path.basename(self.index_path)})
+        self.blob = self.map_blob(offset)
+        self.index = index
+        self.size = offset
+        self.added = {}
+        self.pending_bytes = 0
+
+
+class AssetCache:
+    """Content-addressed store for generated assets.
+
+    Sounds are one .npy per (sound, sample rate, generator version) and load
+    with np.load(mmap_mode='r'). Sprites are grouped into one SpritePack per
+    build function; new sprites stay in memory until flush(), which the game
+    calls at shutdown and the bake when it's done. A generator's version is the hash of its code, so editing it makes old
+    entries miss; they are deleted when the new ones are written. Build
+    functions marked not_baked skip the disk altogether.
+    """
+
+    def __init__(self, directory=ASSET_DIR):
+        self.directory = directory
+        self.packs = {}
+        self.unbaked_seen = set()
+        self.versions = {}
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def version_of(self, func, args=()):
+        # Key bound methods by their function so the cache doesn't hold on to the instance
+        func = getattr(func, '__func__', func)
+        version = self.versions.get((func, args))
+        if version is None:
+            version = self.versions[(func, args)] = code_version(func, args)
+        return version
+
+    def sound(self, name, sample_rate, generate, *args):
+        """int16 stereo samples for a sound, from disk or from generate(*args)"""
+        prefix = f"sound-{name}-{sample_rate}-"
+        filename = f"{prefix}{self.version_of(generate, args)}.npy"
+        path = os.path.join(self.directory, filename)
+        try:
+            samples = np.load(path, mmap_mode='r')
+            self.stats['hits'] += 1
+            return samples
+        except (OSError, ValueError):
+            pass
+        self.stats['misses'] += 1
+        samples = np.ascontiguousarray(generate(*args), dtype=np.int16)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            np.save(f, samples)
+        os.replace(path + '.tmp', path)
+        remove_stale(self.directory, prefix, {filename})
+        return samples
+
+    def sprite(self, key, build):
+        """(surface, anchor) for a sprite key, from its pack or from build(key)"""
+        name = f"{build.__module__}.{build.__qualname__}"
+        if build in _unbaked:
+            if build not in self.unbaked_seen:
+                # Clear out anything stored for it before it was marked
+                self.unbaked_seen.add(build)
+                remove_stale(self.directory, pack_prefix(name), set())
+            return build(key)
+        pack = self.packs.get(build)
+        if pack is None:
+            pack = self.packs[build] = SpritePack(self.directory, name, self.version_of(build))
+        entry = pack.get(key)
+        if entry is not None:
+            self.stats['hits'] += 1
+            return entry
+        self.stats['misses'] += 1
+        surface, anchor = build(key)
+        pack.add(key, surface, anchor)
+        return surface, anchor
+
+    def flush(self):
+        """Write sprites built since the last flush"""
+        for pack in self.packs.values():
+            pack.save()
+
+    def report(self):
+        return f"Asset cache: {self.stats['hits']} baked, {self.stats['misses']} generated"
+
+
+_asset_cache = None
+
+
+def get_asset_cache():
+    """The asset cache in use, or None when assets are always generated"""
+    return _asset_cache
+
+
+def set_asset_cache(cache):
+    global _asset_cache
+    _asset_cache = cache
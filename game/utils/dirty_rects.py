@@ -0,0 +1,310 @@
+"""Partial screen redraws: only regions whose contents changed are repainted and pushed"""
+import math
+from fractions import Fraction
+
+import pygame
+
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.utils.display import can_convert
+
+# Past this share of the screen one flip is cheaper than restoring and pushing many rects
+FULL_FLIP_FRACTION = 0.5
+
+
+def merge_rects(rects):
+    """Union overlapping rects until none overlap, so no pixel is painted twice"""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        hit = rect.collidelist(merged)
+        while hit != -1:
+            rect.union_ip(merged.pop(hit))
+            hit = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRenderer:
+    """Composites a scene's sprites, repainting only what changed since the last frame.
+
+    A scene describes each frame as (key, surface, rect) drawables in back
+    to front order. A drawable whose surface or rect differs from last frame,
+    or which appeared or went away, damages both its old and new rect. Damage
+    is restored from the background and every drawable touching it is
+    re-blitted clipped to it; the rest of the screen is left alone.
+
+    With a render scale below 1 the world is composited on a smaller canvas
+    from scaled copies of each sprite, and every repaired region is scaled
+    back up in one transform.scale call. Drawables from the first one the
+    native test accepts onward (the HUD and dialogs) are blitted after the
+    upscale, so text stays sharp.
+
+    When the window itself is another size than the screen (set_output), a
+    scaled world goes from the canvas to the window in a single upscale
+    instead of through a full-size screen first, and native drawables are
+    scaled once to window size and blitted on top. Damage is repaired the
+    same way, region by region, with each region widened to whole pixels of
+    both the canvas and the window, and the window regions are returned.
+    """
+
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), full_flip_fraction=FULL_FLIP_FRACTION):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.full_flip_area = full_flip_fraction * size[0] * size[1]
+        self.shown = {}
+        self.full = True
+        self.stats = {'frames': 0, 'full_frames': 0, 'pixels': 0}
+        self.scale = 1.0
+        self.native = None
+        self.canvas = None
+        self.output = None
+        self.scaled_native = {}
+
+    def set_scale(self, scale, native=None):
+        """Composite the world at scale times the screen size; native(key) marks where full-size drawing starts"""
+        # Eighths divide the screen size evenly, so repaired regions line up exactly when scaled back up
+        ratio = Fraction(max(1, min(8, round(scale * 8))), 8)
+        scale = float(ratio)
+        if (scale, native) == (self.scale, self.native):
+            return
+        self.scale = scale
+        self.native = native
+        self.invalidate()
+        if scale == 1:
+            self.canvas = None
+            return
+        self.align_canvas, self.align_screen = ratio.numerator, ratio.denominator
+        size = (self.screen_rect.width * ratio.numerator // ratio.denominator,
+                self.screen_rect.height * ratio.numerator // ratio.denominator)
+        self.canvas = pygame.Surface(size)
+        if can_convert():
+            self.canvas = self.canvas.convert()
+        self.canvas_rect = self.canvas.get_rect()
+        self.scaled_surfaces = {}
+        self.scaled_background = (None, None)
+
+    def set_output(self, output):
+        """Window of another size to draw a scaled world straight onto, or None"""
+        if output is self.output:
+            return
+        self.output = output
+        self.scaled_native = {}
+        self.invalidate()
+
+    @property
+    def draws_to_output(self):
+        """Whether frames from render() are already on the output rather than the screen"""
+        return self.canvas is not None and self.output is not None
+
+    def convert(self):
+        """Convert a canvas made off the main thread to the display format"""
+        if self.canvas is not None:
+            self.canvas = self.canvas.convert()
+
+    def invalidate(self):
+        """Repaint the whole screen on the next frame"""
+        self.full = True
+
+    def painted_directly(self):
+        """The scene drew the whole frame itself, so nothing on screen can be trusted"""
+        self.full = True
+        self.shown = {}
+        self.stats['frames'] += 1
+        self.stats['full_frames'] += 1
+        self.stats['pixels'] += self.screen_rect.width * self.screen_rect.height
+
+    def find_damage(self, current):
+        """Old and new rects of every drawable that changed"""
+        damage = []
+        shown = self.shown
+        for key, (surface, rect) in current.items():
+            previous = shown.get(key)
+            if previous is None:
+                damage.append(rect)
+            elif previous[0] is not surface or previous[1] != rect:
+                damage.append(previous[1])
+                damage.append(rect)
+        for key, (_, rect) in shown.items():
+            if key not in current:
+                damage.append(rect)
+        clipped = [rect.clip(self.screen_rect) for rect in damage]
+        return merge_rects(rect for rect in clipped if rect.width and rect.height)
+
+    def render(self, screen, background, drawables):
+        """Bring the screen up to date; returns the rects to push, or None for a full flip"""
+        current = {key: (surface, rect) for key, surface, rect in drawables}
+        damage = None if self.full else self.find_damage(current)
+        self.shown = current
+        self.stats['frames'] += 1
+        if self.canvas is not None:
+            return self.render_scaled(screen, background, drawables, damage)
+
+        if damage is None or sum(rect.width * rect.height for rect in damage) > self.full_flip_area:
+            self.full = False
+            self.stats['full_frames'] += 1
+            self.stats['pixels'] += self.screen_rect.width * self.screen_rect.height
+            screen.blit(background, (0, 0))
+            screen.blits([(surface, rect) for _, surface, rect in drawables], doreturn=False)
+            return None
+
+        for area in damage:
+            screen.blit(background, area, area)
+            for _, surface, rect in drawables:
+                if rect.colliderect(area):
+                    part = rect.clip(area)
+                    screen.blit(surface, part, part.move(-rect.x, -rect.y))
+            self.stats['pixels'] += area.width * area.height
+        return damage
+
+    def split_native(self, drawables):
+        """World drawables and the full-size ones drawn on top of them"""
+        if self.native is not None:
+            for i, (key, _, _) in enumerate(drawables):
+                if self.native(key):
+                    return drawables[:i], drawables[i:]
+        return drawables, []
+
+    @staticmethod
+    def scale_drawables(drawables, scale_x, scale_y, previous):
+        """(surface, rect) scaled by the factors for each drawable, and the copies made; copies live as long as their source"""
+        cache = {}
+        sprites = []
+        for _, surface, rect in drawables:
+            scaled = cache.get(surface)
+            if scaled is None:
+                scaled = previous.get(surface)
+            if scaled is None:
+                width, height = surface.get_size()
+                scaled = pygame.transform.scale(surface, (max(1, round(width * scale_x)), max(1, round(height * scale_y))))
+            cache[surface] = scaled
+            sprites.append((scaled, scaled.get_rect(topleft=(round(rect.x * scale_x), round(rect.y * scale_y)))))
+        return sprites, cache
+
+    def scale_sprites(self, drawables):
+        """(surface, rect) on the canvas for each drawable"""
+        sprites, self.scaled_surfaces = self.scale_drawables(drawables, self.scale, self.scale, self.scaled_surfaces)
+        return sprites
+
+    def scale_native(self, drawables):
+        """(surface, rect) on the output for each full-size drawable"""
+        width, height = self.output.get_size()
+        sprites, self.scaled_native = self.scale_drawables(drawables, width / self.screen_rect.width,
+                                                           height / self.screen_rect.height, self.scaled_native)
+        return sprites
+
+    def to_canvas(self, area):
+        """Canvas region covering a screen region, aligned to the scale ratio"""
+        align = self.align_canvas
+        # One extra pixel: rounding a sprite's scaled position and size can reach past the scaled rect
+        left = math.floor(area.left * self.scale) - 1
+        top = math.floor(area.top * self.scale) - 1
+        right = math.ceil(area.right * self.scale) + 1
+        bottom = math.ceil(area.bottom * self.scale) + 1
+        left, top = left // align * align, top // align * align
+        right, bottom = -(-right // align) * align, -(-bottom // align) * align
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.canvas_rect)
+
+    def to_screen(self, area):
+        step = self.align_screen
+        align = self.align_canvas
+        return pygame.Rect(area.x // align * step, area.y // align * step,
+                           area.width // align * step, area.height // align * step)
+
+    def render_scaled(self, screen, background, drawables, damage):
+        """render() with the world composited on the smaller canvas"""
+        world, native = self.split_native(drawables)
+        sprites = self.scale_sprites(world)
+        source, small_background = self.scaled_background
+        if source is not background:
+            small_background = pygame.transform.scale(background, self.canvas_rect.size)
+            self.scaled_background = (background, small_background)
+        canvas = self.canvas
+        if self.output is not None:
+            return self.render_to_output(small_background, sprites, native, damage)
+
+        if damage is None or sum(rect.width * rect.height for rect in damage) > self.full_flip_area:
+            self.full = False
+            self.stats['full_frames'] += 1
+            self.stats['pixels'] += self.screen_rect.width * self.screen_rect.height
+            canvas.blit(small_background, (0, 0))
+            canvas.blits(sprites, doreturn=False)
+            pygame.transform.scale(canvas, self.screen_rect.size, screen)
+            screen.blits([(surface, rect) for _, surface, rect in native], doreturn=False)
+            return None
+
+        repaired = []
+        for area in damage:
+            small = self.to_canvas(area)
+            self.repair_canvas(small, small_background, sprites)
+            large = self.to_screen(small)
+            screen.blit(pygame.transform.scale(canvas.subsurface(small), large.size), large)
+            for _, surface, rect in native:
+                if rect.colliderect(large):
+                    part = rect.clip(large)
+                    screen.blit(surface, part, part.move(-rect.x, -rect.y))
+            self.stats['pixels'] += large.width * large.height
+            repaired.append(large)
+        return repaired
+
+    def repair_canvas(self, small, small_background, sprites):
+        """Repaint a canvas region from the background and the scaled sprites over it"""
+        canvas = self.canvas
+        canvas.blit(small_background, small, small)
+        for surface, rect in sprites:
+            if rect.colliderect(small):
+                part = rect.clip(small)
+                canvas.blit(surface, part, part.move(-rect.x, -rect.y))
+
+    def to_output_region(self, area):
+        """Window region covering a screen region, aligned so it comes from whole canvas pixels"""
+        width, height = self.output.get_size()
+        ratio_x = Fraction(width, self.canvas_rect.width)
+        ratio_y = Fraction(height, self.canvas_rect.height)
+        # Scaled native sprites round their position and size, so reach one window pixel further
+        margin = math.ceil(self.screen_rect.width / width) + 1
+        small = self.to_canvas(area.inflate(margin * 2, margin * 2))
+        step_x, step_y = ratio_x.denominator, ratio_y.denominator
+        left, top = small.left // step_x * step_x, small.top // step_y * step_y
+        right, bottom = -(-small.right // step_x) * step_x, -(-small.bottom // step_y) * step_y
+        small = pygame.Rect(left, top, right - left, bottom - top).clip(self.canvas_rect)
+        return pygame.Rect(int(small.x * ratio_x), int(small.y * ratio_y),
+                           int(small.width * ratio_x), int(small.height * ratio_y))
+
+    def render_to_output(self, small_background, sprites, native, damage):
+        """render_scaled() onto a window of another size: the canvas is scaled straight to it, native drawables at window size"""
+        canvas = self.canvas
+        output = self.output
+        native_sprites = self.scale_native(native)
+        if damage is None or sum(rect.width * rect.height for rect in damage) > self.full_flip_area:
+            self.full = False
+            self.stats['full_frames'] += 1
+            self.stats['pixels'] += self.screen_rect.width * self.screen_rect.height
+            canvas.blit(small_background, (0, 0))
+            canvas.blits(sprites, doreturn=False)
+            pygame.transform.scale(canvas, output.get_size(), output)
+            output.blits(native_sprites, doreturn=False)
+            return None
+
+        # Aligned regions can overlap once widened; merged, they stay aligned
+        regions = merge_rects(self.to_output_region(area) for area in damage)
+        repaired = []
+        screen_share = self.screen_rect.width * self.screen_rect.height / (output.get_width() * output.get_height())
+        for large in regions:
+            small = pygame.Rect(large.x * canvas.get_width() // output.get_width(),
+                                large.y * canvas.get_height() // output.get_height(),
+                                large.width * canvas.get_width() // output.get_width(),
+                                large.height * canvas.get_height() // output.get_height())
+            self.repair_canvas(small, small_background, sprites)
+            output.blit(pygame.transform.scale(canvas.subsurface(small), large.size), large)
+            for surface, rect in native_sprites:
+                if rect.colliderect(large):
+                    part = rect.clip(large)
+                    output.blit(surface, part, part.move(-rect.x, -rect.y))
+            self.stats['pixels'] += large.width * large.height * screen_share
+            repaired.append(large)
+        return repaired
+
+    def report(self):
+        frames = max(1, self.stats['frames'])
+        screen_pixels = self.screen_rect.width * self.screen_rect.height
+        return (f"Dirty rects: {self.stats['full_frames'] / frames:.0%} full frames, "
+                f"{self.stats['pixels'] / (frames * screen_pixels):.1%} of the screen pushed per frame")
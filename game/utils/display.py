@@ -0,0 +1,94 @@
+"""The game window: the game draws at a fixed size and is scaled to the chosen resolution"""
+import threading
+
+import pygame
+
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+CAPTION = "Flokapp - Space Explorer"
+
+
+def can_convert():
+    """Whether surfaces may be converted to the display format here: a window is open and this is the main thread"""
+    return pygame.display.get_surface() is not None and threading.current_thread() is threading.main_thread()
+
+
+class Display:
+    """Opens the window and pushes finished frames to it.
+
+    Scenes always draw to a canvas of SCREEN_WIDTH x SCREEN_HEIGHT. When the
+    window is that size the canvas is the window surface itself and nothing
+    changes; otherwise each frame is scaled onto the window in one
+    transform.scale call, and pointer positions are mapped back to the canvas.
+    A renderer that already drew a frame straight onto the window at its own
+    size (see output) presents it with composed=True, which skips that scale
+    and pushes only the window regions it repainted.
+    """
+
+    def __init__(self):
+        self.window = None
+        self.canvas = None
+        self.mode = None
+        self.vsync = False
+
+    def open(self, resolution, vsync=False):
+        """Create or re-create the window if the mode changed; returns True if it did"""
+        mode = (tuple(resolution), vsync)
+        if mode == self.mode:
+            return False
+        self.mode = mode
+        self.window = None
+        self.vsync = False
+        if vsync:
+            # Software surfaces only sync through SDL's renderer, which SCALED turns on
+            try:
+                self.window = pygame.display.set_mode(mode[0], pygame.SCALED, vsync=1)
+                self.vsync = True
+            except pygame.error:
+                pass
+        if self.window is None:
+            self.window = pygame.display.set_mode(mode[0])
+        pygame.display.set_caption(CAPTION)
+        if self.window.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            self.canvas = self.window
+        else:
+            self.canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        return True
+
+    @property
+    def scaled(self):
+        return self.canvas is not self.window
+
+    @property
+    def output(self):
+        """The window when it differs in size from the canvas, or None"""
+        return self.window if self.scaled else None
+
+    def present(self, rects, composed=False):
+        """Show the canvas; rects are the regions that changed, or None for all of it.
+
+        composed means the frame is already on the window at window size, and
+        rects are then window regions.
+        """
+        if rects == []:
+            return
+        if not self.scaled or composed:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+        pygame.transform.scale(self.canvas, self.window.get_size(), self.window)
+        pygame.display.flip()
+
+    def to_canvas(self, pos):
+        """Window coordinates to canvas coordinates"""
+        width, height = self.window.get_size()
+        return (pos[0] * SCREEN_WIDTH // width, pos[1] * SCREEN_HEIGHT // height)
+
+    def map_event(self, event):
+        """The event with any pointer position moved onto the canvas"""
+        if not self.scaled or not hasattr(event, 'pos'):
+            return event
+        attributes = dict(event.dict, pos=self.to_canvas(event.pos))
+        return pygame.event.Event(event.type, attributes)
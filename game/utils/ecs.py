@@ -0,0 +1,331 @@
+"""Archetype entity-component storage with systems that update every entity of a kind in bulk"""
+from array import array
+
+import numpy as np
+
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.utils.sprite_cache import get_sprite_cache
+
+# name -> (dtype, shape); a dtype of None makes a tag, which has no data and only sorts entities
+COMPONENTS = {}
+INITIAL_CAPACITY = 16
+
+
+def define_component(name, dtype=np.float64, shape=()):
+    """Register a component; entity modules define their own next to the entity"""
+    COMPONENTS[name] = (dtype, shape)
+    return name
+
+
+def define_tag(name):
+    return define_component(name, None)
+
+
+POSITION = define_component('position', shape=(2,))
+VELOCITY = define_component('velocity', shape=(2,))
+RADIUS = define_component('radius', np.int64)
+ROTATION = define_component('rotation')
+SPIN = define_component('spin')
+AGE = define_component('age')
+# Shown and interactive; a multiplayer client hides what the server hasn't sent
+VISIBLE = define_component('visible', np.bool_)
+ACTIVE = define_component('active', np.bool_)
+# Circular orbit around a fixed center, or around the parent entity's position
+ORBIT_CENTER = define_component('orbit_center', shape=(2,))
+ORBIT_RADIUS = define_component('orbit_radius')
+ORBIT_ANGLE = define_component('orbit_angle')
+ORBIT_SPEED = define_component('orbit_speed')
+PARENT = define_component('parent', np.int64)
+NAME = define_component('name', object)
+COLOR = define_component('color', object)
+# Leaves the screen on one side and comes back on the other
+WRAPS = define_tag('wraps')
+
+
+class Archetype:
+    """Every entity with exactly one set of components, each component a contiguous column"""
+
+    def __init__(self, names, capacity=INITIAL_CAPACITY):
+        self.names = frozenset(names)
+        self.count = 0
+        self.entities = np.zeros(capacity, dtype=np.int64)
+        self.columns = {}
+        for name in self.names:
+            dtype, shape = COMPONENTS[name]
+            if dtype is not None:
+                self.columns[name] = np.zeros((capacity,) + shape, dtype=dtype)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, name):
+        """The live rows of a column; writes go straight to the entities"""
+        return self.columns[name][:self.count]
+
+    def __setitem__(self, name, values):
+        # In-place operators on a column (a[POSITION] += ...) end here
+        self.columns[name][:self.count] = values
+
+    @property
+    def ids(self):
+        return self.entities[:self.count]
+
+    def append(self, entity, values):
+        if self.count == len(self.entities):
+            self.grow()
+        row = self.count
+        self.entities[row] = entity
+        for name, column in self.columns.items():
+            column[row] = values[name]
+        self.count += 1
+        return row
+
+    def grow(self):
+        capacity = len(self.entities) * 2
+        self.entities = np.resize(self.entities, capacity)
+        for name, column in self.columns.items():
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def remove(self, row):
+        """Fill the row with the last entity; returns the entity that moved, or None"""
+        last = self.count - 1
+        moved = None
+        if row != last:
+            moved = int(self.entities[last])
+            self.entities[row] = moved
+            for column in self.columns.values():
+                column[row] = column[last]
+        for column in self.columns.values():
+            if column.dtype == object:
+                column[last] = None
+        self.count = last
+        return moved
+
+
+class World:
+    """Entities as integer ids, stored in one Archetype per component set.
+
+    Systems ask for every archetype holding some components and work on
+    whole columns at once. Code that handles one entity at a time goes
+    through an EntityView instead. Where each entity lives is kept in flat
+    tables indexed by its id rather than dicts of tuples; ids are never
+    reused, so the tables only grow.
+    """
+
+    def __init__(self):
+        self.archetypes = {}
+        self.archetype_of = [None]
+        self.rows = array('q', [-1])
+        self.views = [None]
+        self.queries = {}
+
+    def spawn(self, components, view=None):
+        """New entity from a dict of component values (None for tags); returns its id"""
+        names = frozenset(components)
+        archetype = self.archetypes.get(names)
+        if archetype is None:
+            archetype = self.archetypes[names] = Archetype(names)
+            self.queries = {}
+        entity = len(self.rows)
+        self.archetype_of.append(archetype)
+        self.rows.append(archetype.append(entity, components))
+        self.views.append(view)
+        return entity
+
+    def despawn(self, entity):
+        archetype, row = self.locate(entity)
+        self.archetype_of[entity] = None
+        self.rows[entity] = -1
+        self.views[entity] = None
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.rows[moved] = row
+
+    def locate(self, entity):
+        """(archetype, row) an entity is stored at"""
+        return self.archetype_of[entity], self.rows[entity]
+
+    def query(self, *names):
+        """Archetypes that have all of the named components"""
+        key = frozenset(names)
+        archetypes = self.queries.get(key)
+        if archetypes is None:
+            archetypes = self.queries[key] = [a for a in self.archetypes.values() if key <= a.names]
+        return archetypes
+
+    def view(self, entity):
+        return self.views[entity]
+
+    def fill(self, tag, name, value):
+        """Set one component on every entity with a tag"""
+        for archetype in self.query(tag, name):
+            archetype[name][:] = value
+
+    def positions_of(self, entities):
+        """(n, 2) positions of the given entities; each distinct one is looked up once"""
+        unique, inverse = np.unique(entities, return_inverse=True)
+        positions = np.empty((len(unique), 2))
+        for i, entity in enumerate(unique.tolist()):
+            archetype, row = self.locate(entity)
+            positions[i] = archetype.columns[POSITION][row]
+        return positions[inverse]
+
+
+class Field:
+    """An EntityView attribute kept in a component column; index picks one element of a vector"""
+
+    def __init__(self, component, index=None):
+        self.component = component
+        self.index = index
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        world, entity = view.world, view.entity
+        archetype, row = world.archetype_of[entity], world.rows[entity]
+        column = archetype.columns[self.component]
+        # item() hands back plain Python values, so callers can compare, format and send them as before
+        return column.item(row) if self.index is None else column.item(row, self.index)
+
+    def __set__(self, view, value):
+        world, entity = view.world, view.entity
+        archetype, row = world.archetype_of[entity], world.rows[entity]
+        if self.index is None:
+            archetype.columns[self.component][row] = value
+        else:
+            archetype.columns[self.component][row, self.index] = value
+
+
+class EntityView:
+    """Object-style handle on one entity, for code that deals with entities one at a time.
+
+    Subclasses set tag, declare their attributes as Fields and spawn their
+    component bundle through __init__. Without a world they get one of their
+    own, so an entity can still be made and used standalone. Views are
+    slotted and keep no state of their own besides the entity id; subclasses
+    declare __slots__ = () and put shared, per-kind data in module tables.
+    """
+
+    __slots__ = ('world', 'entity')
+    tag = None
+
+    def __init__(self, components, world=None):
+        self.world = world if world is not None else World()
+        components[self.tag] = None
+        self.entity = self.world.spawn(components, self)
+
+    x = Field(POSITION, 0)
+    y = Field(POSITION, 1)
+    radius = Field(RADIUS)
+
+    @staticmethod
+    def sprite_keys(archetype):
+        """Sprite cache key for every entity in an archetype of this kind"""
+        raise NotImplementedError
+
+    @staticmethod
+    def build_sprite(key):
+        raise NotImplementedError
+
+
+def move(world, dt):
+    """Advance everything with a velocity"""
+    for archetype in world.query(POSITION, VELOCITY):
+        archetype[POSITION] += archetype[VELOCITY] * dt
+
+
+def spin(world, dt):
+    for archetype in world.query(ROTATION, SPIN):
+        archetype[ROTATION] += archetype[SPIN] * dt
+
+
+def age(world, dt):
+    for archetype in world.query(AGE):
+        archetype[AGE] += dt
+
+
+def wrap(world, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Entities fully off one edge reappear just off the opposite one"""
+    for archetype in world.query(POSITION, RADIUS, WRAPS):
+        position = archetype[POSITION]
+        radius = archetype[RADIUS]
+        for axis, size in ((0, width), (1, height)):
+            coordinate = position[:, axis]
+            low = coordinate < -radius
+            high = coordinate > size + radius
+            coordinate[low] = size + radius[low]
+            coordinate[high] = -radius[high]
+
+
+def orbit(world, dt):
+    """Move orbiting entities along their circles; orbits around a parent follow it.
+
+    Parents are placed before their children, so one level of nesting (a
+    satellite around an orbiting planet) lands where it should.
+    """
+    parented = []
+    for archetype in world.query(POSITION, ORBIT_RADIUS, ORBIT_ANGLE, ORBIT_SPEED):
+        speed = archetype[ORBIT_SPEED]
+        if ACTIVE in archetype.names:
+            speed = speed * archetype[ACTIVE]
+        archetype[ORBIT_ANGLE] += speed * dt
+        if PARENT in archetype.names:
+            parented.append(archetype)
+        else:
+            place_on_orbit(archetype, archetype[ORBIT_CENTER])
+    for archetype in parented:
+        place_on_orbit(archetype, world.positions_of(archetype[PARENT]))
+
+
+def place_on_orbit(archetype, center):
+    angle = archetype[ORBIT_ANGLE]
+    radius = archetype[ORBIT_RADIUS]
+    position = archetype[POSITION]
+    position[:, 0] = center[:, 0] + np.cos(angle) * radius
+    position[:, 1] = center[:, 1] + np.sin(angle) * radius
+
+
+def within(world, tag, x, y, reach, add_radius=True):
+    """Ids of entities with a tag closer than reach (plus their own radius) to a point, in spawn order"""
+    hits = []
+    for archetype in world.query(tag, POSITION, RADIUS):
+        position = archetype[POSITION]
+        distance = np.hypot(position[:, 0] - x, position[:, 1] - y)
+        limit = reach + archetype[RADIUS] if add_radius else reach
+        hits.extend(archetype.ids[distance < limit].tolist())
+    return hits
+
+
+def nearest(world, tag, x, y, max_distance):
+    """Id of the entity with a tag closest to a point and under max_distance away, or None"""
+    best, best_distance = None, max_distance
+    for archetype in world.query(tag, POSITION):
+        if not archetype.count:
+            continue
+        position = archetype[POSITION]
+        distance = np.hypot(position[:, 0] - x, position[:, 1] - y)
+        index = int(np.argmin(distance))
+        if distance[index] < best_distance:
+            best, best_distance = int(archetype.ids[index]), distance[index]
+    return best
+
+
+def drawables(world, kind):
+    """(entity id, surface, rect) for every visible entity of an EntityView kind, from the sprite cache"""
+    sprites = get_sprite_cache()
+    result = []
+    for archetype in world.query(kind.tag, POSITION):
+        if not archetype.count:
+            continue
+        keys = kind.sprite_keys(archetype)
+        ids = archetype.ids
+        positions = archetype[POSITION]
+        if VISIBLE in archetype.names:
+            visible = archetype[VISIBLE]
+            keys = [key for key, shown in zip(keys, visible.tolist()) if shown]
+            ids, positions = ids[visible], positions[visible]
+        placed = sprites.place_many(keys, kind.build_sprite, positions)
+        result += [(entity, surface, rect) for entity, (surface, rect) in zip(ids.tolist(), placed)]
+    return result
@@ -0,0 +1,58 @@
+"""Typed gameplay events, queued as they happen and delivered together once per frame"""
+from collections import namedtuple
+
+# Events hold plain values only, so a frame's exact duplicates compare equal and collapse
+PlanetVisited = namedtuple('PlanetVisited', ['name', 'x', 'y', 'color'])
+AsteroidScanned = namedtuple('AsteroidScanned', ['x', 'y', 'mineral', 'size', 'value'])
+StationDocked = namedtuple('StationDocked', ['name', 'x', 'y', 'message', 'crew'])
+QuestionAnswered = namedtuple('QuestionAnswered', ['correct', 'explanation', 'x', 'y'])
+
+
+class EventBus:
+    """Gameplay side effects decoupled from the code that causes them.
+
+    emit() only queues the event; the update loop never waits on sound,
+    particles or dialogs. flush() (once per frame) hands every queued event
+    to the subscribers of its type, in the order the events were first
+    emitted. An event equal to one already queued this frame is dropped.
+    Events emitted by a subscriber during flush() go out on the next one.
+    """
+
+    def __init__(self):
+        self.subscribers = {}
+        self.pending = {}
+        self.stats = {'emitted': 0, 'coalesced': 0, 'delivered': 0}
+
+    def subscribe(self, event_type, callback):
+        """Call callback(event) at flush time for each event of event_type"""
+        self.subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        callbacks = self.subscribers.get(event_type, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def emit(self, event):
+        """Queue an event for the end of the frame"""
+        self.stats['emitted'] += 1
+        # Tuples of different types can compare equal, so the type is part of the key
+        key = (type(event), event)
+        if key in self.pending:
+            self.stats['coalesced'] += 1
+        else:
+            self.pending[key] = event
+
+    def flush(self):
+        """Deliver this frame's events; returns how many went out"""
+        if not self.pending:
+            return 0
+        pending, self.pending = self.pending, {}
+        for (event_type, _), event in pending.items():
+            for callback in self.subscribers.get(event_type, ()):
+                callback(event)
+        self.stats['delivered'] += len(pending)
+        return len(pending)
+
+    def report(self):
+        return (f"Events: {self.stats['delivered']} delivered, "
+                f"{self.stats['coalesced']} coalesced of {self.stats['emitted']} emitted")
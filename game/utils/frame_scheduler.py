@@ -0,0 +1,94 @@
+"""Frame pacing that backs off when nothing on screen is moving"""
+import time
+
+import pygame
+
+from game.constants import FPS
+
+ACTIVE = 'active'
+AMBIENT = 'ambient'
+IDLE = 'idle'
+
+# Scenes whose only motion is decorative get this many frames per second
+AMBIENT_FPS = 15
+# With nothing moving, still wake this often for network and leaderboard updates
+IDLE_TIMEOUT_MS = 250
+# Unchanged frames in a row before a scene counts as idle
+IDLE_AFTER_FRAMES = 3
+
+
+class FrameScheduler:
+    """Chooses how long to wait before each frame and measures CPU use per scene.
+
+    Frames run at the full rate while the scene says it is animating or input
+    arrives, at AMBIENT_FPS while the screen still changes, and otherwise only
+    when input arrives or IDLE_TIMEOUT_MS passes. The slow modes wait inside
+    pygame.event.wait, so a key press starts the next frame immediately.
+    """
+
+    def __init__(self, fps=FPS):
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.mode = ACTIVE
+        self.still_frames = 0
+        self.last_frame = time.perf_counter()
+        # Set by the first end_frame, so startup isn't charged to the first scene
+        self.frame_started = None
+        self.last_cpu = None
+        # scene -> [frames, wall seconds, cpu seconds, idle frames]
+        self.scene_stats = {}
+
+    def wait(self):
+        """Block until the next frame is due; returns (dt_ms, events)"""
+        events = []
+        if self.mode == ACTIVE:
+            self.clock.tick(self.fps)
+        else:
+            interval = 1.0 / AMBIENT_FPS if self.mode == AMBIENT else IDLE_TIMEOUT_MS / 1000.0
+            remaining_ms = int((self.last_frame + interval - time.perf_counter()) * 1000)
+            if remaining_ms > 0:
+                event = pygame.event.wait(remaining_ms)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+            # Keep the clock's idea of the last frame current for when we speed up again
+            self.clock.tick()
+        events.extend(pygame.event.get())
+        now = time.perf_counter()
+        dt_ms = int(round((now - self.last_frame) * 1000))
+        self.last_frame = now
+        return dt_ms, events
+
+    def end_frame(self, scene, animating, changed):
+        """Charge the frame's time to a scene and pick the pace of the next one"""
+        now = time.perf_counter()
+        cpu = time.process_time()
+        stats = self.scene_stats.setdefault(scene, [0, 0.0, 0.0, 0])
+        if self.frame_started is not None:
+            stats[0] += 1
+            stats[1] += now - self.frame_started
+            stats[2] += cpu - self.last_cpu
+        self.frame_started = now
+        self.last_cpu = cpu
+
+        self.still_frames = 0 if changed else self.still_frames + 1
+        if animating:
+            self.mode = ACTIVE
+        elif self.still_frames < IDLE_AFTER_FRAMES:
+            self.mode = AMBIENT
+        else:
+            self.mode = IDLE
+        if self.mode == IDLE:
+            stats[3] += 1
+
+    def cpu_share(self, scene):
+        """Fraction of wall time the process spent on the CPU while in a scene"""
+        stats = self.scene_stats.get(scene)
+        return stats[2] / stats[1] if stats and stats[1] else 0.0
+
+    def report(self):
+        # Columns are space-separated so wide values (fast replays) never run together
+        lines = [f"{'scene':<15} {'frames':>9} {'fps':>9} {'cpu':>6} {'idle':>6}"]
+        for scene, (frames, wall, cpu, idle) in self.scene_stats.items():
+            lines.append(f"{scene:<15} {frames:>9} {frames / wall if wall else 0:>9.1f} "
+                         f"{cpu / wall if wall else 0:>6.0%} {idle / frames if frames else 0:>6.0%}")
+        return lines
@@ -0,0 +1,7 @@
+"""Geometry helpers for the wrapping play field"""
+
+
+def wrapped_delta(a, b, size):
+    """Shortest signed distance from a to b on a wrapping axis"""
+    delta = (b - a) % size
+    return delta - size if delta > size / 2 else delta
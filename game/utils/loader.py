@@ -0,0 +1,107 @@
+"""Start-up work on a worker thread, with progress reported back to the main thread"""
+import queue
+import threading
+import time
+
+_FINISHED = object()
+
+
+class BootLoader:
+    """Runs start-up steps in order, first on a worker thread, then on the main thread.
+
+    Steps are (label, weight, func) tuples; weights are the rough share of
+    the loading time each takes, so the progress bar moves evenly. Worker
+    steps must not touch the display or fonts: the worker puts (fraction,
+    label) messages on a queue as each starts, and the main thread reads
+    them with poll() between frames of the loading screen. Main steps run
+    inside poll() once the worker is done; a main step that is a generator
+    runs one chunk per poll(), yielding the share of the step it has done,
+    so the loading screen keeps drawing while it works.
+    """
+
+    def __init__(self, steps, main_steps=()):
+        self.steps = steps
+        self.main_steps = list(main_steps)
+        self.total = sum(weight for _, weight, _ in self.steps + self.main_steps) or 1
+        self.progress = queue.Queue()
+        self.fraction = 0.0
+        first = (self.steps + self.main_steps)[:1]
+        self.label = first[0][0] if first else ""
+        self.worker_done = False
+        self.done = False
+        self.error = None
+        self.timings = []
+        self.completed = sum(weight for _, weight, _ in self.steps)
+        self.main_index = 0
+        self.main_work = None
+        self.main_seconds = 0.0
+        self.worker = threading.Thread(target=self.run, name='loader', daemon=True)
+
+    def start(self):
+        self.worker.start()
+        return self
+
+    def run(self):
+        completed = 0
+        try:
+            for label, weight, func in self.steps:
+                self.progress.put((completed / self.total, label))
+                started = time.perf_counter()
+                func()
+                self.timings.append((label, time.perf_counter() - started))
+                completed += weight
+        except Exception as error:
+            self.progress.put(error)
+            return
+        self.progress.put((completed / self.total, None))
+
+    def poll(self):
+        """Take the worker's latest progress, then run main steps; returns True once every step has finished"""
+        while not self.worker_done:
+            try:
+                message = self.progress.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(message, Exception):
+                self.error = message
+                self.worker_done = True
+            else:
+                self.fraction, label = message
+                if label is None:
+                    self.worker_done = True
+                else:
+                    self.label = label
+        if not self.worker_done:
+            return False
+        self.worker.join()
+        if self.error is not None:
+            self.done = True
+            raise self.error
+        self.done = self.advance_main()
+        return self.done
+
+    def advance_main(self):
+        """Run the next chunk of main-thread work; returns True once none is left"""
+        if self.main_index == len(self.main_steps):
+            return True
+        label, weight, func = self.main_steps[self.main_index]
+        started = time.perf_counter()
+        if self.main_work is None:
+            self.label = label
+            self.main_seconds = 0.0
+            # A plain function does all of its work here
+            self.main_work = iter(func() or ())
+        share = next(self.main_work, _FINISHED)
+        self.main_seconds += time.perf_counter() - started
+        if share is _FINISHED:
+            self.timings.append((label, self.main_seconds))
+            self.completed += weight
+            self.fraction = self.completed / self.total
+            self.main_index += 1
+            self.main_work = None
+            return self.main_index == len(self.main_steps)
+        self.fraction = (self.completed + weight * share) / self.total
+        return False
+
+    def report(self):
+        return [f"  {label}: {seconds * 1000:.0f} ms" for label, seconds in self.timings]
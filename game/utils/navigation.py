@@ -0,0 +1,256 @@
+"""Autopilot navigation: D* Lite over a coarse, wrapping occupancy grid"""
+import heapq
+import math
+import time
+
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.utils.geometry import wrapped_delta
+
+CELL_SIZE = 32
+# Extra clearance around asteroids on top of the ship's radius
+CLEARANCE = 6
+# Upper bound on planner node expansions in one frame
+EXPANSION_BUDGET = 300
+ARRIVE_DISTANCE = 8
+INF = float('inf')
+SQRT2 = math.sqrt(2)
+
+NEIGHBOR_STEPS = [(dx, dy, SQRT2 if dx and dy else 1.0)
+                  for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+class OccupancyGrid:
+    """Cells covered by asteroids; the grid wraps like the screen does"""
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = math.ceil(width / cell_size)
+        self.rows = math.ceil(height / cell_size)
+        self.width = self.cols * cell_size
+        self.height = self.rows * cell_size
+        self.blocked = set()
+
+    def cell_at(self, x, y):
+        return int(x // self.cell_size) % self.cols, int(y // self.cell_size) % self.rows
+
+    def center(self, cell):
+        return (cell[0] + 0.5) * self.cell_size, (cell[1] + 0.5) * self.cell_size
+
+    def neighbors(self, cell):
+        """(neighbor, step length) for the eight surrounding cells"""
+        x, y = cell
+        return [(((x + dx) % self.cols, (y + dy) % self.rows), cost) for dx, dy, cost in NEIGHBOR_STEPS]
+
+    def distance(self, a, b):
+        """Octile distance in cells, taking the shorter way around"""
+        dx = abs(wrapped_delta(a[0], b[0], self.cols))
+        dy = abs(wrapped_delta(a[1], b[1], self.rows))
+        return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+    def cells_covered(self, obstacles, margin):
+        """Cells whose centers fall within any obstacle's radius plus margin"""
+        covered = set()
+        size = self.cell_size
+        for obstacle in obstacles:
+            reach = obstacle.radius + margin
+            span = int(reach // size) + 1
+            cx, cy = self.cell_at(obstacle.x, obstacle.y)
+            for dx in range(-span, span + 1):
+                for dy in range(-span, span + 1):
+                    cell = ((cx + dx) % self.cols, (cy + dy) % self.rows)
+                    px, py = self.center(cell)
+                    ox = wrapped_delta(obstacle.x, px, self.width)
+                    oy = wrapped_delta(obstacle.y, py, self.height)
+                    if ox * ox + oy * oy <= reach * reach:
+                        covered.add(cell)
+        return covered
+
+    def update(self, obstacles, margin):
+        """Re-rasterize obstacles; returns the cells whose state flipped"""
+        covered = self.cells_covered(obstacles, margin)
+        changed = covered ^ self.blocked
+        self.blocked = covered
+        return changed
+
+
+class DStarLite:
+    """Incremental shortest paths from a moving start to a fixed goal.
+
+    Costs are searched backwards from the goal, so when the ship moves only
+    the heuristic offset km changes, and when cells block or clear only the
+    vertices around them are reopened. compute() stops after a budget of
+    expansions and picks up where it left off on the next call.
+    """
+
+    def __init__(self, grid, start, goal):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.last_start = start
+        self.km = 0.0
+        self.g = {}
+        self.rhs = {goal: 0.0}
+        self.queue = []
+        self.open = {}
+        self.push(goal)
+
+    def cost(self, cell):
+        """Cost of entering a cell; the goal is always enterable"""
+        return INF if cell in self.grid.blocked and cell != self.goal else 0.0
+
+    def calculate_key(self, cell):
+        best = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (best + self.grid.distance(self.start, cell) + self.km, best)
+
+    def push(self, cell):
+        key = self.calculate_key(cell)
+        self.open[cell] = key
+        heapq.heappush(self.queue, (key, cell))
+
+    def update_vertex(self, cell):
+        if cell != self.goal:
+            best = INF
+            for neighbor, step in self.grid.neighbors(cell):
+                candidate = step + self.cost(neighbor) + self.g.get(neighbor, INF)
+                if candidate < best:
+                    best = candidate
+            self.rhs[cell] = best
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self.push(cell)
+        else:
+            self.open.pop(cell, None)
+
+    def top(self):
+        """Smallest live queue entry, dropping stale ones"""
+        while self.queue:
+            key, cell = self.queue[0]
+            if self.open.get(cell) == key:
+                return key, cell
+            heapq.heappop(self.queue)
+        return None
+
+    def consistent_at_start(self):
+        return self.g.get(self.start, INF) == self.rhs.get(self.start, INF)
+
+    def compute(self, budget=EXPANSION_BUDGET):
+        """Expand up to budget vertices; returns (expansions, finished)"""
+        expansions = 0
+        while expansions < budget:
+            entry = self.top()
+            if entry is None or (entry[0] >= self.calculate_key(self.start) and self.consistent_at_start()):
+                return expansions, True
+            old_key, cell = entry
+            heapq.heappop(self.queue)
+            expansions += 1
+            new_key = self.calculate_key(cell)
+            if old_key < new_key:
+                self.push(cell)
+                continue
+            del self.open[cell]
+            g = self.g.get(cell, INF)
+            rhs = self.rhs.get(cell, INF)
+            if g > rhs:
+                self.g[cell] = rhs
+                for neighbor, _ in self.grid.neighbors(cell):
+                    self.update_vertex(neighbor)
+            else:
+                self.g[cell] = INF
+                self.update_vertex(cell)
+                for neighbor, _ in self.grid.neighbors(cell):
+                    self.update_vertex(neighbor)
+        return expansions, False
+
+    def move_start(self, cell):
+        if cell != self.start:
+            self.km += self.grid.distance(self.last_start, cell)
+            self.last_start = cell
+            self.start = cell
+
+    def cells_changed(self, cells):
+        """Reopen vertices whose edge costs changed because cells blocked or cleared"""
+        for cell in cells:
+            self.update_vertex(cell)
+            for neighbor, _ in self.grid.neighbors(cell):
+                self.update_vertex(neighbor)
+
+    def next_cell(self):
+        """Best neighbor to step into from the start, or None if there is no path"""
+        best, best_cell = INF, None
+        for neighbor, step in self.grid.neighbors(self.start):
+            candidate = step + self.cost(neighbor) + self.g.get(neighbor, INF)
+            if candidate < best:
+                best, best_cell = candidate, neighbor
+        return best_cell
+
+
+class Autopilot:
+    """Steers the player to a target by setting its movement keys each frame"""
+
+    def __init__(self, budget=EXPANSION_BUDGET):
+        self.grid = OccupancyGrid()
+        self.budget = budget
+        self.planner = None
+        self.target = None
+        self.target_name = None
+        self.stats = {'expansions': 0, 'plan_ms': 0.0, 'replans': 0, 'total_expansions': 0}
+
+    @property
+    def active(self):
+        return self.target is not None
+
+    def engage(self, x, y, name=None, player=None, obstacles=()):
+        """Start flying to a point; the first plan is spread over the next frames"""
+        self.target = (x, y)
+        self.target_name = name
+        margin = (player.radius if player else 0) + CLEARANCE
+        self.grid.update(obstacles, margin)
+        start = self.grid.cell_at(player.x, player.y) if player else self.grid.cell_at(x, y)
+        self.planner = DStarLite(self.grid, start, self.grid.cell_at(x, y))
+        self.stats['replans'] = 0
+
+    def cancel(self, player=None):
+        self.target = None
+        self.target_name = None
+        self.planner = None
+        if player:
+            for key in player.keys:
+                player.keys[key] = False
+
+    def update(self, player, obstacles):
+        """Replan around moved obstacles within the budget and set the player's keys"""
+        started = time.perf_counter()
+        planner = self.planner
+        changed = self.grid.update(obstacles, player.radius + CLEARANCE)
+        planner.move_start(self.grid.cell_at(player.x, player.y))
+        if changed:
+            planner.cells_changed(changed)
+            self.stats['replans'] += 1
+        expansions, finished = planner.compute(self.budget)
+        self.stats['expansions'] = expansions
+        self.stats['total_expansions'] += expansions
+        self.stats['plan_ms'] = (time.perf_counter() - started) * 1000
+
+        tx, ty = self.target
+        if planner.start == planner.goal:
+            aim = self.target
+            if math.hypot(wrapped_delta(player.x, tx, SCREEN_WIDTH),
+                          wrapped_delta(player.y, ty, SCREEN_HEIGHT)) < ARRIVE_DISTANCE:
+                self.cancel(player)
+                return
+        else:
+            step = planner.next_cell() if finished else None
+            # Hold position until a path is known rather than flying blind
+            aim = self.grid.center(step) if step and planner.g.get(step, INF) < INF else None
+        self.steer(player, aim)
+
+    def steer(self, player, aim):
+        if aim is None:
+            dx = dy = 0
+        else:
+            dx = wrapped_delta(player.x, aim[0], SCREEN_WIDTH)
+            dy = wrapped_delta(player.y, aim[1], SCREEN_HEIGHT)
+        dead_zone = ARRIVE_DISTANCE / 2
+        player.keys['left'] = dx < -dead_zone
+        player.keys['right'] = dx > dead_zone
+        player.keys['up'] = dy < -dead_zone
+        player.keys['down'] = dy > dead_zone
@@ -3,8 +3,15 @@ import pygame
 import math
 import random
 from game.constants import *
+from game.utils.sprite_cache import get_sprite_cache
+
+# Live particles allowed unless the settings lower it
+MAX_PARTICLES = 1000
 
 class Particle:
+    # Particles are made by the hundred every burst, so they skip the per-instance dict
+    __slots__ = ('x', 'y', 'velocity_x', 'velocity_y', 'color', 'life', 'max_life', 'size', 'gravity')
+    
     def __init__(self, x, y, velocity_x, velocity_y, color, life, size=2):
         self.x = x
         self.y = y
@@ -24,55 +31,73 @@ class Particle:
         self.life -= dt
         return self.life > 0
     
+    def get_sprite(self):
+        """Cached dot sprite for this particle and its screen rect"""
+        key = ('particle', self.color, self.size)
+        return get_sprite_cache().place(key, build_particle_sprite, self.x, self.y)
+    
     def render(self, screen):
         """Render the particle"""
         if self.life > 0:
-            # Fade alpha based on remaining life
-            alpha_ratio = self.life / self.max_life
-            alpha = int(255 * alpha_ratio)
-            
-            # Create surface with per-pixel alpha
-            particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            color_with_alpha = (*self.color, alpha)
-            pygame.draw.circle(particle_surface, self.color, (self.size, self.size), self.size)
-            
-            screen.blit(particle_surface, (int(self.x - self.size), int(self.y - self.size)))
+            surface, rect = self.get_sprite()
+            return screen.blit(surface, rect)
+
+def build_particle_sprite(key):
+    """Pre-render a particle dot"""
+    _, color, size = key
+    surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (size, size), size)
+    return surface, (size, size)
 
 class ParticleSystem:
-    def __init__(self):
+    def __init__(self, rng=None):
         self.particles = []
+        self.rng = rng or random
+        # Lowered by the quality governor on slow machines
+        self.emission_scale = 1.0
+        # Hard limit from the player's settings; new particles past it are dropped
+        self.max_particles = MAX_PARTICLES
+    
+    def spawn(self, particle):
+        """Add a particle unless the cap is reached"""
+        if len(self.particles) < self.max_particles:
+            self.particles.append(particle)
+    
+    def scaled(self, count):
+        """How many of count particles to actually emit"""
+        return max(1, round(count * self.emission_scale))
     
     def add_explosion(self, x, y, color=WHITE, count=20):
         """Add explosion particles"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
+        for _ in range(self.scaled(count)):
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(50, 150)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
-            life = random.uniform(0.5, 1.5)
-            size = random.randint(2, 4)
+            life = self.rng.uniform(0.5, 1.5)
+            size = self.rng.randint(2, 4)
             
             particle = Particle(x, y, velocity_x, velocity_y, color, life, size)
-            self.particles.append(particle)
+            self.spawn(particle)
     
     def add_thrust_particles(self, x, y, direction_angle, color=RED, count=5):
         """Add rocket thrust particles"""
-        for _ in range(count):
+        for _ in range(self.scaled(count)):
             # Particles go opposite to thrust direction
-            angle = direction_angle + math.pi + random.uniform(-0.5, 0.5)
-            speed = random.uniform(100, 200)
+            angle = direction_angle + math.pi + self.rng.uniform(-0.5, 0.5)
+            speed = self.rng.uniform(100, 200)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
-            life = random.uniform(0.3, 0.8)
-            size = random.randint(1, 3)
+            life = self.rng.uniform(0.3, 0.8)
+            size = self.rng.randint(1, 3)
             
             particle = Particle(x, y, velocity_x, velocity_y, color, life, size)
             particle.gravity = 50  # Slight gravity effect
-            self.particles.append(particle)
+            self.spawn(particle)
     
     def add_scan_particles(self, x, y, radius=50, color=CYAN):
         """Add scanning effect particles"""
-        count = 15
+        count = self.scaled(15)
         for i in range(count):
             angle = (i / count) * 2 * math.pi
             start_radius = radius * 0.8
@@ -88,14 +113,14 @@ class ParticleSystem:
             size = 2
             
             particle = Particle(start_x, start_y, velocity_x, velocity_y, color, life, size)
-            self.particles.append(particle)
+            self.spawn(particle)
     
     def add_warp_particles(self, x, y, color=PURPLE, count=30):
         """Add warp/teleport effect particles"""
-        for _ in range(count):
+        for _ in range(self.scaled(count)):
             # Spiral pattern
-            angle = random.uniform(0, 4 * math.pi)
-            radius = random.uniform(10, 60)
+            angle = self.rng.uniform(0, 4 * math.pi)
+            radius = self.rng.uniform(10, 60)
             
             start_x = x + math.cos(angle) * radius
             start_y = y + math.sin(angle) * radius
@@ -103,33 +128,37 @@ class ParticleSystem:
             # Particles converge to center
             velocity_x = (x - start_x) * 2
             velocity_y = (y - start_y) * 2
-            life = random.uniform(0.5, 1.0)
-            size = random.randint(1, 3)
+            life = self.rng.uniform(0.5, 1.0)
+            size = self.rng.randint(1, 3)
             
             particle = Particle(start_x, start_y, velocity_x, velocity_y, color, life, size)
-            self.particles.append(particle)
+            self.spawn(particle)
     
     def add_success_particles(self, x, y):
         """Add celebration particles"""
         colors = [YELLOW, GREEN, CYAN, WHITE]
-        for _ in range(40):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 180)
+        for _ in range(self.scaled(40)):
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(80, 180)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed - 50  # Slight upward bias
             
-            color = random.choice(colors)
-            life = random.uniform(1.0, 2.0)
-            size = random.randint(2, 5)
+            color = self.rng.choice(colors)
+            life = self.rng.uniform(1.0, 2.0)
+            size = self.rng.randint(2, 5)
             
             particle = Particle(x, y, velocity_x, velocity_y, color, life, size)
             particle.gravity = 100  # Gravity for firework effect
-            self.particles.append(particle)
+            self.spawn(particle)
     
     def update(self, dt):
         """Update all particles"""
         self.particles = [p for p in self.particles if p.update(dt)]
     
+    def get_sprites(self):
+        """(particle, surface, rect) for every live particle"""
+        return [(particle, *particle.get_sprite()) for particle in self.particles if particle.life > 0]
+    
     def render(self, screen):
         """Render all particles"""
         for particle in self.particles:
@@ -0,0 +1,101 @@
+"""Frame-time driven quality tiers"""
+from collections import deque
+
+from game.constants import FPS
+
+# Each tier sets every registered knob; lower tiers trade looks for frame time
+QUALITY_TIERS = [
+    {'name': 'Low', 'particles': 0.25, 'stars': 0.3, 'glow_rings': False, 'text_antialias': False, 'render_scale': 0.5},
+    {'name': 'Medium', 'particles': 0.5, 'stars': 0.6, 'glow_rings': True, 'text_antialias': True, 'render_scale': 1.0},
+    {'name': 'High', 'particles': 1.0, 'stars': 1.0, 'glow_rings': True, 'text_antialias': True, 'render_scale': 1.0}
+]
+HIGH = len(QUALITY_TIERS) - 1
+
+# Frames in the rolling window
+WINDOW_FRAMES = 60
+# Step down when the window's mean frame time goes over budget...
+DOWNSHIFT_LOAD = 1.0
+# ...and up only when it sits well under, so the new tier has room to fit
+UPSHIFT_LOAD = 0.5
+# Seconds of frames with headroom needed before stepping up; doubles each time a step up has to be undone
+UPSHIFT_HOLD = 3.0
+MAX_UPSHIFT_HOLD = 60.0
+
+
+class QualityGovernor:
+    """Steps through QUALITY_TIERS to keep frame times inside the budget.
+
+    Subsystems register a knob (name, apply) and apply(tier) is called with
+    the tier dict now and whenever the tier changes. Frame times only count
+    the work of a frame, not time spent waiting for the next one. The hold
+    before stepping up is measured in elapsed time, so it lasts as long at a
+    30 fps cap or on an idling menu as at 60 fps.
+    """
+
+    def __init__(self, tier=HIGH, budget_ms=1000.0 / FPS):
+        self.tier = tier
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=WINDOW_FRAMES)
+        self.knobs = []
+        # Set to False to hold the current tier, e.g. while recording or replaying
+        self.enabled = True
+        self.headroom_ms = 0.0
+        self.upshift_hold = UPSHIFT_HOLD
+        self.last_change = None
+        self.ms_since_change = 0.0
+        self.changes = 0
+
+    @property
+    def settings(self):
+        return QUALITY_TIERS[self.tier]
+
+    def register(self, name, apply):
+        """Add a knob and set it for the current tier"""
+        self.knobs.append((name, apply))
+        apply(self.settings)
+
+    def set_tier(self, tier):
+        tier = max(0, min(HIGH, tier))
+        if tier == self.tier:
+            return
+        self.last_change = 'down' if tier < self.tier else 'up'
+        self.tier = tier
+        self.changes += 1
+        self.ms_since_change = 0.0
+        self.samples.clear()
+        self.headroom_ms = 0.0
+        for _, apply in self.knobs:
+            apply(self.settings)
+
+    def mean_frame_ms(self):
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def record(self, frame_ms, elapsed_ms=None):
+        """Add one frame's work time and change tier if the window calls for it.
+
+        elapsed_ms is the wall time since the previous frame; without it a
+        frame counts as one frame at the budget's rate.
+        """
+        if not self.enabled:
+            return
+        if elapsed_ms is None:
+            elapsed_ms = self.budget_ms
+        self.samples.append(frame_ms)
+        self.ms_since_change += elapsed_ms
+        if len(self.samples) < WINDOW_FRAMES:
+            return
+        load = self.mean_frame_ms() / self.budget_ms
+        if load > DOWNSHIFT_LOAD and self.tier > 0:
+            if self.last_change == 'up' and self.ms_since_change < self.upshift_hold * 1000:
+                # The last step up didn't fit; wait longer before trying again
+                self.upshift_hold = min(MAX_UPSHIFT_HOLD, self.upshift_hold * 2)
+            self.set_tier(self.tier - 1)
+        elif load < UPSHIFT_LOAD and self.tier < HIGH:
+            self.headroom_ms += elapsed_ms
+            if self.headroom_ms >= self.upshift_hold * 1000:
+                self.set_tier(self.tier + 1)
+        else:
+            self.headroom_ms = 0.0
+
+    def status(self):
+        return f"Quality: {self.settings['name']} ({self.mean_frame_ms():.1f} of {self.budget_ms:.1f} ms)"
@@ -0,0 +1,100 @@
+"""Input recording and replay for reproducible sessions"""
+import argparse
+import struct
+
+import pygame
+
+REPLAY_MAGIC = b'FLKR'
+REPLAY_VERSION = 1
+
+HEADER = struct.Struct('<4sHq')       # magic, version, seed
+FRAME = struct.Struct('<cH')          # b'F', frame duration in ms
+EVENT = struct.Struct('<cIBiH')       # b'E', frame index, event code, key, modifiers
+
+# Only the events the game reacts to are recorded
+EVENT_CODES = {pygame.KEYDOWN: 0, pygame.KEYUP: 1, pygame.QUIT: 2}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+
+def parse_seed(text):
+    """argparse type for a seed that fits the replay header"""
+    seed = int(text)
+    if not -2 ** 63 <= seed < 2 ** 63:
+        raise argparse.ArgumentTypeError(f"seed must fit in a signed 64-bit integer: {text}")
+    return seed
+
+
+class InputRecorder:
+    """Writes the seed, every frame's duration and every input event to a file"""
+
+    def __init__(self, path, seed):
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed))
+        self.frames = 0
+
+    def record_frame(self, frame, dt_ms, events):
+        """Record one frame's duration (as returned by Clock.tick) and its events"""
+        self.file.write(FRAME.pack(b'F', min(dt_ms, 0xFFFF)))
+        for event in events:
+            code = EVENT_CODES.get(event.type)
+            if code is None:
+                continue
+            key = getattr(event, 'key', 0)
+            mod = getattr(event, 'mod', 0) & 0xFFFF
+            self.file.write(EVENT.pack(b'E', frame, code, key, mod))
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+
+class InputReplay:
+    """A loaded recording: the seed, per-frame durations and events by frame"""
+
+    def __init__(self, seed, frame_durations, events_by_frame):
+        self.seed = seed
+        self.frame_durations = frame_durations
+        self.events_by_frame = events_by_frame
+
+    @property
+    def frame_count(self):
+        return len(self.frame_durations)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, seed = HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a Flokapp replay")
+
+        durations = []
+        events = {}
+        offset = HEADER.size
+        while offset < len(data):
+            tag = data[offset:offset + 1]
+            if tag == b'F' and offset + FRAME.size <= len(data):
+                durations.append(FRAME.unpack_from(data, offset)[1])
+                offset += FRAME.size
+            elif tag == b'E' and offset + EVENT.size <= len(data):
+                _, frame, code, key, mod = EVENT.unpack_from(data, offset)
+                events.setdefault(frame, []).append((code, key, mod))
+                offset += EVENT.size
+            else:
+                break  # truncated tail from an interrupted recording
+        return cls(seed, durations, events)
+
+    def frame_dt(self, frame):
+        """Frame duration in milliseconds"""
+        return self.frame_durations[frame]
+
+    def events_for(self, frame):
+        """Rebuild the pygame events recorded for a frame"""
+        events = []
+        for code, key, mod in self.events_by_frame.get(frame, ()):
+            event_type = EVENT_TYPES[code]
+            if event_type == pygame.QUIT:
+                events.append(pygame.event.Event(event_type))
+            else:
+                events.append(pygame.event.Event(event_type, key=key, mod=mod, unicode=''))
+        return events
@@ -0,0 +1,26 @@
+"""Seeded random number streams so runs can be reproduced"""
+import hashlib
+import random
+
+
+class RNGStreams:
+    """Hands out one independent random.Random per subsystem, all derived from one seed.
+
+    Streams are derived from (seed, name), so adding a new subsystem or drawing
+    more numbers in one subsystem never shifts the numbers another one sees.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.streams = {}
+
+    def stream(self, name):
+        """Get the stream for a subsystem, creating it on first use"""
+        rng = self.streams.get(name)
+        if rng is None:
+            digest = hashlib.sha256(f"{self.seed}:{name}".encode('utf-8')).digest()
+            rng = random.Random(int.from_bytes(digest[:8], 'little'))
+            self.streams[name] = rng
+        return rng
@@ -0,0 +1,186 @@
+"""Crash-safe save files: binary snapshot plus an append-only journal of stat deltas"""
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+
+from game.constants import DATA_DIR
+
+SNAPSHOT_MAGIC = b'FLKS'
+JOURNAL_MAGIC = b'FLKJ'
+SAVE_VERSION = 1
+
+SNAPSHOT_HEADER = struct.Struct('<4sHIH')   # magic, version, generation, counter count
+COUNTER_VALUE = struct.Struct('<q')
+BLOB_LENGTH = struct.Struct('<I')
+JOURNAL_HEADER = struct.Struct('<4sHI')     # magic, version, generation
+JOURNAL_RECORD = struct.Struct('<Bq')       # counter slot, delta
+
+# Compact the journal into a new snapshot after this many records
+COMPACT_AFTER = 512
+
+
+def encode_snapshot(generation, counters, extras):
+    """Serialize counters (name -> int) and extras (JSON-able) to bytes"""
+    parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SAVE_VERSION, generation, len(counters))]
+    for name, value in counters.items():
+        encoded = name.encode('utf-8')
+        parts.append(bytes([len(encoded)]) + encoded + COUNTER_VALUE.pack(value))
+    blob = zlib.compress(json.dumps(extras, separators=(',', ':')).encode('utf-8'))
+    parts.append(BLOB_LENGTH.pack(len(blob)) + blob)
+    return b''.join(parts)
+
+
+def decode_snapshot(data):
+    """Inverse of encode_snapshot; returns (generation, counter names, counters, extras)"""
+    magic, version, generation, count = SNAPSHOT_HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC or version != SAVE_VERSION:
+        raise ValueError("Not a Flokapp save snapshot")
+    offset = SNAPSHOT_HEADER.size
+    names = []
+    counters = {}
+    for _ in range(count):
+        length = data[offset]
+        name = data[offset + 1:offset + 1 + length].decode('utf-8')
+        offset += 1 + length
+        counters[name] = COUNTER_VALUE.unpack_from(data, offset)[0]
+        offset += COUNTER_VALUE.size
+        names.append(name)
+    (blob_length,) = BLOB_LENGTH.unpack_from(data, offset)
+    offset += BLOB_LENGTH.size
+    extras = json.loads(zlib.decompress(data[offset:offset + blob_length]).decode('utf-8'))
+    return generation, names, counters, extras
+
+
+def write_atomic(path, data):
+    """Write a file via a temporary file and rename so readers never see half of it"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SaveSystem:
+    """Persists player progress without blocking the frame loop.
+
+    The main thread only buffers deltas and enqueues jobs; a writer thread
+    does the serialization and disk I/O. Each snapshot has a generation
+    number and the journal header names the generation it extends, so a crash
+    between writing a snapshot and resetting the journal never double-counts.
+    A torn final journal record is ignored on load. The writer never raises;
+    the error from its latest failed write is kept in last_error until a
+    write succeeds again.
+    """
+
+    def __init__(self, directory=None, slot='default', compact_after=COMPACT_AFTER):
+        self.directory = directory or os.path.join(DATA_DIR, 'saves')
+        self.snapshot_path = os.path.join(self.directory, f"{slot}.sav")
+        self.journal_path = os.path.join(self.directory, f"{slot}.journal")
+        self.compact_after = compact_after
+
+        self.generation = 0
+        self.slots = {}
+        self.buffered = []
+        self.journal_records = 0
+        self.last_extras = None
+
+        self.jobs = queue.Queue()
+        self.writer = None
+        self.last_error = None
+
+    def load(self):
+        """Load the save slot; returns (counters, extras) or (None, None)"""
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                generation, names, counters, extras = decode_snapshot(f.read())
+        except (OSError, ValueError, struct.error, zlib.error):
+            return None, None
+
+        self.generation = generation
+        try:
+            with open(self.journal_path, 'rb') as f:
+                journal = f.read()
+        except OSError:
+            journal = b''
+
+        if len(journal) >= JOURNAL_HEADER.size:
+            magic, version, journal_generation = JOURNAL_HEADER.unpack_from(journal, 0)
+            if magic == JOURNAL_MAGIC and version == SAVE_VERSION and journal_generation == generation:
+                body = memoryview(journal)[JOURNAL_HEADER.size:]
+                whole = len(body) - len(body) % JOURNAL_RECORD.size
+                for slot, delta in JOURNAL_RECORD.iter_unpack(body[:whole]):
+                    if slot < len(names):
+                        counters[names[slot]] += delta
+                        self.journal_records += 1
+
+        self.last_extras = extras
+        return counters, extras
+
+    def record_delta(self, name, delta):
+        """Buffer a counter change; it reaches disk on the next commit()"""
+        slot = self.slots.get(name)
+        if slot is not None and delta:
+            self.buffered.append(JOURNAL_RECORD.pack(slot, delta))
+
+    def commit(self):
+        """Hand buffered deltas to the writer thread"""
+        if self.buffered:
+            records, self.buffered = b''.join(self.buffered), []
+            self.journal_records += len(records) // JOURNAL_RECORD.size
+            self.enqueue(('journal', records))
+
+    def needs_snapshot(self, extras):
+        """Whether the journal is long or non-counter progress changed"""
+        return self.journal_records >= self.compact_after or extras != self.last_extras
+
+    def snapshot(self, counters, extras):
+        """Compact everything into a new snapshot; counters must be the full current values"""
+        self.generation += 1
+        self.slots = {name: slot for slot, name in enumerate(counters)}
+        self.buffered = []
+        self.journal_records = 0
+        self.last_extras = extras
+        self.enqueue(('snapshot', self.generation, dict(counters), extras))
+
+    def enqueue(self, job):
+        if self.writer is None:
+            self.writer = threading.Thread(target=self.run_writer, daemon=True)
+            self.writer.start()
+        self.jobs.put(job)
+
+    def run_writer(self):
+        """Writer thread: serialize and write jobs in order"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                if job[0] == 'journal':
+                    with open(self.journal_path, 'ab') as f:
+                        f.write(job[1])
+                        f.flush()
+                        os.fsync(f.fileno())
+                else:
+                    _, generation, counters, extras = job
+                    write_atomic(self.snapshot_path, encode_snapshot(generation, counters, extras))
+                    write_atomic(self.journal_path,
+                                 JOURNAL_HEADER.pack(JOURNAL_MAGIC, SAVE_VERSION, generation))
+                self.last_error = None
+            except OSError as e:
+                self.last_error = e
+
+    def report(self):
+        return "Saves: OK" if self.last_error is None else f"Save failed: {self.last_error}"
+
+    def close(self):
+        """Flush pending work and stop the writer thread"""
+        self.commit()
+        if self.writer is not None:
+            self.jobs.put(None)
+            self.writer.join()
+            self.writer = None
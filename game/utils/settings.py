@@ -0,0 +1,136 @@
+"""Player settings: display, frame rate, detail and audio, with performance presets"""
+import json
+import os
+
+from game.constants import DATA_DIR, SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game.utils.save_system import write_atomic
+
+SETTINGS_PATH = os.path.join(DATA_DIR, 'settings.json')
+# A deployment can ship this file next to main.py (or point the variable at
+# another one) to pick the starting preset and values for its machines
+DEFAULT_SETTINGS_PATH = os.getenv(
+    'FLOKAPP_DEFAULT_SETTINGS',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'settings.default.json')
+)
+
+# Values a setting can be cycled through in the settings scene
+OPTIONS = {
+    'resolution': [(640, 480), (800, 600), (1024, 768), (1280, 960), (1600, 1200)],
+    'render_scale': [0.5, 0.75, 1.0],
+    'native_text': [False, True],
+    'fps': [30, 45, 60, 120],
+    'vsync': [False, True],
+    'particle_cap': [100, 250, 500, 1000],
+    'star_count': [25, 50, 75, 100, 150],
+    'audio_buffer': [256, 512, 1024, 2048],
+    'sample_rate': [11025, 22050, 44100]
+}
+
+# Presets only cover performance; resolution, vsync and sharp text stay as the player set them
+PRESETS = {
+    'Low': {'render_scale': 0.5, 'fps': 30, 'particle_cap': 100, 'star_count': 25, 'audio_buffer': 2048, 'sample_rate': 11025},
+    'Medium': {'render_scale': 0.75, 'fps': 60, 'particle_cap': 250, 'star_count': 50, 'audio_buffer': 1024, 'sample_rate': 22050},
+    'High': {'render_scale': 1.0, 'fps': FPS, 'particle_cap': 1000, 'star_count': 100, 'audio_buffer': 512, 'sample_rate': 22050}
+}
+PRESET_NAMES = ['Low', 'Medium', 'High']
+DEFAULT_PRESET = 'High'
+CUSTOM = 'Custom'
+
+
+def coerce(key, value):
+    """Value as the type a setting holds; raises ValueError or TypeError if it can't be"""
+    if key == 'resolution':
+        width, height = value
+        return (int(width), int(height))
+    if key in ('vsync', 'native_text'):
+        return bool(value)
+    if key == 'render_scale':
+        value = float(value)
+        if not 0 < value <= 1:
+            raise ValueError("render_scale must be in (0, 1]")
+        return value
+    value = int(value)
+    if value <= 0:
+        raise ValueError(f"{key} must be positive")
+    return value
+
+
+class Settings:
+    """Current settings, layered from a preset, the deployment's defaults and the player's file.
+
+    Values outside OPTIONS are accepted from files so a deployment can tune
+    freely; the settings scene snaps them back onto OPTIONS when cycled.
+    """
+
+    def __init__(self, path=SETTINGS_PATH):
+        self.path = path
+        self.values = {'resolution': (SCREEN_WIDTH, SCREEN_HEIGHT), 'vsync': False, 'native_text': True}
+        self.values.update(PRESETS[DEFAULT_PRESET])
+
+    @classmethod
+    def load(cls, path=SETTINGS_PATH, default_path=DEFAULT_SETTINGS_PATH):
+        """Defaults, then the deployment's file, then the player's"""
+        settings = cls(path)
+        for source in (default_path, path):
+            try:
+                with open(source, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict):
+                settings.update(data)
+        return settings
+
+    def update(self, data):
+        """Apply a dict read from a file; a 'preset' entry goes first, unknown or bad values are ignored"""
+        if data.get('preset') in PRESETS:
+            self.apply_preset(data['preset'])
+        for key, value in data.items():
+            if key in self.values:
+                try:
+                    self.values[key] = coerce(key, value)
+                except (TypeError, ValueError):
+                    pass
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __setitem__(self, key, value):
+        self.values[key] = coerce(key, value)
+
+    def apply_preset(self, name):
+        self.values.update(PRESETS[name])
+
+    @property
+    def preset(self):
+        """Name of the preset the current values match, or CUSTOM"""
+        for name in PRESET_NAMES:
+            if all(self.values[key] == value for key, value in PRESETS[name].items()):
+                return name
+        return CUSTOM
+
+    def cycle(self, key, step):
+        """Move a setting to the next or previous value in OPTIONS"""
+        options = OPTIONS[key]
+        value = self.values[key]
+        if value in options:
+            index = options.index(value) + step
+        else:
+            # Snap a hand-tuned value onto the nearest option in the direction moved
+            index = sum(1 for option in options if option < value) - (step < 0)
+        self.values[key] = options[max(0, min(len(options) - 1, index))]
+
+    def cycle_preset(self, step):
+        preset = self.preset
+        if preset == CUSTOM:
+            index = PRESET_NAMES.index(DEFAULT_PRESET)
+        else:
+            index = max(0, min(len(PRESET_NAMES) - 1, PRESET_NAMES.index(preset) + step))
+        self.apply_preset(PRESET_NAMES[index])
+
+    def save(self):
+        """Write the player's settings file"""
+        data = dict(self.values, preset=self.preset)
+        data['resolution'] = list(data['resolution'])
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        write_atomic(self.path, json.dumps(data, indent=2).encode('utf-8'))
@@ -0,0 +1,142 @@
+"""Bounded cache of pre-rendered entity sprites keyed by quantized state"""
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from game.utils.asset_cache import get_asset_cache
+from game.utils.display import can_convert
+
+# Sprites may use at most this many bytes of pixel data before old ones are evicted
+DEFAULT_BUDGET_BYTES = 16 * 1024 * 1024
+ROTATION_STEPS = 64
+PULSE_STEPS = 16
+
+_fonts = {}
+
+
+def get_font(size):
+    """Shared default font per size; building a Font is slower than a blit"""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+def quantize_angle(angle, steps=ROTATION_STEPS, period=2 * math.pi):
+    """Bucket index for an angle with the given rotational period"""
+    return int(round((angle % period) / period * steps)) % steps
+
+
+def quantize_angles(angles, steps=ROTATION_STEPS, period=2 * math.pi):
+    """quantize_angle for a whole array of angles at once"""
+    return (np.round(np.mod(angles, period) / period * steps).astype(np.int64) % steps).tolist()
+
+
+def bucket_angle(bucket, steps=ROTATION_STEPS, period=2 * math.pi):
+    """The angle a bucket is drawn at"""
+    return bucket * period / steps
+
+
+class SpriteCache:
+    """LRU of (surface, anchor) pairs with a byte budget.
+
+    get() calls build(key) on a miss, going through the baked asset cache
+    when one is set; the anchor is the pixel in the sprite that sits on the
+    entity's position. Sprites built off the main thread (while the game
+    loads) stay unconverted until convert_pending() runs on the main thread.
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.sprites = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.unconverted = []
+
+    def get(self, key, build):
+        entry = self.sprites.get(key)
+        if entry is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        assets = get_asset_cache()
+        surface, anchor = build(key) if assets is None else assets.sprite(key, build)
+        if can_convert():
+            surface = surface.convert_alpha()
+        elif pygame.display.get_surface() is not None:
+            self.unconverted.append(key)
+        entry = (surface, anchor)
+        self.sprites[key] = entry
+        self.bytes += self.size_of(surface)
+        while self.bytes > self.budget_bytes and len(self.sprites) > 1:
+            _, (old, _) = self.sprites.popitem(last=False)
+            self.bytes -= self.size_of(old)
+            self.evictions += 1
+        return entry
+
+    def convert_pending(self):
+        """Convert sprites built on another thread to the display format; call on the main thread"""
+        for key in self.unconverted:
+            entry = self.sprites.get(key)
+            if entry is not None:
+                self.sprites[key] = (entry[0].convert_alpha(), entry[1])
+        self.unconverted = []
+
+    @staticmethod
+    def size_of(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def place(self, key, build, x, y):
+        """The sprite for key and the screen rect it covers with its anchor at (x, y)"""
+        surface, (ax, ay) = self.get(key, build)
+        return surface, surface.get_rect(topleft=(int(x) - ax, int(y) - ay))
+
+    def place_many(self, keys, build, positions):
+        """place() for a list of keys and an (n, 2) array of positions; each distinct key is looked up once"""
+        entries = {}
+        for key in dict.fromkeys(keys):
+            surface, (ax, ay) = self.get(key, build)
+            entries[key] = (surface, ax, ay, surface.get_width(), surface.get_height())
+        # Truncate like int() does, so bulk and single placement agree
+        positions = positions.astype(np.int64).tolist()
+        Rect = pygame.Rect
+        return [(surface, Rect(x - ax, y - ay, width, height))
+                for (surface, ax, ay, width, height), (x, y) in zip(map(entries.__getitem__, keys), positions)]
+
+    def blit(self, screen, key, build, x, y):
+        """Draw the sprite for key with its anchor at (x, y)"""
+        surface, rect = self.place(key, build, x, y)
+        return screen.blit(surface, rect)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self.sprites.clear()
+        self.bytes = 0
+
+    def report(self):
+        return (f"Sprite cache: {self.hit_rate:.1%} hits, {len(self.sprites)} sprites, "
+                f"{self.bytes / (1024 * 1024):.1f} MB, {self.evictions} evicted")
+
+
+_sprite_cache = None
+_sprite_cache_lock = threading.Lock()
+
+
+def get_sprite_cache():
+    """The shared sprite cache"""
+    global _sprite_cache
+    if _sprite_cache is None:
+        with _sprite_cache_lock:
+            if _sprite_cache is None:
+                _sprite_cache = SpriteCache()
+    return _sprite_cache
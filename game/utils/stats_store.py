@@ -0,0 +1,116 @@
+"""Observable player stats with per-frame batched change notification"""
+from array import array
+
+# Stat name -> type. Integer stats are counters and live in a packed array.
+PLAYER_STATS = {
+    'name': str,
+    'missions_completed': int,
+    'knowledge_points': int,
+    'current_mission': dict,
+    'planets_visited': int,
+    'asteroids_scanned': int,
+    'iss_docked': int
+}
+
+
+class StatsStore:
+    """Typed stats store that reads like the old player_data dict.
+
+    Counters are stored in an array of signed 64-bit ints; other stats in a
+    dict. Writes only record the value each key had at the start of the tick;
+    flush() (once per frame) notifies subscribers of keys whose value actually
+    changed, once per key, with (key, old_value, new_value).
+    """
+
+    def __init__(self, schema=PLAYER_STATS, initial=None):
+        self.schema = dict(schema)
+        self.counter_slots = {}
+        for key, kind in self.schema.items():
+            if kind is int:
+                self.counter_slots[key] = len(self.counter_slots)
+        self.counters = array('q', bytes(8 * len(self.counter_slots)))
+        self.values = {key: None for key in self.schema if key not in self.counter_slots}
+
+        self.subscribers = {}
+        self.global_subscribers = []
+        self.pending = {}
+
+        for key, value in (initial or {}).items():
+            self[key] = value
+        self.pending.clear()
+
+    def __getitem__(self, key):
+        slot = self.counter_slots.get(key)
+        if slot is not None:
+            return self.counters[slot]
+        return self.values[key]
+
+    def __setitem__(self, key, value):
+        kind = self.schema.get(key)
+        if kind is None:
+            raise KeyError(f"Unknown stat: {key}")
+        if value is not None and not isinstance(value, kind):
+            raise TypeError(f"Stat {key} expects {kind.__name__}, got {type(value).__name__}")
+
+        if key not in self.pending:
+            self.pending[key] = self[key]
+        slot = self.counter_slots.get(key)
+        if slot is not None:
+            self.counters[slot] = value
+        else:
+            self.values[key] = value
+
+    def __contains__(self, key):
+        return key in self.schema
+
+    def __iter__(self):
+        return iter(self.schema)
+
+    def __repr__(self):
+        return f"StatsStore({self.as_dict()!r})"
+
+    def get(self, key, default=None):
+        """Dict-style read"""
+        if key not in self.schema:
+            return default
+        value = self[key]
+        return default if value is None else value
+
+    def keys(self):
+        return self.schema.keys()
+
+    def items(self):
+        return [(key, self[key]) for key in self.schema]
+
+    def as_dict(self):
+        """Plain dict copy of every stat"""
+        return dict(self.items())
+
+    def add(self, key, amount=1):
+        """Increase a counter"""
+        self[key] = self[key] + amount
+
+    def subscribe(self, key, callback):
+        """Call callback(key, old, new) at flush time when `key` changed"""
+        self.subscribers.setdefault(key, []).append(callback)
+
+    def subscribe_all(self, callback):
+        """Call callback(key, old, new) at flush time for every changed stat"""
+        self.global_subscribers.append(callback)
+
+    def flush(self):
+        """Notify subscribers of this tick's changes; returns the changed keys"""
+        if not self.pending:
+            return []
+        pending, self.pending = self.pending, {}
+        changed = []
+        for key, old in pending.items():
+            new = self[key]
+            if new == old:
+                continue
+            changed.append(key)
+            for callback in self.subscribers.get(key, ()):
+                callback(key, old, new)
+            for callback in self.global_subscribers:
+                callback(key, old, new)
+        return changed
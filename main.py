@@ -1,41 +1,176 @@
+import argparse
 import pygame
 import sys
+import time
 from game.game_manager import GameManager
-from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game.constants import FPS
+from game.audio.sound_manager import SoundManager
+from game.data.content_store import get_content_store
+from game.scenes.loading_scene import LoadingScene
+from game.utils.replay import InputRecorder, InputReplay, parse_seed
+from game.utils.sprite_cache import get_sprite_cache
+from game.utils.asset_cache import AssetCache, set_asset_cache
+from game.utils.settings import Settings
+from game.utils.display import Display
+from game.utils.loader import BootLoader
+from game.net.client import NetworkClient, parse_address
+from game.net.leaderboard import DEFAULT_LEADERBOARD_PORT
+from game.net.leaderboard_client import LeaderboardClient
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Flokapp - Space Explorer")
+    parser.add_argument('--seed', type=parse_seed, help="Seed for all random streams")
+    parser.add_argument('--record', metavar='PATH', help="Record input to a replay file")
+    parser.add_argument('--replay', metavar='PATH', help="Replay a recorded session")
+    parser.add_argument('--fast', action='store_true', help="Replay as fast as possible")
+    parser.add_argument('--connect', metavar='HOST[:PORT]', help="Join a classroom server")
+    parser.add_argument('--name', default='Space Explorer', help="Name shown to classmates")
+    parser.add_argument('--leaderboard', metavar='HOST[:PORT]', help="Report scores to a class leaderboard")
+    parser.add_argument('--perf', action='store_true', help="Print frame rate and CPU use per scene on exit")
+    return parser.parse_args(argv)
+
+# The loading scene only animates a progress bar, so it needs few frames
+LOADING_FPS = 30
+
+def load_game(display, settings, **options):
+    """Load content and sounds on a worker thread while the loading scene is shown.
+    
+    The GameManager and its scenes use fonts, which only the main thread may
+    touch, so they are built between loading-scene frames instead. Returns
+    the game manager, the loader (for its timings) and whether the window
+    was closed while loading.
+    """
+    loaded = {}
+    
+    def build_sounds():
+        loaded['sound_manager'] = SoundManager(settings['sample_rate'], settings['audio_buffer'])
+    
+    def build_game():
+        game_manager = loaded['game_manager'] = GameManager(display.canvas, settings=settings, display=display,
+                                                            sound_manager=loaded['sound_manager'],
+                                                            defer_scenes=True, **options)
+        yield from game_manager.build_scenes()
+    
+    loader = BootLoader([
+        ("Loading content", 1, get_content_store),
+        ("Generating sounds", 1, build_sounds)
+    ], [
+        ("Building scenes", 4, build_game)
+    ]).start()
+    loading_scene = LoadingScene(loader)
+    clock = pygame.time.Clock()
+    closed = False
+    while not loader.poll():
+        # Other input is dropped; there is nothing to act on it yet
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            closed = True
+        loading_scene.render(display.canvas)
+        display.present(None)
+        clock.tick(LOADING_FPS)
+    game_manager = loaded['game_manager']
+    game_manager.convert_surfaces()
+    return game_manager, loader, closed
+
+def main(argv=None):
     """Main entry point for Flokapp"""
+    boot_started = time.perf_counter()
+    args = parse_args(argv)
+    replay = InputReplay.load(args.replay) if args.replay else None
+    seed = replay.seed if replay else args.seed
+
+    settings = Settings.load()
+    # Sounds and sprites generated on an earlier run load from disk instead
+    set_asset_cache(AssetCache())
+    # Open the mixer with the player's audio settings instead of pygame's defaults
+    pygame.mixer.pre_init(settings['sample_rate'], -16, 2, settings['audio_buffer'])
     pygame.init()
-    
+
     # Set up display
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Flokapp - Space Explorer")
+    display = Display()
+    display.open(settings['resolution'], settings['vsync'])
     clock = pygame.time.Clock()
-    
-    # Initialize game manager
-    game_manager = GameManager(screen)
-    
+
+    network_client = None
+    if args.connect:
+        host, port = parse_address(args.connect)
+        network_client = NetworkClient(host, port, args.name).start()
+    leaderboard_client = None
+    if args.leaderboard:
+        host, port = parse_address(args.leaderboard, DEFAULT_LEADERBOARD_PORT)
+        leaderboard_client = LeaderboardClient(host, port, args.name).start()
+
+    # Initialize game manager behind the loading scene
+    game_manager, loader, closed = load_game(display, settings, seed=seed, persist=not (args.record or args.replay),
+                                             network_client=network_client, leaderboard_client=leaderboard_client)
+    recorder = InputRecorder(args.record, game_manager.rng.seed) if args.record else None
+    scheduler = game_manager.frame_scheduler
+    if not replay:
+        game_manager.sound_manager.start_music()
+    # Quality changes alter particle bursts, so recordings and replays keep one tier
+    game_manager.quality.enabled = not (args.record or args.replay)
+
     # Main game loop
-    running = True
+    running = not closed
+    frame = 0
+    interactive_at = None
+    started = time.perf_counter()
     while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
-        
+        if replay:
+            if frame >= replay.frame_count:
+                break
+            clock.tick(0 if args.fast else FPS)
+            dt_ms = replay.frame_dt(frame)
+            events = replay.events_for(frame)
+            # Closing the window still works during a replay
+            if pygame.event.get(pygame.QUIT):
+                running = False
+            pygame.event.pump()
+        else:
+            # Waits longer between frames while the scene is idle
+            dt_ms, events = scheduler.wait()
+            if recorder:
+                recorder.record_frame(frame, dt_ms, events)
+        dt = dt_ms / 1000.0  # Delta time in seconds
+        work_started = time.perf_counter()
+
         # Handle events
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             else:
                 game_manager.handle_event(event)
-        
+
         # Update game state
         game_manager.update(dt)
-        
+
         # Render everything
         game_manager.render()
-        pygame.display.flip()
-    
+        game_manager.present()
+        game_manager.finish_frame(bool(events), (time.perf_counter() - work_started) * 1000, dt_ms)
+        if interactive_at is None:
+            interactive_at = time.perf_counter() - boot_started
+        frame += 1
+
+    if recorder:
+        recorder.close()
+    if replay:
+        elapsed = time.perf_counter() - started
+        print(f"Replayed {frame} frames (seed {seed}) in {elapsed:.2f}s, "
+              f"{elapsed * 1000 / max(1, frame):.2f} ms/frame")
+        print(get_sprite_cache().report())
+        print(game_manager.renderer.report())
+    if args.perf or replay:
+        for line in scheduler.report():
+            print(line)
+    if args.perf and interactive_at is not None:
+        print(f"Interactive after {interactive_at * 1000:.0f} ms")
+        for line in loader.report():
+            print(line)
+
+    game_manager.shutdown()
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
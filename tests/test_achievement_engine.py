@@ -0,0 +1,22 @@
+"""Achievement engine regression tests"""
+from game.data.achievements import ACHIEVEMENTS
+from game.utils.achievement_engine import AchievementEngine
+
+
+def unlocked_names(achievements):
+    return [achievement['name'] for achievement in achievements]
+
+
+def test_loaded_total_is_not_a_gain():
+    engine = AchievementEngine(ACHIEVEMENTS)
+    unlocked = unlocked_names(engine.load_stats({'knowledge_points': 1000, 'planets_visited': 0}))
+    assert 'Knowledge Seeker' in unlocked
+    assert 'Quick Learner' not in unlocked
+    assert engine.gain('knowledge_points', 60, 0.0) == 0
+
+
+def test_gain_after_load_is_measured_from_loaded_value():
+    engine = AchievementEngine(ACHIEVEMENTS)
+    engine.load_stats({'knowledge_points': 1000})
+    assert 'Quick Learner' not in unlocked_names(engine.on_stat_changed('knowledge_points', 1100, 10.0))
+    assert 'Quick Learner' in unlocked_names(engine.on_stat_changed('knowledge_points', 1250, 20.0))
@@ -0,0 +1,79 @@
+"""Asset cache regression tests"""
+import os
+
+import pygame
+
+from game.utils.asset_cache import AssetCache, code_version, not_baked
+from game.utils.sprite_cache import get_font
+
+
+def make_module(source):
+    """Functions defined as if they lived in a game module"""
+    namespace = {'__name__': 'game.fake_generators'}
+    exec(source, namespace)
+    return namespace
+
+
+def test_version_follows_callees_and_constants():
+    base = make_module("COLOR = (255, 255, 255)\ndef helper():\n    return COLOR\ndef build(key):\n    return helper()\n")
+    same = make_module("COLOR = (255, 255, 255)\ndef helper():\n    return COLOR\ndef build(key):\n    return helper()\n")
+    callee = make_module("COLOR = (255, 255, 255)\ndef helper():\n    return COLOR[0]\ndef build(key):\n    return helper()\n")
+    constant = make_module("COLOR = (255, 255, 0)\ndef helper():\n    return COLOR\ndef build(key):\n    return helper()\n")
+    version = code_version(base['build'])
+    assert code_version(same['build']) == version
+    assert code_version(callee['build']) != version
+    assert code_version(constant['build']) != version
+
+
+def test_version_follows_methods_reached_through_self():
+    source = "class Generator:\n    def scale(self):\n        return %d\n    def build(self):\n        return self.scale()\n"
+    one, two = make_module(source % 1), make_module(source % 2)
+    assert code_version(one['Generator'].build) != code_version(two['Generator'].build)
+
+
+def test_version_ignores_runtime_caches():
+    pygame.font.init()
+    from game.scenes.game_scene import build_scan_range_sprite
+    from game.utils import sprite_cache
+    version = code_version(sprite_cache.get_font)
+    get_font(17)
+    assert code_version(sprite_cache.get_font) == version
+    assert code_version(build_scan_range_sprite) == code_version(build_scan_range_sprite)
+
+
+def test_unbaked_sprites_stay_off_disk(tmp_path):
+    @not_baked
+    def build_named(key):
+        return pygame.Surface((4, 4), pygame.SRCALPHA), (2, 2)
+
+    cache = AssetCache(str(tmp_path))
+    stale = tmp_path / f"sprites-{build_named.__module__}.{build_named.__qualname__}-old.json"
+    stale.write_text('{}')
+    surface, anchor = cache.sprite(('name', 'Ada'), build_named)
+    cache.flush()
+    assert anchor == (2, 2)
+    assert os.listdir(tmp_path) == []
+
+
+def test_sprites_wait_for_flush_and_are_appended(tmp_path):
+    def build_square(key):
+        surface = pygame.Surface((key, key), pygame.SRCALPHA)
+        surface.fill((key % 256, 0, 0, 255))
+        return surface, (0, 0)
+
+    cache = AssetCache(str(tmp_path))
+    for size in range(8, 200, 8):
+        cache.sprite(size, build_square)
+    assert os.listdir(tmp_path) == []
+    cache.flush()
+    pack = cache.packs[build_square]
+    blob_size, first_entry = os.path.getsize(pack.blob_path), pack.index[repr(8)]
+
+    later = AssetCache(str(tmp_path))
+    later.sprite(256, build_square)
+    later.flush()
+    grown = later.packs[build_square]
+    assert grown.index[repr(8)] == first_entry
+    assert os.path.getsize(grown.blob_path) == blob_size + 256 * 256 * 4
+    surface, _ = AssetCache(str(tmp_path)).sprite(16, build_square)
+    assert surface.get_size() == (16, 16) and surface.get_at((0, 0)) == (16, 0, 0, 255)
@@ -0,0 +1,22 @@
+"""Content store regression tests"""
+from game.data.content_store import ContentStore
+
+FIRST = {'question': 'Which planet is the largest?', 'options': ['Jupiter', 'Mars'], 'correct': 0}
+SECOND = {'question': 'Which planet is closest to the Sun?', 'options': ['Venus', 'Mercury'], 'correct': 1}
+
+
+def generated_ids(questions):
+    store = ContentStore()
+    for question in questions:
+        store.add_question('exploration', question)
+    return {q['question']: q['id'] for q in store.get_questions('exploration')}
+
+
+def test_generated_ids_do_not_depend_on_pack_order():
+    assert generated_ids([FIRST, SECOND]) == generated_ids([SECOND, FIRST])
+
+
+def test_explicit_ids_are_kept():
+    store = ContentStore()
+    store.add_question('exploration', dict(FIRST, id='exploration-largest'))
+    assert store.get_question('exploration-largest')['question'] == FIRST['question']
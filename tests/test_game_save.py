@@ -0,0 +1,39 @@
+"""Saved exploration progress regression tests"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+from game.constants import PLAYING, SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+@pytest.fixture(scope='module')
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.quit()
+
+
+def make_game(screen, seed):
+    from game.game_manager import GameManager
+    return GameManager(screen, seed=seed, persist=False)
+
+
+def test_scanned_asteroids_follow_the_saved_world_seed(screen):
+    first = make_game(screen, 1)
+    first.scenes[PLAYING].asteroids[0].scanned = True
+    extras = first.get_save_extras()
+    assert extras['world_seed'] == 1
+    state = extras['scenes'][PLAYING]
+
+    # A save from another layout doesn't mark unrelated asteroids
+    other = make_game(screen, 2).scenes[PLAYING]
+    other.load_save_state(state)
+    assert not any(asteroid.scanned for asteroid in other.asteroids)
+
+    same = make_game(screen, 1).scenes[PLAYING]
+    same.load_save_state(state)
+    assert [asteroid.scanned for asteroid in same.asteroids][:1] == [True]
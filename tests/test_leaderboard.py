@@ -0,0 +1,45 @@
+"""Leaderboard service regression tests"""
+from game.net.leaderboard import LeaderboardService
+from game.net.leaderboard_client import load_player_id
+
+
+def test_players_with_the_same_name_keep_separate_scores(tmp_path):
+    service = LeaderboardService(path=str(tmp_path / 'leaderboard.json'))
+    service.handle_message({'type': 'score', 'id': 'a', 'name': 'Space Explorer', 'score': 300})
+    service.handle_message({'type': 'score', 'id': 'b', 'name': 'Space Explorer', 'score': 100})
+    board = service.handle_message({'type': 'query', 'id': 'b', 'k': 10})
+    assert board['top'] == [['a', 'Space Explorer', 300], ['b', 'Space Explorer', 100]]
+    assert (board['rank'], board['score'], board['total']) == (2, 100, 2)
+
+
+def test_snapshot_keeps_names_and_reads_name_keyed_boards(tmp_path):
+    path = str(tmp_path / 'leaderboard.json')
+    service = LeaderboardService(path=path)
+    service.handle_message({'type': 'score', 'id': 'a', 'name': 'Ada', 'score': 50})
+    service.write_snapshot(dict(service.index.scores), dict(service.names))
+    restored = LeaderboardService(path=path)
+    restored.load()
+    assert restored.handle_message({'type': 'query', 'id': 'a'})['top'] == [['a', 'Ada', 50]]
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"version": 1, "scores": {"Grace": 70}}')
+    old = LeaderboardService(path=path)
+    old.load()
+    assert old.handle_message({'type': 'query', 'id': 'Grace'})['top'] == [['Grace', 'Grace', 70]]
+
+
+def test_malformed_fields_are_ignored(tmp_path):
+    service = LeaderboardService(path=str(tmp_path / 'leaderboard.json'))
+    service.handle_message({'type': 'score', 'id': 'a', 'name': 'Ada', 'score': 50})
+    for score in (None, [1], 'lots', float('inf')):
+        assert service.handle_message({'type': 'score', 'id': 'a', 'score': score}) is None
+    for k in (None, {'k': 1}):
+        assert service.handle_message({'type': 'query', 'id': 'a', 'k': k}) is None
+    assert service.handle_message({'type': 'query', 'id': 'a', 'k': -3})['top'] == []
+    assert service.handle_message({'type': 'query', 'id': 'a'})['top'] == [['a', 'Ada', 50]]
+
+
+def test_player_id_is_stable_per_install(tmp_path):
+    path = str(tmp_path / 'player_id')
+    assert load_player_id(path) == load_player_id(path)
+    assert load_player_id(path) != load_player_id(str(tmp_path / 'other' / 'player_id'))
@@ -0,0 +1,27 @@
+"""Boot loader regression tests"""
+import threading
+
+from game.utils.loader import BootLoader
+
+
+def test_main_steps_run_on_the_polling_thread_in_chunks():
+    threads = []
+
+    def background():
+        threads.append(('background', threading.current_thread()))
+
+    def build():
+        for i in range(3):
+            threads.append(('main', threading.current_thread()))
+            yield (i + 1) / 3
+
+    loader = BootLoader([("Loading", 1, background)], [("Building", 3, build)]).start()
+    loader.worker.join()
+    fractions = []
+    while not loader.poll():
+        fractions.append(loader.fraction)
+    assert fractions == sorted(fractions) and len(fractions) >= 3
+    assert loader.fraction == 1.0
+    assert [label for label, _ in loader.timings] == ["Loading", "Building"]
+    assert threads[0][1] is not threading.main_thread()
+    assert all(thread is threading.main_thread() for kind, thread in threads if kind == 'main')
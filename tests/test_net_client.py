@@ -0,0 +1,25 @@
+"""Network client regression tests"""
+import socket
+import threading
+
+from game.net.client import NetworkClient
+from game.net.protocol import MAX_MESSAGE_BYTES
+
+
+def test_oversized_line_is_recorded_as_an_error():
+    server = socket.create_server(('127.0.0.1', 0))
+    port = server.getsockname()[1]
+
+    def serve():
+        connection, _ = server.accept()
+        with connection:
+            connection.sendall(b'x' * (MAX_MESSAGE_BYTES * 2) + b'\n')
+            connection.recv(1024)
+
+    threading.Thread(target=serve, daemon=True).start()
+    client = NetworkClient('127.0.0.1', port).start()
+    client.thread.join(5)
+    server.close()
+    assert not client.thread.is_alive()
+    assert client.error
+    assert not client.connected
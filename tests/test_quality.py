@@ -0,0 +1,33 @@
+"""Quality governor regression tests"""
+import pytest
+
+from game.utils.quality import HIGH, UPSHIFT_HOLD, WINDOW_FRAMES, QualityGovernor
+
+
+def frames_until_upshift(budget_ms, elapsed_ms):
+    governor = QualityGovernor(tier=HIGH - 1, budget_ms=budget_ms)
+    frames = 0
+    while governor.tier != HIGH:
+        governor.record(1.0, elapsed_ms)
+        frames += 1
+    return frames
+
+
+@pytest.mark.parametrize('budget_ms, elapsed_ms', [(1000 / 60, 1000 / 60), (1000 / 30, 1000 / 30), (1000 / 60, 100.0)])
+def test_upshift_hold_is_measured_in_time(budget_ms, elapsed_ms):
+    frames = frames_until_upshift(budget_ms, elapsed_ms)
+    held_ms = (frames - WINDOW_FRAMES + 1) * elapsed_ms
+    # Within a frame either way of the hold, whatever the frame rate
+    assert abs(held_ms - UPSHIFT_HOLD * 1000) <= 2 * elapsed_ms
+
+
+def test_flap_check_uses_elapsed_time():
+    governor = QualityGovernor(tier=HIGH - 1, budget_ms=1000 / 30)
+    governor.set_tier(HIGH)
+    # Goes over budget about 4 s after the step up at 30 fps: past the 3 s hold, so it isn't doubled
+    for _ in range(100):
+        governor.record(1.0, 1000 / 30)
+    while governor.tier == HIGH:
+        governor.record(100.0, 1000 / 30)
+    assert governor.tier == HIGH - 1
+    assert governor.upshift_hold == UPSHIFT_HOLD
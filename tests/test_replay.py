@@ -0,0 +1,21 @@
+"""Replay file regression tests"""
+import argparse
+
+import pytest
+
+from game.utils.replay import InputRecorder, InputReplay, parse_seed
+
+
+@pytest.mark.parametrize('seed', [-5, 0, 2 ** 63 - 1, -2 ** 63])
+def test_seed_round_trips(tmp_path, seed):
+    path = str(tmp_path / 'session.rec')
+    recorder = InputRecorder(path, seed)
+    recorder.record_frame(0, 16, [])
+    recorder.close()
+    assert InputReplay.load(path).seed == seed
+
+
+def test_seed_outside_the_header_is_rejected():
+    assert parse_seed('-42') == -42
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_seed(str(2 ** 63))
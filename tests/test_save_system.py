@@ -0,0 +1,22 @@
+"""Save system regression tests"""
+from game.utils.save_system import SaveSystem
+
+
+def test_failed_write_is_recorded_not_printed(tmp_path, capsys):
+    blocker = tmp_path / 'saves'
+    blocker.write_text('not a directory')
+    saves = SaveSystem(str(blocker))
+    saves.snapshot({'knowledge_points': 10}, {})
+    saves.close()
+    assert saves.last_error is not None
+    assert saves.report().startswith("Save failed")
+    assert capsys.readouterr().out == ''
+
+
+def test_successful_write_clears_the_error(tmp_path):
+    saves = SaveSystem(str(tmp_path / 'saves'))
+    saves.last_error = OSError('disk full')
+    saves.snapshot({'knowledge_points': 10}, {})
+    saves.close()
+    assert saves.last_error is None
+    assert SaveSystem(str(tmp_path / 'saves')).load()[0] == {'knowledge_points': 10}
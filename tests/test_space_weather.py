@@ -0,0 +1,39 @@
+"""Space weather timeline regression tests"""
+from game.data import space_weather
+from game.data.space_weather import CMETimeline
+
+CME = {'activityID': 'CME-1', 'startTime': '2024-01-03T14:09Z', 'cmeAnalyses': [{'speed': 1000}]}
+
+
+def test_failed_window_is_fetched_again(monkeypatch):
+    replies = [None, [CME]]
+    monkeypatch.setattr(space_weather.NASAAPI, 'get_space_weather', lambda start, end: replies.pop(0))
+    timeline = CMETimeline()
+    assert timeline.fetch_window('2024-01-01', '2024-01-30') is None
+    assert timeline.fetched_windows == []
+    assert timeline.time_span() is None
+    assert timeline.fetch_window('2024-01-01', '2024-01-30') == 1
+    assert timeline.fetched_windows == [('2024-01-01', '2024-01-30')]
+    assert timeline.time_span() is not None
+
+
+def test_empty_window_is_marked_fetched(monkeypatch):
+    monkeypatch.setattr(space_weather.NASAAPI, 'get_space_weather', lambda start, end: [])
+    timeline = CMETimeline()
+    assert timeline.fetch_window('2024-01-01', '2024-01-30') == 0
+    assert timeline.fetched_windows == [('2024-01-01', '2024-01-30')]
+
+
+def test_out_of_order_batches_stay_sorted():
+    def cme(day, speed):
+        return {'activityID': f'CME-{day}', 'startTime': f'2024-01-{day:02d}T00:00Z',
+                'cmeAnalyses': [{'speed': speed}]}
+
+    timeline = CMETimeline()
+    assert timeline.ingest([cme(10, 1000), cme(20, 1000)]) == 2
+    assert timeline.ingest([cme(25, 1000), cme(5, 300), cme(15, 1000), cme(10, 1000)]) == 3
+    assert [e.activity_id for e in timeline.events] == ['CME-5', 'CME-10', 'CME-15', 'CME-20', 'CME-25']
+    assert timeline.starts == sorted(timeline.starts)
+    slow = timeline.events[0]
+    assert timeline.max_duration == slow.arrival - slow.start
+    assert slow in timeline.active_at(slow.arrival - 1)